@@ -1,15 +1,19 @@
 import os
 import pytest
-import tempfile
-import uuid
-import shutil
-from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from selenium.webdriver.edge.service import Service as EdgeService
-import time
-import shutil as sh
+
+try:
+    import pytest_html
+except Exception:
+    pytest_html = None
+
+from utilis import actions, artifact_store, command_stats, driver_service, fast_fill, impact, logger, pacing, read_cache, run_stats, screenshots, tracing, visual, wait_stats, waits, xdist_lpt
+from utilis.auth import SessionLogin
+from utilis.local_site.server import LocalSauceDemo
+from utilis.drivers import build_driver, configure_profiles, remove_profile_templates
+from utilis.driver_pool import DriverPool, quit_driver
+from utilis.prewarm import DriverPrewarmer
+
+log = logger.get_logger(__name__)
 
 # ----------------------------------------------------------
 #  DEFAULT BROWSER – changed to EDGE
@@ -24,144 +28,535 @@ def pytest_addoption(parser):
         default=DEFAULT_BROWSER,                           # ← CHANGED
         help=f"Browser to run tests: chrome, edge (default: {DEFAULT_BROWSER})"
     )
+    parser.addoption(
+        "--driver-mode",
+        action="store",
+        default=os.getenv("DRIVER_MODE", "fresh").lower(),
+        choices=("fresh", "pool", "prewarm"),
+        help="fresh: new browser per test (default); "
+             "pool: reuse running browsers per worker and reset state between tests; "
+             "prewarm: fresh browser per test, launched in the background ahead of time"
+    )
+    parser.addoption(
+        "--pool-max-uses",
+        action="store",
+        type=int,
+        default=int(os.getenv("POOL_MAX_USES", "20")),
+        help="Recycle a pooled browser after this many tests (default: 20)"
+    )
+    parser.addoption(
+        "--prewarm-depth",
+        action="store",
+        type=int,
+        default=int(os.getenv("PREWARM_DEPTH", "1")),
+        help="Number of browsers launched ahead of the running test in prewarm mode (default: 1)"
+    )
+    parser.addoption(
+        "--pace",
+        action="store",
+        default=os.getenv("PACE", "demo").lower(),
+        choices=pacing.MODES,
+        help="ci: no pauses; demo: 0.5s before/after each test (default); "
+             "step: demo pauses plus a pause around every page action"
+    )
+    parser.addoption(
+        "--profile-template",
+        action="store_true",
+        default=os.getenv("PROFILE_TEMPLATE", "false").lower() in {"1", "true", "yes", "on"},
+        help="Seed one browser profile per run and start every session from a clone of it"
+    )
+    parser.addoption(
+        "--profile-root",
+        action="store",
+        default=os.getenv("PROFILE_ROOT"),
+        help="Directory for browser profiles (default with --profile-template: /dev/shm if writable)"
+    )
+    parser.addoption(
+        "--driver-service",
+        action="store",
+        default=os.getenv("DRIVER_SERVICE", "per-session").lower(),
+        choices=driver_service.MODES,
+        help="per-session: new chromedriver/msedgedriver per browser (default); "
+             "shared: one driver process per worker, restarted only if it dies"
+    )
+    parser.addoption(
+        "--screenshots",
+        action="store",
+        default=os.getenv("SCREENSHOTS", "on-failure").lower(),
+        choices=screenshots.POLICIES,
+        help="on-failure: keep screenshots of failed tests only (default); always: keep all; never: take none"
+    )
+    parser.addoption(
+        "--artifact-dir",
+        action="store",
+        default=os.getenv("ARTIFACT_DIR", artifact_store.DEFAULT_ROOT),
+        help="Content-addressed store for screenshots (default: artifacts)"
+    )
+    parser.addoption(
+        "--artifact-format",
+        action="store",
+        default=os.getenv("ARTIFACT_FORMAT", "png").lower(),
+        choices=artifact_store.FORMATS,
+        help="Re-encode stored screenshots (webp/jpeg need Pillow; default: png as captured)"
+    )
+    parser.addoption(
+        "--artifact-quality",
+        action="store",
+        type=int,
+        default=int(os.getenv("ARTIFACT_QUALITY", "80")),
+        help="Quality for --artifact-format webp/jpeg (default: 80)"
+    )
+    parser.addoption(
+        "--artifact-keep-runs",
+        action="store",
+        type=int,
+        default=int(os.getenv("ARTIFACT_KEEP_RUNS", str(artifact_store.DEFAULT_KEEP_RUNS))),
+        help="Retention: keep artifacts of the newest N runs (default: 20)"
+    )
+    parser.addoption(
+        "--artifact-max-mb",
+        action="store",
+        type=float,
+        default=float(os.environ["ARTIFACT_MAX_MB"]) if os.getenv("ARTIFACT_MAX_MB") else None,
+        help="Retention: drop the oldest runs while the store is larger than this"
+    )
+    parser.addoption(
+        "--command-stats-json",
+        action="store",
+        default=os.getenv("COMMAND_STATS_JSON", "reports/command_stats.json"),
+        help="Per-test WebDriver command counts/times, written at the end of the run"
+    )
+    parser.addoption(
+        "--lpt",
+        action="store_true",
+        default=os.getenv("LPT", "false").lower() in {"1", "true", "yes", "on"},
+        help="With -n: schedule test classes longest-first using the recorded durations"
+    )
+    parser.addoption(
+        "--durations-file",
+        action="store",
+        default=os.getenv("DURATIONS_FILE", ".test_durations.json"),
+        help="History of per-test durations, updated after every run (default: .test_durations.json)"
+    )
+    parser.addoption(
+        "--impact",
+        action="store",
+        default=os.getenv("IMPACT", "off").lower(),
+        choices=("on", "off"),
+        help="on: skip tests whose pages/utilis/data inputs and run settings are unchanged since "
+             "they last passed; off: run everything (default)"
+    )
+    parser.addoption(
+        "--read-cache",
+        action="store",
+        default=os.getenv("READ_CACHE", "on").lower(),
+        choices=("on", "off"),
+        help="on: page-object getters reuse their last result until the page changes (default)"
+    )
+    parser.addoption(
+        "--waits",
+        action="store",
+        default=os.getenv("WAITS", "event").lower(),
+        choices=waits.MODES,
+        help="event: page-object waits return on the DOM/URL change that satisfies them (default); "
+             "poll: classic WebDriverWait polling every 0.5s"
+    )
+    parser.addoption(
+        "--action-cache",
+        action="store",
+        default=os.getenv("ACTION_CACHE", "on").lower(),
+        choices=("on", "off"),
+        help="on: fragile clicks/selects try the strategy that worked last time first (default)"
+    )
+    parser.addoption(
+        "--action-cache-file",
+        action="store",
+        default=os.getenv("ACTION_CACHE_FILE", ".action_strategies.json"),
+        help="Learned click/select strategies (default: .action_strategies.json)"
+    )
+    parser.addoption(
+        "--fast-fill",
+        action="store_true",
+        default=os.getenv("FAST_FILL", "false").lower() in {"1", "true", "yes", "on"},
+        help="Set text fields with one script (native setter + input/change events) instead of keystrokes"
+    )
+    parser.addoption(
+        "--adaptive-timeouts",
+        action="store_true",
+        default=os.getenv("ADAPTIVE_TIMEOUTS", "false").lower() in {"1", "true", "yes", "on"},
+        help="Shorten page-object wait timeouts to p95 x 3 of their recorded durations"
+    )
+    parser.addoption(
+        "--wait-telemetry",
+        action="store",
+        default=os.getenv("WAIT_TELEMETRY", ".wait_telemetry"),
+        help="Directory of the recorded wait durations (default: .wait_telemetry)"
+    )
+    parser.addoption(
+        "--timeline",
+        action="store_true",
+        default=os.getenv("TIMELINE", "false").lower() in {"1", "true", "yes", "on"},
+        help="Record a Chrome Trace Event timeline (fixtures, page methods, waits, WebDriver commands)"
+    )
+    parser.addoption(
+        "--timeline-dir",
+        action="store",
+        default=os.getenv("TIMELINE_DIR", "reports/traces"),
+        help="Directory of the traces, one folder per run (default: reports/traces)"
+    )
+    parser.addoption(
+        "--log-verbosity",
+        action="store",
+        default=os.getenv("LOG_VERBOSITY", "steps").lower(),
+        choices=tuple(logger.VERBOSITY),
+        help="quiet: warnings and errors (CI) | steps: page-level steps (default) | "
+             "chatty: every element read, click and wait"
+    )
+    parser.addoption(
+        "--log-dir",
+        action="store",
+        default=os.getenv("LOG_DIR", logger.LOG_DIR),
+        help="Directory of the JSON-lines logs, one file per xdist worker (default: reports/logs)"
+    )
+    parser.addoption(
+        "--log-max-mb",
+        action="store",
+        type=float,
+        default=float(os.getenv("LOG_MAX_MB", "10")),
+        help="Rotate a worker's log file at this size (default: 10)"
+    )
+    parser.addoption(
+        "--log-backups",
+        action="store",
+        type=int,
+        default=int(os.getenv("LOG_BACKUPS", "3")),
+        help="Rotated log files kept per worker (default: 3)"
+    )
+    parser.addoption(
+        "--visual",
+        action="store",
+        default=os.getenv("VISUAL", "off").lower(),
+        choices=visual.MODES,
+        help="Visual baselines of the page objects: "
+             "off (default) | check: compare right away | "
+             "batch: compare the whole run at the end, in a process pool | update: rewrite the baselines"
+    )
+    parser.addoption(
+        "--visual-baselines",
+        action="store",
+        default=os.getenv("VISUAL_BASELINES", "visual_baselines"),
+        help="Directory of the baseline screenshots (default: visual_baselines)"
+    )
+    parser.addoption(
+        "--visual-dir",
+        action="store",
+        default=os.getenv("VISUAL_DIR", "reports/visual"),
+        help="Actual and diff images of visual mismatches, plus results.json (default: reports/visual)"
+    )
+    parser.addoption(
+        "--visual-processes",
+        action="store",
+        type=int,
+        default=int(os.getenv("VISUAL_PROCESSES", "0")),
+        help="Processes comparing a batch (default 0: one per CPU)"
+    )
 
-# ---------- helpers ----------
-def _get_edge_driver_path():
-    """
-    Look for msedgedriver.exe under the PROJECT ROOT (this conftest.py's directory),
-    and a few common locations. This matches where you placed the file:
-    <project>/drivers/edgedriver_win64/msedgedriver.exe
-    """
-    # ✅ Point to the project root (where this conftest.py lives)
-    project_root = Path(__file__).parent
-
-    possible_paths = [
-        project_root / "drivers" / "edgedriver_win64" / "msedgedriver.exe",
-        project_root / "drivers" / "msedgedriver.exe",
-        Path("C:/WebDrivers/msedgedriver.exe"),
-        Path.home() / "WebDrivers" / "msedgedriver.exe",
-        Path("msedgedriver.exe"),
-    ]
-
-    path_driver = sh.which("msedgedriver")
-    if path_driver:
-        print(f"✓ Found Edge driver in PATH: {path_driver}")
-        return path_driver
-
-    for path in possible_paths:
-        if path.exists() and path.is_file():
-            print(f"✓ Found Edge driver at: {path}")
-            return str(path)
-
-    print("✗ Edge driver not found. Searched locations:")
-    for path in possible_paths:
-        status = "EXISTS" if path.exists() else "NOT FOUND"
-        print(f"  [{status}] {path}")
-    return None
-
-def _build_chrome(headless: bool) -> webdriver.Chrome:
-    options = ChromeOptions()
-    profile = tempfile.mkdtemp(prefix=f"chrome_{uuid.uuid4().hex}_")
-    options.add_argument(f"--user-data-dir={profile}")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1440,900")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option("useAutomationExtension", False)
-    if headless:
-        options.add_argument("--headless=new")
-
-    driver = webdriver.Chrome(options=options)
-    # attach profile so the fixture can clean it up after the test
-    driver._tmp_profile_dir = profile
-    return driver
+def pytest_configure(config):
+    logger.configure(
+        config.getoption("--log-verbosity"),
+        log_dir=config.rootpath / config.getoption("--log-dir"),
+        worker=getattr(config, "workerinput", {}).get("workerid", "main"),
+        max_mb=config.getoption("--log-max-mb"),
+        backups=config.getoption("--log-backups"),
+    )
+    pacing.configure(config.getoption("--pace"))
+    read_cache.configure(config.getoption("--read-cache") == "on")
+    waits.configure(config.getoption("--waits"))
+    fast_fill.configure(config.getoption("--fast-fill"))
+    screenshots.configure(config.getoption("--screenshots"))
+    workerinput = getattr(config, "workerinput", {})
+    artifact_store.configure(
+        config.rootpath / config.getoption("--artifact-dir"),
+        run=workerinput.get("artifact_run") or artifact_store.new_run_id(),
+        worker=workerinput.get("workerid", "main"),
+        fmt=config.getoption("--artifact-format"),
+        quality=config.getoption("--artifact-quality"),
+    )
+    tracing.configure(
+        config.getoption("--timeline"),
+        config.rootpath / config.getoption("--timeline-dir"),
+        run=artifact_store.current_run(),
+        worker=workerinput.get("workerid", "main"),
+    )
+    actions.configure(
+        config.rootpath / config.getoption("--action-cache-file"),
+        enabled=config.getoption("--action-cache") == "on",
+    )
+    wait_stats.configure(
+        config.rootpath / config.getoption("--wait-telemetry"),
+        adaptive=config.getoption("--adaptive-timeouts"),
+    )
+    driver_service.configure(config.getoption("--driver-service"))
+    visual.configure(
+        config.getoption("--visual"),
+        baselines=config.rootpath / config.getoption("--visual-baselines"),
+        out=config.rootpath / config.getoption("--visual-dir"),
+        processes=config.getoption("--visual-processes"),
+    )
+    configure_profiles(
+        root=config.getoption("--profile-root"),
+        template=config.getoption("--profile-template"),
+    )
+    xdist_lpt.register(
+        config,
+        path=str(config.rootpath / config.getoption("--durations-file")),
+        enabled=config.getoption("--lpt"),
+    )
+    impact.register(config, enabled=config.getoption("--impact") == "on")
 
-def _build_edge(headless: bool) -> webdriver.Edge:
-    options = EdgeOptions()
-    profile = tempfile.mkdtemp(prefix=f"edge_{uuid.uuid4().hex}_")
-    options.add_argument(f"--user-data-dir={profile}")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1440,900")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option("useAutomationExtension", False)
-    if headless:
-        options.add_argument("--headless=new")
-
-    driver_path = _get_edge_driver_path()
-    if driver_path:
-        print(f"→ Using Edge driver from: {driver_path}")
-        service = EdgeService(executable_path=driver_path)
-        driver = webdriver.Edge(service=service, options=options)
-    else:
-        project_root = Path(__file__).parent
-        error_msg = f"""
-╔════════════════════════════════════════════════════════════════╗
-║                   Edge Driver Not Found!                       ║
-╚════════════════════════════════════════════════════════════════╝
-The driver should be at:
-  {project_root / 'drivers' / 'edgedriver_win64' / 'msedgedriver.exe'}
-If the file exists but wasn't found, try:
-1. Move msedgedriver.exe directly to:
-   {project_root / 'drivers' / 'msedgedriver.exe'}
-2. Or place it on PATH and retry.
-Your Edge version: (example) 141.0.3537.92
-Driver download: https://msedgedriver.azureedge.net/141.0.3537.92/edgedriver_win64.zip
-        """
-        raise FileNotFoundError(error_msg)
-
-    # attach profile so the fixture can clean it up after the test
-    driver._tmp_profile_dir = profile
-    return driver
+def pytest_unconfigure(config):
+    remove_profile_templates()
+    driver_service.stop_all()
+    logger.stop()
 
 # ---------- fixtures ----------
 @pytest.fixture(scope="session")
-def base_url() -> str:
-    return os.getenv("BASE_URL", "https://www.saucedemo.com")
+def base_url(request) -> str:
+    """
+    BASE_URL env var (default: the public Sauce Demo).
+    BASE_URL=local starts the bundled offline stand-in for this worker.
+    """
+    url = os.getenv("BASE_URL", "https://www.saucedemo.com")
+    if url.lower() == "local":
+        return request.getfixturevalue("local_site").url
+    return url
+
+@pytest.fixture(scope="session")
+def local_site():
+    """
+    Offline Sauce Demo (utilis/local_site) on a free port, configured through
+    LOCAL_CATALOG_SIZE, LOCAL_LATENCY, LOCAL_JITTER_MS, LOCAL_GLITCH_MS, LOCAL_SEED.
+    """
+    site = LocalSauceDemo.from_env().start()
+    yield site
+    site.stop()
 
 @pytest.fixture(scope="session")
 def headless() -> bool:
     return os.getenv("HEADLESS", "false").lower() in {"1", "true", "yes", "on"}
 
+@pytest.fixture(scope="session")
+def driver_pool(request, headless: bool):
+    """
+    Running browsers shared by the tests of one process (= one xdist worker).
+    Only used when --driver-mode=pool.
+    """
+    browser = request.config.getoption("--browser").lower()
+    pool = DriverPool(
+        lambda: build_driver(browser, headless),
+        max_uses=request.config.getoption("--pool-max-uses"),
+    )
+    yield pool
+    pool.shutdown()
+
+@pytest.fixture(scope="session")
+def driver_prewarmer(request, headless: bool):
+    """
+    Background launcher that keeps the next browser(s) ready.
+    Only used when --driver-mode=prewarm.
+    """
+    browser = request.config.getoption("--browser").lower()
+    prewarmer = DriverPrewarmer(
+        lambda: build_driver(browser, headless),
+        depth=request.config.getoption("--prewarm-depth"),
+    )
+    yield prewarmer
+    prewarmer.shutdown()
+
 @pytest.fixture(scope="function")
 def driver(request, headless: bool):
     """
     Create a fresh browser per test and ensure full teardown after each test.
     This prevents multiple browsers from stacking up.
+
+    With --driver-mode=pool the browser is borrowed from `driver_pool` instead
+    and reset (cookies, storage, windows) when handed back. With
+    --driver-mode=prewarm it is taken from `driver_prewarmer`, which launched
+    it while the previous test was running.
     """
     browser = request.config.getoption("--browser").lower()
-    if browser == "chrome":
-        driver_instance = _build_chrome(headless=headless)
-    elif browser == "edge":
-        driver_instance = _build_edge(headless=headless)
-    else:
-        raise ValueError(f"Unsupported browser: {browser}. Supported browsers: chrome, edge")
+    mode = request.config.getoption("--driver-mode")
+    if mode == "pool":
+        pool = request.getfixturevalue("driver_pool")
+        driver_instance = pool.acquire()
+        driver_instance.implicitly_wait(2)
+        pacing.install(driver_instance)
+        command_stats.install(driver_instance)
+        tracing.install(driver_instance)
+        yield driver_instance
+        pool.release(driver_instance)
+        return
 
+    if mode == "prewarm":
+        driver_instance = request.getfixturevalue("driver_prewarmer").take()
+    else:
+        driver_instance = build_driver(browser, headless)
     driver_instance.implicitly_wait(2)
+    pacing.install(driver_instance)
+    command_stats.install(driver_instance)
+    tracing.install(driver_instance)
 
     yield driver_instance
 
     # ✅ Per-test teardown
-    try:
-        driver_instance.quit()
-    except Exception as e:
-        print(f"Error quitting {browser} driver: {e}")
-    finally:
-        profile_dir = getattr(driver_instance, "_tmp_profile_dir", None)
-        if profile_dir:
-            shutil.rmtree(profile_dir, ignore_errors=True)
-
-@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+    quit_driver(driver_instance)
+
+@pytest.fixture(scope="session")
+def session_login(base_url: str) -> SessionLogin:
+    """Per-user session cookie cache shared by every `logged_in_driver`."""
+    return SessionLogin(base_url)
+
+@pytest.fixture(scope="function")
+def logged_in_driver(request, driver, session_login: SessionLogin):
+    """
+    `driver` already logged in and sitting on inventory.html.
+    Logs in by injecting the session cookie (UI login only as a fallback).
+    Pick the user with @pytest.mark.user("problem_user"); default standard_user.
+    Start with a prepared cart with @pytest.mark.cart("Sauce Labs Backpack", ...).
+    """
+    marker = request.node.get_closest_marker("user")
+    user = marker.args[0] if marker else "standard_user"
+    cart_marker = request.node.get_closest_marker("cart")
+    cart = list(cart_marker.args) if cart_marker else None
+    session_login.login(driver, user, cart=cart)
+    return driver
+
+def _command_budget(item):
+    """n of @pytest.mark.max_commands(n), or None without the marker."""
+    marker = item.get_closest_marker("max_commands")
+    if marker is None:
+        return None
+    if len(marker.args) != 1 or marker.kwargs or type(marker.args[0]) is not int or marker.args[0] < 0:
+        given = ", ".join([repr(arg) for arg in marker.args] + [f"{k}={v!r}" for k, v in marker.kwargs.items()])
+        raise pytest.UsageError(
+            f"{item.nodeid}: expected @pytest.mark.max_commands(n) with one int n >= 0, got max_commands({given})"
+        )
+    return marker.args[0]
+
+def pytest_collection_modifyitems(config, items):
+    # A malformed marker stops the run before any browser starts (not in a setup hook)
+    for item in items:
+        _command_budget(item)
+
+@pytest.hookimpl(trylast=True, hookwrapper=True)
 def pytest_runtest_setup(item):
-    print(f"\n=== Executing test: {item.nodeid} ===")
-    time.sleep(0.5)
+    log.info("=== Executing test: %s ===", item.nodeid)
+    user = item.get_closest_marker("user")
+    wait_stats.set_context(
+        browser=item.config.getoption("--browser").lower(),
+        persona=user.args[0] if user else "standard_user",
+    )
+    screenshots.begin_test(item.nodeid)
+    command_stats.start(item.nodeid, _command_budget(item))
+    # Browserless unit tests have nothing to watch
+    if "driver" in item.fixturenames:
+        pacing.pace("before_test")
     yield
+    # Innermost wrapper: the banner and fixture/login records land in the setup's captured output
+    logger.drain()
 
-@pytest.fixture(autouse=True)
-def visual_pause():
-    yield
-    time.sleep(0.5)
\ No newline at end of file
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    report = (yield).get_result()
+    # A failed or skipped setup has no call phase: close its tally here
+    if report.when == "call" or (report.when == "setup" and not report.passed):
+        done = command_stats.finish()
+        if done is not None:
+            if pytest_html is not None:
+                report.extras = getattr(report, "extras", []) + [pytest_html.extras.html(done.to_html())]
+            message = command_stats.over_budget(done)
+            if message and report.passed:
+                report.outcome = "failed"
+                report.longrepr = message
+    # after the budget check, so a budget failure keeps its screenshots
+    screenshots.publish(report, failed=report.failed, final=report.when == "call")
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    tracing.begin_test(item.nodeid)
+    with tracing.span(item.nodeid, "test"):
+        yield
+    tracing.end_test()
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    with tracing.span(fixturedef.argname, "fixture", scope=fixturedef.scope):
+        yield
+
+@pytest.hookimpl(trylast=True, hookwrapper=True)
+def pytest_runtest_call(item):
+    with tracing.span("call", "test"):
+        yield
+    # Innermost wrapper: the test's log records land in its captured output
+    logger.drain()
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_teardown(item):
+    if "driver" in item.fixturenames:
+        pacing.pace("after_test")
+    logger.drain()
+
+# ---------- run summary ----------
+def pytest_sessionfinish(session):
+    screenshots.drain()
+    workerinput = getattr(session.config, "workerinput", None)
+    wait_stats.flush(workerinput["workerid"] if workerinput else "main")
+    tracing.write_worker()
+    # xdist worker: ship counters to the controller
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["action_strategies"] = actions.learned()
+        workeroutput["command_stats"] = command_stats.results()
+        workeroutput["visual_jobs"] = visual.pending()
+        workeroutput["run_stats"] = run_stats.snapshot()
+    else:
+        # controller or plain run: every shard is written by now
+        wait_stats.report(wait_stats.compact())
+        actions.save()
+        actions.report()
+        command_stats.write_json(session.config.rootpath / session.config.getoption("--command-stats-json"))
+        tracing.write_run()
+        results = visual.run_batch(session.config.rootpath / session.config.getoption("--visual-dir") / "results.json")
+        # --visual=batch: no test saw its comparison, so a mismatch fails the session
+        if any(not result["ok"] for result in results) and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+        artifact_store.gc(
+            session.config.rootpath / session.config.getoption("--artifact-dir"),
+            keep_runs=session.config.getoption("--artifact-keep-runs"),
+            max_mb=session.config.getoption("--artifact-max-mb"),
+        )
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # xdist controller: every worker stores its artifacts under the same run id
+    node.workerinput["artifact_run"] = artifact_store.current_run()
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    # xdist controller: sum counters from each finished worker
+    workeroutput = getattr(node, "workeroutput", {})
+    run_stats.merge(workeroutput.get("run_stats", {}))
+    actions.merge(workeroutput.get("action_strategies", {}))
+    command_stats.merge(workeroutput.get("command_stats", {}))
+    visual.merge(workeroutput.get("visual_jobs", []))
+
+def pytest_terminal_summary(terminalreporter):
+    counters, notes = run_stats.counters(), run_stats.notes()
+    for section in sorted(set(counters) | set(notes)):
+        terminalreporter.write_sep("-", section)
+        for key, amount in sorted(counters.get(section, {}).items()):
+            if isinstance(amount, float):
+                amount = f"{amount:.2f}"
+            terminalreporter.write_line(f"{key}: {amount}")
+        for line in notes.get(section, []):
+            terminalreporter.write_line(line)
@@ -1,18 +1,14 @@
 # pages/base_page.py
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from utilis import screenshots, waits
+from utilis.tracing import traced
+from utilis.waits import EventWait
 from selenium.common.exceptions import TimeoutException
-import time
-import os
-
-try:
-    import allure
-except Exception:
-    allure = None
 
+from utilis.fast_fill import fill
 from utilis.logger import get_logger
 logger = get_logger()
 
+@traced
 class BasePage:
     """Base class for all page objects — contains common Selenium actions with explicit waits."""
 
@@ -21,30 +17,29 @@ class BasePage:
         self.timeout = timeout
 
     def open_url(self, url: str):
-        logger.info(f"Opening URL: {url}")
+        logger.info("Opening URL: %s", url)
         self.driver.get(url)
 
     def find_element(self, locator):
         try:
-            element = WebDriverWait(self.driver, self.timeout).until(
-                EC.visibility_of_element_located(locator)
+            element = EventWait(self.driver, self.timeout).until(
+                waits.visibility_of_element_located(locator)
             )
             return element
         except TimeoutException:
-            logger.error(f"Element not found or not visible: {locator}")
+            logger.error("Element not found or not visible: %s", locator)
             self.take_screenshot("element_not_found")
             raise
 
     def click(self, locator):
-        logger.info(f"🖱 Clicking element: {locator}")
+        logger.debug("🖱 Clicking element: %s", locator)
         element = self.find_element(locator)
         element.click()
 
     def send_keys(self, locator, text: str):
-        logger.info(f"⌨ Typing into {locator}: '{text}'")
+        logger.debug("⌨ Typing into %s: '%s'", locator, text)
         element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
+        fill(self.driver, element, text)
 
     def get_text(self, locator) -> str:       # ← fixed
         element = self.find_element(locator)
@@ -52,27 +47,20 @@ class BasePage:
 
     def is_visible(self, locator) -> bool:    # ← fixed
         try:
-            WebDriverWait(self.driver, self.timeout).until(
-                EC.visibility_of_element_located(locator)
+            EventWait(self.driver, self.timeout).until(
+                waits.visibility_of_element_located(locator)
             )
-            logger.info(f"Element visible: {locator}")
+            logger.debug("Element visible: %s", locator)
             return True
         except TimeoutException:
-            logger.warning(f" Element not visible: {locator}")
+            logger.warning(" Element not visible: %s", locator)
             return False
 
     def take_screenshot(self, name: str):
-        """Capture a screenshot and attach to Allure if available."""
-        os.makedirs("screenshots", exist_ok=True)
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        path = f"screenshots/{name}_{timestamp}.png"
-        try:
-            self.driver.save_screenshot(path)
-            logger.info(f" Screenshot saved: {path}")
-            if allure:
-                try:
-                    allure.attach.file(path, name=name, attachment_type=allure.attachment_type.PNG)
-                except Exception:
-                    logger.debug("Could not attach screenshot to Allure.")
-        except Exception as e:
-            logger.error(f"Failed to save screenshot: {e}")
\ No newline at end of file
+        """
+        Capture a screenshot (PNG bytes in memory). Whether it is kept, attached
+        to the reports and put in the artifact store is decided once the test
+        outcome is known (see utilis/screenshots.py, --screenshots, and
+        utilis/artifact_store.py).
+        """
+        screenshots.capture(self.driver, name)
\ No newline at end of file
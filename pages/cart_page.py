@@ -1,20 +1,59 @@
 # pages/cart_page.py
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from utilis import visual, waits
+from utilis.logger import get_logger
+from utilis.probe import badge_count, probe
+from utilis.read_cache import READ_TAG, cached_read
+from utilis.tracing import traced
+from utilis.waits import EventWait
 
+logger = get_logger(__name__)
+
+def _xpath_literal(text: str) -> str:
+    """Quote `text` for use inside an XPath expression."""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{p}'" for p in parts) + ")"
+
+
+# Name, price and quantity text of every cart row in one round trip;
+# arguments: row XPath, then the name/price/qty XPaths relative to a row.
+_ROWS_JS = READ_TAG + """
+const [rowX, ...cellX] = arguments;
+const first = (xpath, node) => document.evaluate(
+  xpath, node, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const rows = document.evaluate(rowX, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const out = [];
+for (let i = 0; i < rows.snapshotLength; i++) {
+  out.push(cellX.map(x => {
+    const cell = first(x, rows.snapshotItem(i));
+    return cell ? (cell.innerText || cell.textContent || '').trim() : null;
+  }));
+}
+return out;
+"""
+
+
+@traced
 class CartPage:
     """
     Sauce Demo Cart Page Object (XPath-only locators)
     URL: https://www.saucedemo.com/cart.html
+
+    get_cart_items() and get_cart_count() are memoized until the page changes
+    (see utilis/read_cache.py), so has_item() no longer rescans every row.
     """
 
     def __init__(self, driver, timeout: int = 12):
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        self.wait = EventWait(driver, timeout)
 
         # ----- XPath Locators -----
         self._cart_list_x      = ("xpath", "//div[contains(@class,'cart_list')]")
-        self._cart_item_x      = ("xpath", "//div[contains(@class,'cart_item')]")
+        # exact class: contains(@class,'cart_item') also matches .cart_item_label
+        self._cart_item_x      = ("xpath", "//div[contains(concat(' ',normalize-space(@class),' '),' cart_item ')]")
         self._item_name_x_rel  = ".//div[contains(@class,'inventory_item_name')]"
         self._item_price_x_rel = ".//div[contains(@class,'inventory_item_price')]"
         self._item_qty_x_rel   = ".//div[contains(@class,'cart_quantity')]"
@@ -29,47 +68,47 @@ class CartPage:
     # ===========================
     def wait_loaded(self):
         """Wait until the cart list is visible."""
-        print("🕒 Waiting for Cart page to load...")
-        self.wait.until(EC.visibility_of_element_located(self._cart_list_x))
-        print("✅ Cart page is visible.")
+        logger.debug("🕒 Waiting for Cart page to load...")
+        self.wait.until(waits.visibility_of_element_located(self._cart_list_x))
+        logger.debug("✅ Cart page is visible.")
 
     # ===========================
     # Getters
     # ===========================
+    @cached_read
     def get_cart_items(self):
         """
         Return a list of dicts representing items in cart:
         [{ "name": str, "price": float, "qty": int }, ...]
         """
         self.wait_loaded()
-        print("🔎 Collecting items from cart...")
-        rows = self.driver.find_elements(*self._cart_item_x)
+        logger.debug("🔎 Collecting items from cart...")
+        rows = self.driver.execute_script(
+            _ROWS_JS, self._cart_item_x[1],
+            self._item_name_x_rel, self._item_price_x_rel, self._item_qty_x_rel,
+        ) or []
         items = []
-        for r in rows:
-            try:
-                name = r.find_element("xpath", self._item_name_x_rel).text.strip()
-                price_raw = r.find_element("xpath", self._item_price_x_rel).text.strip().replace("$", "")
-                qty_raw = r.find_element("xpath", self._item_qty_x_rel).text.strip()
-                items.append({
-                    "name": name,
-                    "price": float(price_raw),
-                    "qty": int(qty_raw) if qty_raw.isdigit() else 1
-                })
-            except Exception:
-                pass
-        print(f"📋 Cart items ({len(items)}): {items}")
+        for name, price_raw, qty_raw in rows:
+            if not name or not price_raw:
+                logger.warning("⚠️ Skipping incomplete cart row: %s", [name, price_raw, qty_raw])
+                continue
+            items.append({
+                "name": name,
+                "price": float(price_raw.replace("$", "")),
+                "qty": int(qty_raw) if qty_raw and qty_raw.isdigit() else 1
+            })
+        logger.debug("📋 Cart items (%s): %s", len(items), items)
         return items
 
+    @cached_read
     def get_cart_count(self) -> int:
-        """Return the cart badge count; if badge is absent, return 0."""
-        try:
-            badge = self.driver.find_element(*self._cart_badge_x)
-            count = int(badge.text.strip())
-            print(f"🛒 Cart badge: {count}")
-            return count
-        except Exception:
-            print("🛒 Cart badge not visible → treating as 0.")
-            return 0
+        """Return the cart badge count; if badge is absent, return 0 (no implicit wait)."""
+        count = badge_count(self.driver, self._cart_badge_x)
+        if count:
+            logger.debug("🛒 Cart badge: %s", count)
+        else:
+            logger.debug("🛒 Cart badge not visible → treating as 0.")
+        return count
 
     def has_item(self, name: str) -> bool:
         """Return True if an item with the given name is present in the cart."""
@@ -84,18 +123,16 @@ class CartPage:
         Returns True if removed, False if not found.
         """
         self.wait_loaded()
-        print(f"➖ Removing '{name}' from cart...")
-        rows = self.driver.find_elements(*self._cart_item_x)
-        for r in rows:
-            try:
-                title = r.find_element("xpath", self._item_name_x_rel).text.strip()
-                if title == name:
-                    r.find_element("xpath", self._remove_btn_x_rel).click()
-                    print(f"✅ Removed '{name}' from cart.")
-                    return True
-            except Exception:
-                continue
-        print(f"❌ Could not find '{name}' to remove.")
+        logger.debug("➖ Removing '%s' from cart...", name)
+        # One probe for the button of the row titled `name` (no per-row lookups)
+        row_x = (f"{self._cart_item_x[1]}"
+                 f"[{self._item_name_x_rel}[normalize-space()={_xpath_literal(name)}]]")
+        button = probe(self.driver, ("xpath", row_x + self._remove_btn_x_rel[1:]))
+        if button["present"]:
+            button["element"].click()
+            logger.info("✅ Removed '%s' from cart.", name)
+            return True
+        logger.warning("❌ Could not find '%s' to remove.", name)
         return False
 
     def clear_cart(self) -> int:
@@ -104,28 +141,38 @@ class CartPage:
         Returns number of items removed.
         """
         self.wait_loaded()
-        print("🧹 Clearing cart...")
+        logger.debug("🧹 Clearing cart...")
         removed = 0
+        first_remove_x = ("xpath", f"({self._cart_item_x[1]}{self._remove_btn_x_rel[1:]})[1]")
         while True:
-            rows = self.driver.find_elements(*self._cart_item_x)
-            if not rows:
+            # probe: an empty cart answers at once instead of after the implicit wait
+            button = probe(self.driver, first_remove_x)
+            if not button["present"]:
                 break
             try:
-                rows[0].find_element("xpath", self._remove_btn_x_rel).click()
+                button["element"].click()
                 removed += 1
             except Exception:
                 break
-        print(f"✅ Cleared {removed} item(s) from cart.")
+        logger.info("✅ Cleared %s item(s) from cart.", removed)
         return removed
 
     def continue_shopping(self):
         """Click 'Continue Shopping' to return to the Inventory page."""
-        print("🔙 Clicking 'Continue Shopping'...")
-        self.wait.until(EC.element_to_be_clickable(self._continue_btn_x)).click()
-        print("✅ Navigated back to Inventory.")
+        logger.debug("🔙 Clicking 'Continue Shopping'...")
+        self.wait.until(waits.element_to_be_clickable(self._continue_btn_x)).click()
+        logger.info("✅ Navigated back to Inventory.")
 
     def checkout(self):
         """Click 'Checkout' to navigate to Checkout Step One page."""
-        print("🧭 Clicking 'Checkout'...")
-        self.wait.until(EC.element_to_be_clickable(self._checkout_btn_x)).click()
-        print("✅ Navigated to Checkout Step One page.")
\ No newline at end of file
+        logger.debug("🧭 Clicking 'Checkout'...")
+        self.wait.until(waits.element_to_be_clickable(self._checkout_btn_x)).click()
+        logger.info("✅ Navigated to Checkout Step One page.")
+
+    # ===========================
+    # Visual baseline
+    # ===========================
+    def check_visual(self, name: str = "cart") -> dict | None:
+        """Compare the cart with its baseline (see utilis/visual.py); the cart badge is ignored."""
+        self.wait_loaded()
+        return visual.check(self.driver, name, ignore=[self._cart_badge_x])
@@ -1,7 +1,13 @@
 # pages/checkout_complete_page.py
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from utilis import visual, waits
+from utilis.actions import ActionExecutor
+from utilis.logger import get_logger
+from utilis.tracing import traced
+from utilis.waits import EventWait
 
+logger = get_logger(__name__)
+
+@traced
 class CheckoutCompletePage:
     """
     Sauce Demo Checkout Complete (Thank You) — XPath-only POM
@@ -10,7 +16,8 @@ class CheckoutCompletePage:
 
     def __init__(self, driver, timeout: int = 12):
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        self.wait = EventWait(driver, timeout)
+        self.actions = ActionExecutor(driver, timeout)
 
         # ----- XPath Locators -----
         self._container_x   = ("xpath", "//div[contains(@class,'checkout_complete_container')]")
@@ -23,10 +30,10 @@ class CheckoutCompletePage:
     # Wait / State
     # ===========================
     def wait_loaded(self):
-        print("🕒 Waiting for Checkout Complete page to load...")
-        self.wait.until(EC.visibility_of_element_located(self._container_x))
-        self.wait.until(EC.visibility_of_element_located(self._header_x))
-        print("✅ Checkout Complete page is visible.")
+        logger.debug("🕒 Waiting for Checkout Complete page to load...")
+        self.wait.until(waits.visibility_of_element_located(self._container_x))
+        self.wait.until(waits.visibility_of_element_located(self._header_x))
+        logger.debug("✅ Checkout Complete page is visible.")
 
     # ===========================
     # Getters
@@ -34,13 +41,13 @@ class CheckoutCompletePage:
     def get_header_text(self) -> str:
         self.wait_loaded()
         txt = self.driver.find_element(*self._header_x).text.strip()
-        print(f"🏁 Complete header: {txt}")
+        logger.debug("🏁 Complete header: %s", txt)
         return txt
 
     def get_body_text(self) -> str:
         self.wait_loaded()
         txt = self.driver.find_element(*self._text_x).text.strip()
-        print(f"📝 Complete body: {txt}")
+        logger.debug("📝 Complete body: %s", txt)
         return txt
 
     def is_thank_you_visible(self) -> bool:
@@ -48,10 +55,10 @@ class CheckoutCompletePage:
             self.wait_loaded()
             header = self.driver.find_element(*self._header_x).text.strip().lower()
             visible = "thank you" in header
-            print(f"👀 Thank-you visible? {visible}")
+            logger.debug("👀 Thank-you visible? %s", visible)
             return visible
         except Exception:
-            print("👀 Thank-you header not visible.")
+            logger.debug("👀 Thank-you header not visible.")
             return False
 
     # ===========================
@@ -59,15 +66,15 @@ class CheckoutCompletePage:
     # ===========================
     def back_home(self):
         """Click 'Back Home' to return to the Inventory page."""
-        print("🏠 Clicking 'Back Home'...")
-        btn = self.wait.until(EC.element_to_be_clickable(self._back_home_x))
-        try:
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn)
-        except Exception:
-            pass
-        try:
-            btn.click()
-        except Exception as e:
-            print(f"⚠️ Normal click failed: {e}; trying JS click...")
-            self.driver.execute_script("arguments[0].click();", btn)
-        print("✅ Back Home clicked.")
\ No newline at end of file
+        logger.debug("🏠 Clicking 'Back Home'...")
+        # scroll + native click, JS click as fallback (learned order)
+        self.actions.click(self._back_home_x)
+        logger.info("✅ Back Home clicked.")
+
+    # ===========================
+    # Visual baseline
+    # ===========================
+    def check_visual(self, name: str = "checkout_complete") -> dict | None:
+        """Compare the Thank You page with its baseline (see utilis/visual.py)."""
+        self.wait_loaded()
+        return visual.check(self.driver, name)
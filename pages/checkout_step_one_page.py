@@ -0,0 +1,82 @@
+# pages/checkout_step_one_page.py
+from utilis import waits
+from utilis.actions import ActionExecutor
+from utilis.fast_fill import fill_many
+from utilis.logger import get_logger
+from utilis.probe import probe
+from utilis.tracing import traced
+from utilis.waits import EventWait
+
+logger = get_logger(__name__)
+
+@traced
+class CheckoutStepOnePage:
+    """
+    Sauce Demo Checkout: Your Information — XPath-only POM
+    URL: https://www.saucedemo.com/checkout-step-one.html
+
+    fill_info() sets the whole form in one script (utilis.fast_fill.fill_many),
+    with or without --fast-fill.
+    """
+
+    def __init__(self, driver, timeout: int = 12):
+        self.driver = driver
+        self.wait = EventWait(driver, timeout)
+        self.actions = ActionExecutor(driver, timeout)
+
+        # ----- XPath Locators -----
+        self._container_x   = ("xpath", "//div[contains(@class,'checkout_info_container')]")
+        self._first_name_x  = ("xpath", "//input[@id='first-name']")
+        self._last_name_x   = ("xpath", "//input[@id='last-name']")
+        self._postal_code_x = ("xpath", "//input[@id='postal-code']")
+        self._continue_x    = ("xpath", "//input[@id='continue' or @data-test='continue']")
+        self._cancel_x      = ("xpath", "//button[@id='cancel']")
+        self._error_x       = ("xpath", "//h3[@data-test='error']")
+
+    # ===========================
+    # Wait / State
+    # ===========================
+    def wait_loaded(self):
+        logger.debug("🕒 Waiting for Checkout Step One to load...")
+        self.wait.until(waits.url_contains("checkout-step-one.html"))
+        self.wait.until(waits.visibility_of_element_located(self._first_name_x))
+        logger.debug("✅ Checkout Step One is visible.")
+
+    def get_error_text(self) -> str:
+        """Error banner text, '' when there is none (no implicit wait)."""
+        return probe(self.driver, self._error_x)["text"] or ""
+
+    # ===========================
+    # Actions
+    # ===========================
+    def fill_info(self, first_name: str, last_name: str, postal_code: str,
+                  fast: bool | None = True) -> dict:
+        """
+        Fill the three fields with utilis.fast_fill.fill_many: one script
+        setting all of them (React-safe); any field whose value did not stick
+        is typed instead. `fast=False` types every field, `fast=None` follows
+        --fast-fill.
+        Returns {"first_name", "last_name", "postal_code"} as read back.
+        """
+        logger.debug("📝 Filling Step One (Your Information)...")
+        self.wait_loaded()
+        fields = [
+            ("first_name", self._first_name_x, first_name),
+            ("last_name", self._last_name_x, last_name),
+            ("postal_code", self._postal_code_x, postal_code),
+        ]
+        values = fill_many(self.driver, [(locator, value) for _, locator, value in fields], fast=fast)
+        result = {key: actual for (key, _, _), actual in zip(fields, values)}
+        logger.info("✅ Step One filled: %s", result)
+        return result
+
+    def continue_checkout(self):
+        """Click Continue (scroll/JS safety, learned order) and wait for Step Two."""
+        logger.debug("➡️ Clicking Continue...")
+        self.actions.click(self._continue_x)
+        self.wait.until(waits.url_contains("checkout-step-two.html"))
+        logger.info("✅ On Checkout Step Two.")
+
+    def cancel(self):
+        logger.debug("↩️ Cancelling checkout...")
+        self.actions.click(self._cancel_x)
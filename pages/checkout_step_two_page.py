@@ -0,0 +1,128 @@
+# pages/checkout_step_two_page.py
+from decimal import Decimal, InvalidOperation
+
+from utilis import waits
+from utilis.actions import ActionExecutor
+from utilis.logger import get_logger
+from utilis.read_cache import READ_TAG
+from utilis.tracing import traced
+from utilis.waits import EventWait
+
+logger = get_logger(__name__)
+
+# The whole order summary as raw strings, in one round trip.
+# arguments: row, name, price, qty (relative) XPaths; item total, tax, total XPaths
+_SUMMARY_JS = READ_TAG + """
+const [rowX, nameX, priceX, qtyX, itemTotalX, taxX, totalX] = arguments;
+const one = (xpath, context) => document.evaluate(
+  xpath, context || document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const text = (xpath, context) => { const el = one(xpath, context); return el ? el.textContent.trim() : null; };
+const rows = document.evaluate(rowX, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const lines = [];
+for (let i = 0; i < rows.snapshotLength; i++) {
+  const row = rows.snapshotItem(i);
+  lines.push({name: text(nameX, row), price: text(priceX, row), qty: text(qtyX, row)});
+}
+return {lines: lines, item_total: text(itemTotalX), tax: text(taxX), total: text(totalX)};
+"""
+
+
+def _amount(text) -> Decimal | None:
+    """'$29.99', 'Item total: $39.98' or 'Tax: $3.20' -> Decimal('29.99'); None if unparsable."""
+    try:
+        return Decimal((text or "").split("$")[-1].strip())
+    except InvalidOperation:
+        return None
+
+
+@traced
+class CheckoutStepTwoPage:
+    """
+    Sauce Demo Checkout: Overview — XPath-only POM
+    URL: https://www.saucedemo.com/checkout-step-two.html
+
+    get_summary() reads every line plus item total, tax and total with one
+    execute_script and does the arithmetic in Decimal, so cents add up
+    exactly (no float tolerance needed).
+    """
+
+    def __init__(self, driver, timeout: int = 12):
+        self.driver = driver
+        self.wait = EventWait(driver, timeout)
+        self.actions = ActionExecutor(driver, timeout)
+
+        # ----- XPath Locators -----
+        self._container_x      = ("xpath", "//div[contains(@class,'checkout_summary_container')]")
+        self._item_row_x       = ("xpath", "//div[contains(concat(' ', normalize-space(@class), ' '), ' cart_item ')]")
+        self._item_name_x_rel  = ".//div[contains(@class,'inventory_item_name')]"
+        self._item_price_x_rel = ".//div[contains(@class,'inventory_item_price')]"
+        self._item_qty_x_rel   = ".//div[contains(@class,'cart_quantity')]"
+        self._item_total_x     = ("xpath", "//div[contains(@class,'summary_subtotal_label')]")
+        self._tax_x            = ("xpath", "//div[contains(@class,'summary_tax_label')]")
+        self._total_x          = ("xpath", "//div[contains(@class,'summary_total_label')]")
+        self._finish_x         = ("xpath", "//button[@id='finish']")
+        self._cancel_x         = ("xpath", "//button[@id='cancel']")
+
+    # ===========================
+    # Wait / State
+    # ===========================
+    def wait_loaded(self):
+        logger.debug("🕒 Waiting for Checkout Step Two to load...")
+        self.wait.until(waits.url_contains("checkout-step-two.html"))
+        self.wait.until(waits.visibility_of_element_located(self._total_x))
+        logger.debug("✅ Checkout Step Two is visible.")
+
+    # ===========================
+    # Getters
+    # ===========================
+    def get_summary(self) -> dict:
+        """
+        Return the order summary:
+        {"lines": [{"name": str, "price": Decimal, "qty": int}, ...],
+         "item_total": Decimal, "tax": Decimal, "total": Decimal,
+         "computed_item_total": sum of price x qty,
+         "item_total_ok": item_total == computed_item_total,
+         "total_ok": total == item_total + tax}
+        Amounts the page does not show are None (and the checks False).
+        """
+        self.wait_loaded()
+        raw = self.driver.execute_script(
+            _SUMMARY_JS, self._item_row_x[1], self._item_name_x_rel, self._item_price_x_rel,
+            self._item_qty_x_rel, self._item_total_x[1], self._tax_x[1], self._total_x[1]
+        ) or {}
+        lines = []
+        for line in raw.get("lines", []):
+            qty = (line.get("qty") or "").strip()
+            lines.append({
+                "name": line.get("name"),
+                "price": _amount(line.get("price")),
+                "qty": int(qty) if qty.isdigit() else 1,
+            })
+        item_total, tax, total = _amount(raw.get("item_total")), _amount(raw.get("tax")), _amount(raw.get("total"))
+        prices = [line["price"] * line["qty"] for line in lines if line["price"] is not None]
+        computed = sum(prices, Decimal("0.00"))
+        summary = {
+            "lines": lines,
+            "item_total": item_total,
+            "tax": tax,
+            "total": total,
+            "computed_item_total": computed,
+            "item_total_ok": item_total is not None and len(prices) == len(lines) and item_total == computed,
+            "total_ok": None not in (item_total, tax, total) and total == item_total + tax,
+        }
+        logger.debug("🧾 Summary -> Item total: %s, Tax: %s, Total: %s (computed item total %s, %s lines)",
+                     item_total, tax, total, computed, len(lines))
+        return summary
+
+    # ===========================
+    # Actions
+    # ===========================
+    def finish(self):
+        """Click Finish (scroll/JS safety, learned order) and wait for Checkout Complete."""
+        logger.info("✅ Clicking Finish...")
+        self.actions.click(self._finish_x)
+        self.wait.until(waits.url_contains("checkout-complete.html"))
+
+    def cancel(self):
+        logger.debug("↩️ Cancelling checkout...")
+        self.actions.click(self._cancel_x)
@@ -1,24 +1,157 @@
 # pages/inventory_page.py
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from utilis import visual, waits
+from utilis.actions import ActionExecutor
+from utilis.logger import get_logger
+from utilis.probe import badge_count, probe
+from utilis.read_cache import READ_TAG, cached_read
+from utilis.tracing import traced
+from utilis.waits import EventWait
 
+logger = get_logger(__name__)
+
+# One round trip for the whole list: every card as a compact record.
+# arguments: card, name, price, button selectors
+_CATALOG_JS = READ_TAG + """
+const [cardSel, nameSel, priceSel, buttonSel] = arguments;
+const records = [];
+for (const card of document.querySelectorAll(cardSel)) {
+  const name = card.querySelector(nameSel);
+  if (!name) { continue; }
+  const price = card.querySelector(priceSel);
+  const button = card.querySelector(buttonSel);
+  const link = name.closest('a') || card.querySelector('a[id$="_title_link"]');
+  const id = link ? /item_(\\d+)_title_link/.exec(link.id) : null;
+  records.push({
+    name: name.textContent.trim(),
+    price: price ? price.textContent.trim() : null,
+    button: button ? button.textContent.trim() : null,
+    id: id ? Number(id[1]) : null,
+    element: card
+  });
+}
+return records;
+"""
+
+# The name link and button of one card, looked up by product name.
+# arguments: card, name, button selectors, product name
+_CARD_JS = READ_TAG + """
+const [cardSel, nameSel, buttonSel, wanted] = arguments;
+for (const card of document.querySelectorAll(cardSel)) {
+  const name = card.querySelector(nameSel);
+  if (!name || name.textContent.trim() !== wanted) { continue; }
+  const button = card.querySelector(buttonSel);
+  return {
+    link: name.closest('a') || name,
+    button: button,
+    label: button ? button.textContent.trim() : null
+  };
+}
+return null;
+"""
+
+# Click the button of every named card whose label is arguments[4];
+# returns the names that were clicked.
+_CLICK_MANY_JS = """
+const [cardSel, nameSel, buttonSel, names, label] = arguments;
+const wanted = new Set(names);
+const clicked = [];
+for (const card of document.querySelectorAll(cardSel)) {
+  const name = card.querySelector(nameSel);
+  const button = card.querySelector(buttonSel);
+  if (!name || !button || !wanted.has(name.textContent.trim())) { continue; }
+  if (button.textContent.trim() !== label) { continue; }
+  button.click();
+  clicked.push(name.textContent.trim());
+}
+return clicked;
+"""
+
+# Apply a sort value and wait, inside the page, until the cards are in that
+# order (MutationObserver + budget timer). Returns before/after order and the
+# in-page elapsed time.
+# arguments: select, card, name, price selectors, sort value, budget ms, callback
+_SORT_JS = """
+const done = arguments[arguments.length - 1];
+const [selectSel, cardSel, nameSel, priceSel, value, budget] = arguments;
+const start = performance.now();
+const text = (card, sel) => { const el = card.querySelector(sel); return el ? el.textContent.trim() : ''; };
+const read = () => Array.from(document.querySelectorAll(cardSel)).map(card => ({
+  name: text(card, nameSel),
+  price: parseFloat(text(card, priceSel).replace('$', ''))
+}));
+const pairs = (items, ok) => items.every((item, i) => i === 0 || ok(items[i - 1], item));
+const orders = {
+  az: (a, b) => a.name <= b.name,
+  za: (a, b) => a.name >= b.name,
+  lohi: (a, b) => a.price <= b.price,
+  hilo: (a, b) => a.price >= b.price
+};
+const result = (ok, reason) => {
+  const after = read();
+  return {
+    value: value, ok: ok, applied: reason !== 'no select' && reason !== 'unknown sort value', reason: reason,
+    before: before.map(item => item.name),
+    after: after.map(item => item.name),
+    prices: after.map(item => item.price),
+    elapsed: (performance.now() - start) / 1000
+  };
+};
+const before = read();
+const select = document.querySelector(selectSel);
+if (!select) { done(result(false, 'no select')); return; }
+if (!orders[value] || !Array.from(select.options).some(option => option.value === value)) {
+  done(result(false, 'unknown sort value')); return;
+}
+// Native setter + bubbling change event, so framework-managed selects see it too
+Object.getOwnPropertyDescriptor(HTMLSelectElement.prototype, 'value').set.call(select, value);
+select.dispatchEvent(new Event('change', {bubbles: true}));
+
+let finished = false;
+const observer = new MutationObserver(check);
+const finish = (ok, reason) => {
+  if (finished) { return; }
+  finished = true;
+  observer.disconnect();
+  clearTimeout(timer);
+  done(result(ok, reason));
+};
+function check() {
+  if (select.value === value && pairs(read(), orders[value])) { finish(true, 'sorted'); }
+}
+observer.observe(document.body, {subtree: true, childList: true});
+const timer = setTimeout(() => finish(false, 'order not reached'), budget);
+check();
+"""
+
+
+@traced
 class InventoryPage:
     """
     Sauce Demo Inventory (Products) Page Object
     URL: https://www.saucedemo.com/inventory.html
 
     Uses string-based locator strategies to avoid `By` import.
-    Includes a robust sort_by() with page-scroll, JS querySelector fallback,
-    and JS-based set+change to defeat Edge clickability quirks.
+    sort_and_verify() applies a sort and checks the order in one async
+    script; sort_by() falls back to a robust path with page-scroll, JS
+    querySelector fallback, and JS-based set+change to defeat Edge
+    clickability quirks.
+
+    Reads go through get_catalog(): one execute_script returns every card
+    (name, price, button label, item id, element) instead of a find_element
+    plus .text per card, i.e. 1 WebDriver round trip instead of 2N+1.
+    get_catalog() and get_cart_count() are memoized until the page changes
+    (see utilis/read_cache.py).
     """
 
     def __init__(self, driver, timeout: int = 15):
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        self.wait = EventWait(driver, timeout)
+        self.actions = ActionExecutor(driver, timeout)
 
         # ----- Locators -----
         self._inventory_container = ("id", "inventory_container")
         self._inventory_items = ("css selector", ".inventory_item")
+        self._inventory_list = ("css selector", ".inventory_list")
         self._item_name = ".inventory_item_name"
         self._item_price = ".inventory_item_price"
         self._item_button = "button.btn_inventory"  # "Add to cart" or "Remove"
@@ -34,76 +167,79 @@ class InventoryPage:
     # ===========================
     def wait_loaded(self):
         """Block until the inventory container and at least one item are visible."""
-        print("🕒 Waiting for Inventory page to load...")
-        self.wait.until(EC.visibility_of_element_located(self._inventory_container))
-        self.wait.until(EC.presence_of_all_elements_located(self._inventory_items))
-        print("✅ Inventory page is visible and items are present.")
+        logger.debug("🕒 Waiting for Inventory page to load...")
+        self.wait.until(waits.visibility_of_element_located(self._inventory_container))
+        self.wait.until(waits.presence_of_all_elements_located(self._inventory_items))
+        logger.debug("✅ Inventory page is visible and items are present.")
 
     # ===========================
     # Getters
     # ===========================
-    def get_item_names(self):
-        """Return the list of product names currently displayed."""
+    @cached_read
+    def get_catalog(self) -> list:
+        """
+        Return every product card as a dict in display order:
+        {"name": str, "price": float | None, "button": "Add to cart" | "Remove" | None,
+         "id": int | None, "element": WebElement of the card}
+        """
         self.wait_loaded()
-        print("🔎 Collecting product names from inventory...")
-        cards = self.driver.find_elements(*self._inventory_items)
-        names = []
-        for card in cards:
+        records = self.driver.execute_script(
+            _CATALOG_JS, self._inventory_items[1], self._item_name, self._item_price, self._item_button
+        ) or []
+        for record in records:
+            raw = record.get("price")  # e.g., "$29.99"
             try:
-                names.append(card.find_element("css selector", self._item_name).text.strip())
-            except Exception:
-                pass
-        print(f"📋 Found {len(names)} items: {names}")
+                record["price"] = float(raw.replace("$", "")) if raw else None
+            except ValueError:
+                record["price"] = None
+        return records
+
+    def get_item_names(self):
+        """Return the list of product names currently displayed."""
+        logger.debug("🔎 Collecting product names from inventory...")
+        names = [record["name"] for record in self.get_catalog()]
+        logger.debug("📋 Found %s items: %s", len(names), names)
         return names
 
     def get_item_prices(self):
         """Return the list of product prices (float)."""
-        self.wait_loaded()
-        print("🔎 Collecting product prices from inventory...")
-        cards = self.driver.find_elements(*self._inventory_items)
-        prices = []
-        for card in cards:
-            try:
-                raw = card.find_element("css selector", self._item_price).text.strip()  # e.g., "$29.99"
-                prices.append(float(raw.replace("$", "")))
-            except Exception:
-                pass
-        print(f"💲 Prices: {prices}")
+        logger.debug("🔎 Collecting product prices from inventory...")
+        prices = [record["price"] for record in self.get_catalog() if record["price"] is not None]
+        logger.debug("💲 Prices: %s", prices)
         return prices
 
+    @cached_read
     def get_cart_count(self) -> int:
-        """Return the cart badge count; if badge is absent, return 0."""
-        try:
-            badge = self.driver.find_element(*self._cart_badge)
-            count = int(badge.text.strip())
-            print(f"🛒 Cart badge: {count}")
-            return count
-        except Exception:
-            print("🛒 Cart badge not visible → treating as 0.")
-            return 0
+        """Return the cart badge count; if badge is absent, return 0 (no implicit wait)."""
+        count = badge_count(self.driver, self._cart_badge)
+        if count:
+            logger.debug("🛒 Cart badge: %s", count)
+        else:
+            logger.debug("🛒 Cart badge not visible → treating as 0.")
+        return count
 
     # ===========================
     # Actions
     # ===========================
+    def _find_card(self, name: str):
+        """{"link", "button", "label"} of the card titled `name`, or None."""
+        self.wait_loaded()
+        return self.driver.execute_script(
+            _CARD_JS, self._inventory_items[1], self._item_name, self._item_button, name
+        )
+
     def add_to_cart_by_name(self, name: str) -> bool:
         """
         Click 'Add to cart' for a given product name.
         Returns True if action performed, False if not found.
         """
-        self.wait_loaded()
-        print(f"➕ Adding '{name}' to cart...")
-        cards = self.driver.find_elements(*self._inventory_items)
-        for card in cards:
-            try:
-                title = card.find_element("css selector", self._item_name).text.strip()
-                if title == name:
-                    btn = card.find_element("css selector", self._item_button)
-                    btn.click()
-                    print(f"✅ Added '{name}' to cart.")
-                    return True
-            except Exception:
-                continue
-        print(f"❌ Item '{name}' not found on Inventory page.")
+        logger.debug("➕ Adding '%s' to cart...", name)
+        card = self._find_card(name)
+        if card and card["button"] is not None:
+            card["button"].click()
+            logger.info("✅ Added '%s' to cart.", name)
+            return True
+        logger.warning("❌ Item '%s' not found on Inventory page.", name)
         return False
 
     def remove_from_cart_by_name(self, name: str) -> bool:
@@ -111,74 +247,128 @@ class InventoryPage:
         Click 'Remove' for a given product name.
         Returns True if removal performed, False if item not in cart or not found.
         """
-        self.wait_loaded()
-        print(f"➖ Removing '{name}' from cart...")
-        cards = self.driver.find_elements(*self._inventory_items)
-        for card in cards:
-            try:
-                title = card.find_element("css selector", self._item_name).text.strip()
-                if title == name:
-                    btn = card.find_element("css selector", self._item_button)
-                    if "Remove" in btn.text:
-                        btn.click()
-                        print(f"✅ Removed '{name}' from cart.")
-                        return True
-                    else:
-                        print(f"ℹ️ Button is not 'Remove' (text='{btn.text}') — item may not be in cart.")
-                        return False
-            except Exception:
-                continue
-        print(f"❌ Item '{name}' not found on Inventory page.")
+        logger.debug("➖ Removing '%s' from cart...", name)
+        card = self._find_card(name)
+        if card and card["button"] is not None:
+            if "Remove" in (card["label"] or ""):
+                card["button"].click()
+                logger.info("✅ Removed '%s' from cart.", name)
+                return True
+            logger.info("ℹ️ Button is not 'Remove' (text='%s') — item may not be in cart.", card['label'])
+            return False
+        logger.warning("❌ Item '%s' not found on Inventory page.", name)
         return False
 
+    def _click_many(self, names, label: str) -> list:
+        self.wait_loaded()
+        return self.driver.execute_script(
+            _CLICK_MANY_JS, self._inventory_items[1], self._item_name, self._item_button, list(names), label
+        ) or []
+
+    def add_many_to_cart(self, names) -> list:
+        """
+        Click 'Add to cart' on several products in a single script call.
+        Products already in the cart or not on the page are skipped.
+        Returns the names that were added.
+        """
+        names = list(names)
+        logger.debug("➕ Adding %s items to cart in one call...", len(names))
+        added = self._click_many(names, "Add to cart")
+        skipped = [name for name in names if name not in added]
+        logger.info("✅ Added %s items.%s", len(added), f" Skipped: {skipped}" if skipped else "")
+        return added
+
+    def remove_many_from_cart(self, names) -> list:
+        """Click 'Remove' on several products in a single script call; returns the names removed."""
+        names = list(names)
+        logger.debug("➖ Removing %s items from cart in one call...", len(names))
+        removed = self._click_many(names, "Remove")
+        skipped = [name for name in names if name not in removed]
+        logger.info("✅ Removed %s items.%s", len(removed), f" Skipped: {skipped}" if skipped else "")
+        return removed
+
     # ---------- internal: robust find for sort select ----------
     def _get_sort_select_element(self):
         """
         Robustly fetch the sort <select> using JS querySelector with fallback retries.
         This avoids EC presence flakiness observed on Edge in some runs.
         """
-        # Try a short JS-based wait that polls for querySelector to return the element
-        def _qs():
-            return self.driver.execute_script(
-                "return document.querySelector(arguments[0]);",
-                self._sort_select_css
-            )
-
-        # Poll up to ~5s for the element via JS (fewer moving parts than EC)
+        # Wait up to ~5s for querySelector to find the element, in the page itself
         select_el = None
-        end = WebDriverWait(self.driver, 5)
+        end = EventWait(self.driver, 5)
         try:
-            select_el = end.until(lambda d: _qs())
+            select_el = end.until(waits.presence_of_element_located(("css selector", self._sort_select_css)))
         except Exception:
             # As a last fallback, do an EC presence on the likely CSS to produce a clean error if truly missing
-            print("ℹ️ JS querySelector did not find sort select in 5s; trying EC presence fallback...")
+            logger.info("ℹ️ JS querySelector did not find sort select in 5s; trying EC presence fallback...")
             try:
                 select_el = self.wait.until(
-                    EC.presence_of_element_located(("css selector", "select[data-test='product_sort_container']"))
+                    waits.presence_of_element_located(("css selector", "select[data-test='product_sort_container']"))
                 )
             except Exception:
                 # Final attempt using class-based selector
                 select_el = self.wait.until(
-                    EC.presence_of_element_located(("css selector", "select.product_sort_container"))
+                    waits.presence_of_element_located(("css selector", "select.product_sort_container"))
                 )
         return select_el
 
+    def sort_and_verify(self, value: str, timeout: float = 4) -> dict:
+        """
+        Apply sort `value` ('az', 'za', 'lohi', 'hilo') and check the resulting
+        order inside the browser, in one async script. Returns
+        {"value", "ok": order reached, "applied": select found, "reason",
+         "before": names before, "after": names after, "prices": prices after,
+         "elapsed": seconds spent in the page}.
+        "applied" is False when the page has no select or `value` is not one of its options.
+        Does not raise when the order is wrong (e.g. problem_user); check "ok".
+        Keep `timeout` below the driver's script timeout (30s by default).
+        """
+        logger.debug("↕️ Sorting by '%s' and verifying the order in the page...", value)
+        self.wait_loaded()
+        result = self.driver.execute_async_script(
+            _SORT_JS, self._sort_select_css, self._inventory_items[1], self._item_name, self._item_price,
+            value, int(timeout * 1000)
+        )
+        if result["ok"]:
+            logger.info("✅ Sorted by '%s' in %.0f ms.", value, result['elapsed'] * 1000)
+        else:
+            logger.warning("❌ Sort '%s' not verified: %s.", value, result['reason'])
+        return result
+
     def sort_by(self, value: str):
         """
         Select a sort option by its value.
-        Valid values (as per Sauce Demo): 'az', 'za', 'lohi', 'hilo'
+        Valid values (as per Sauce Demo): 'az', 'za', 'lohi', 'hilo'; anything
+        else raises ValueError.
+
+        Tries sort_and_verify() first (one script) and returns its result; a
+        sort the page did not carry out (e.g. problem_user) is logged as an
+        error. Only when the page has no usable select does it use the
+        step-by-step path below (which returns None).
 
         Robustness strategy:
           1) Page scroll: bottom -> top to stabilize layout/focus (helps Edge)
           2) Locate select via JS querySelector with retries
           3) Scroll the select into view
-          4) Try Selenium Select; if it fails, fallback to JS (set value + dispatch 'change')
+          4) Selenium Select or JS (set value + dispatch 'change'), learned order (utilis/actions.py)
           5) Re-wait inventory container and (optionally) names change
         """
-        print(f"↕️ Applying sort value: '{value}' ...")
+        try:
+            result = self.sort_and_verify(value)
+        except Exception as e:
+            logger.warning("⚠️ In-page sort failed (%s); falling back to the select.", e)
+        else:
+            if result["reason"] == "unknown sort value":
+                raise ValueError(f"Unknown sort value: {value!r} (expected one of 'az', 'za', 'lohi', 'hilo')")
+            if result["applied"]:
+                if not result["ok"]:
+                    logger.error("❌ Sort '%s' was applied but the order was not reached: %s", value, result["after"])
+                return result
+        logger.debug("↕️ Applying sort value: '%s' ...", value)
 
-        # Capture names before sort (to optionally detect change)
-        before_names = self.get_item_names()
+        # Capture the list text before sort (to optionally detect change)
+        self.wait_loaded()
+        before_text = probe(self.driver, self._inventory_list)["text"]
 
         # 1) Page scroll bottom → top (stabilizes clickability/layout)
         try:
@@ -195,68 +385,47 @@ class InventoryPage:
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", select_el)
         except Exception:
             pass
-        # 4) Prefer Selenium Select; if fails, JS fallback
-        try:
-            try:
-                self.wait.until(EC.element_to_be_clickable(("css selector", self._sort_select_css)))
-            except Exception:
-                print("ℹ️ Sort select not reported clickable; proceeding anyway.")
-
-            from selenium.webdriver.support.ui import Select
-            Select(select_el).select_by_value(value)
-            print("✅ Sorting applied via Selenium Select.")
-        except Exception as e:
-            print(f"⚠️ Selenium Select failed ({e}); applying JS set + change event.")
-            try:
-                self.driver.execute_script(
-                    """
-                    const sel = arguments[0];
-                    const val = arguments[1];
-                    sel.value = val;
-                    sel.dispatchEvent(new Event('change', {bubbles: true}));
-                    """,
-                    select_el, value
-                )
-                print("✅ Sorting applied via JS fallback.")
-            except Exception as js_e:
-                print(f"❌ JS fallback failed: {js_e}")
-                raise
+        # 4) Selenium Select or JS set + change, in the order learned for this browser
+        self.actions.select_by_value(("css selector", self._sort_select_css), value)
+        logger.info("✅ Sorting applied.")
 
         # 5) Re-wait container and (optionally) list change
         try:
-            self.wait.until(EC.visibility_of_element_located(self._inventory_container))
+            self.wait.until(waits.visibility_of_element_located(self._inventory_container))
         except Exception:
             pass
 
         try:
-            WebDriverWait(self.driver, 4).until(lambda d: self.get_item_names() != before_names)
+            EventWait(self.driver, 4).until(waits.text_to_change(self._inventory_list, before_text))
         except Exception:
             # Small datasets may not visibly reorder for some sorts; tolerate
             pass
-        print("✅ Sorting applied (finalized).")
+        logger.info("✅ Sorting applied (finalized).")
 
     def open_product_by_name(self, name: str) -> bool:
         """
         Click on the product name link to open the Product Details page.
         Returns True if navigation triggered, False if not found.
         """
-        self.wait_loaded()
-        print(f"🔗 Opening product details for '{name}' ...")
-        cards = self.driver.find_elements(*self._inventory_items)
-        for card in cards:
-            try:
-                link = card.find_element("css selector", self._item_name)
-                if link.text.strip() == name:
-                    link.click()
-                    print(f"✅ Navigated to details for '{name}'.")
-                    return True
-            except Exception:
-                continue
-        print(f"❌ Could not find '{name}' to open details.")
+        logger.debug("🔗 Opening product details for '%s' ...", name)
+        card = self._find_card(name)
+        if card:
+            card["link"].click()
+            logger.info("✅ Navigated to details for '%s'.", name)
+            return True
+        logger.warning("❌ Could not find '%s' to open details.", name)
         return False
 
     def open_cart(self):
         """Open the Cart page by clicking the cart icon in the header."""
-        print("🧭 Navigating to Cart page...")
-        self.wait.until(EC.element_to_be_clickable(self._cart_link)).click()
-        print("✅ Cart page opened.")
\ No newline at end of file
+        logger.debug("🧭 Navigating to Cart page...")
+        self.wait.until(waits.element_to_be_clickable(self._cart_link)).click()
+        logger.info("✅ Cart page opened.")
+
+    # ===========================
+    # Visual baseline
+    # ===========================
+    def check_visual(self, name: str = "inventory") -> dict | None:
+        """Compare the inventory grid with its baseline (see utilis/visual.py); the cart badge is ignored."""
+        self.wait_loaded()
+        return visual.check(self.driver, name, ignore=[self._cart_badge])
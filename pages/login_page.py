@@ -1,14 +1,18 @@
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from utilis import waits
+from utilis.fast_fill import fill
+from utilis.tracing import traced
+from utilis.waits import EventWait
 
+@traced
 class LoginPage:
     """
     Sauce Demo login page object (no By import).
+    Typing goes through utilis.fast_fill (one script per field with --fast-fill).
     """
 
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 15)
+        self.wait = EventWait(driver, 15)
 
         # Locators using string strategies
         self.username_input = ("id", "user-name")
@@ -18,17 +22,15 @@ class LoginPage:
         self.inventory_container = ("id", "inventory_container")
 
     def enter_username(self, username: str):
-        elem = self.wait.until(EC.presence_of_element_located(self.username_input))
-        elem.clear()
-        elem.send_keys(username)
+        elem = self.wait.until(waits.presence_of_element_located(self.username_input))
+        fill(self.driver, elem, username)
 
     def enter_password(self, password: str):
-        elem = self.wait.until(EC.presence_of_element_located(self.password_input))
-        elem.clear()
-        elem.send_keys(password)
+        elem = self.wait.until(waits.presence_of_element_located(self.password_input))
+        fill(self.driver, elem, password)
 
     def click_login(self):
-        self.wait.until(EC.element_to_be_clickable(self.login_button)).click()
+        self.wait.until(waits.element_to_be_clickable(self.login_button)).click()
 
     def login(self, username: str, password: str):
         self.enter_username(username)
@@ -37,12 +39,12 @@ class LoginPage:
 
     def get_error_message(self) -> str:
         try:
-            return self.wait.until(EC.visibility_of_element_located(self.error_message)).text
+            return self.wait.until(waits.visibility_of_element_located(self.error_message)).text
         except Exception:
             return ""
 
     def is_login_button_displayed(self) -> bool:
         try:
-            return self.wait.until(EC.presence_of_element_located(self.login_button)).is_displayed()
+            return self.wait.until(waits.presence_of_element_located(self.login_button)).is_displayed()
         except Exception:
             return False
\ No newline at end of file
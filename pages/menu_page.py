@@ -1,7 +1,14 @@
 # pages/menu_page.py
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from utilis import waits
+from utilis.actions import ActionExecutor
+from utilis.logger import get_logger
+from utilis.probe import badge_count, probe
+from utilis.tracing import traced
+from utilis.waits import EventWait
 
+logger = get_logger(__name__)
+
+@traced
 class MenuPage:
     """
     Sauce Demo Burger Menu (left side) — XPath-only POM
@@ -10,7 +17,8 @@ class MenuPage:
 
     def __init__(self, driver, timeout: int = 15):
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        self.wait = EventWait(driver, timeout)
+        self.actions = ActionExecutor(driver, timeout)
 
         # --- Header / Buttons ---
         self._burger_btn_x   = ("xpath", "//button[@id='react-burger-menu-btn']")
@@ -29,23 +37,12 @@ class MenuPage:
     # Helpers
     # -------------------------
     def _safe_click(self, locator):
-        """Click with scroll + JS fallback (for click interception)."""
-        el = self.wait.until(EC.presence_of_element_located(locator))
-        try:
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-        except Exception:
-            pass
-        try:
-            self.wait.until(EC.element_to_be_clickable(locator)).click()
-        except Exception:
-            self.driver.execute_script("arguments[0].click();", el)
+        """Click with scroll + JS fallback (for click interception); learned order, see utilis/actions.py."""
+        self.actions.click(locator)
 
     def _is_present_and_displayed(self, locator) -> bool:
-        try:
-            el = self.driver.find_element(*locator)
-            return el.is_displayed()
-        except Exception:
-            return False
+        # probe: no implicit wait when the element is legitimately missing
+        return probe(self.driver, locator)["displayed"]
 
     # -------------------------
     # State
@@ -59,52 +56,48 @@ class MenuPage:
 
     def get_cart_badge_count(self) -> int:
         """Return cart badge (0 if hidden)."""
-        try:
-            el = self.driver.find_element(*self._cart_badge_x)
-            return int(el.text.strip())
-        except Exception:
-            return 0
+        return badge_count(self.driver, self._cart_badge_x)
 
     # -------------------------
     # Actions
     # -------------------------
     def open_menu(self):
-        print("🍔 Opening menu…")
+        logger.debug("🍔 Opening menu…")
         self._safe_click(self._burger_btn_x)
         # wait for a menu item to be visible
-        self.wait.until(EC.visibility_of_element_located(self._all_items_x))
-        print("✅ Menu opened.")
+        self.wait.until(waits.visibility_of_element_located(self._all_items_x))
+        logger.info("✅ Menu opened.")
 
     def close_menu(self):
-        print("❎ Closing menu…")
+        logger.debug("❎ Closing menu…")
         self._safe_click(self._close_btn_x)
         # wait until the menu is closed
         self.wait.until(lambda d: self.is_closed())
-        print("✅ Menu closed.")
+        logger.info("✅ Menu closed.")
 
     def click_all_items(self):
-        print("📦 Clicking 'All Items'…")
+        logger.debug("📦 Clicking 'All Items'…")
         if not self.is_open():
             self.open_menu()
         self._safe_click(self._all_items_x)
-        print("➡️ Navigating to Inventory via All Items…")
+        logger.debug("➡️ Navigating to Inventory via All Items…")
 
     def click_about(self):
-        print("ℹ️ Clicking 'About'…")
+        logger.debug("ℹ️ Clicking 'About'…")
         if not self.is_open():
             self.open_menu()
         self._safe_click(self._about_x)
-        print("➡️ Navigating to external About (Sauce Labs)…")
+        logger.debug("➡️ Navigating to external About (Sauce Labs)…")
 
     def click_logout(self):
-        print("🚪 Clicking 'Logout'…")
+        logger.debug("🚪 Clicking 'Logout'…")
         if not self.is_open():
             self.open_menu()
         self._safe_click(self._logout_x)
-        print("➡️ Logged out / Navigating to login page…")
+        logger.debug("➡️ Logged out / Navigating to login page…")
 
     def click_reset_app_state(self):
-        print("🧹 Clicking 'Reset App State'…")
+        logger.debug("🧹 Clicking 'Reset App State'…")
         if not self.is_open():
             self.open_menu()
         self._safe_click(self._reset_x)
@@ -113,9 +106,9 @@ class MenuPage:
             self.close_menu()
         except Exception:
             pass
-        print("✅ App state reset.")
+        logger.info("✅ App state reset.")
 
     def open_cart(self):
-        print("🛒 Opening Cart from header…")
+        logger.debug("🛒 Opening Cart from header…")
         self._safe_click(self._cart_link_x)
-        print("➡️ Cart opened.")
\ No newline at end of file
+        logger.debug("➡️ Cart opened.")
\ No newline at end of file
@@ -1,8 +1,14 @@
 # pages/product_details_page.py
 from urllib.parse import urlparse, parse_qs
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from utilis import visual, waits
+from utilis.logger import get_logger
+from utilis.probe import badge_count, probe
+from utilis.tracing import traced
+from utilis.waits import EventWait
 
+logger = get_logger(__name__)
+
+@traced
 class ProductDetailsPage:
     """
     Sauce Demo Product Details Page Object
@@ -13,7 +19,7 @@ class ProductDetailsPage:
 
     def __init__(self, driver, timeout: int = 12):
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        self.wait = EventWait(driver, timeout)
 
         # ----- XPath Locators -----
         self._title_x = ("xpath", "//div[contains(@class,'inventory_details_name')]")
@@ -30,9 +36,9 @@ class ProductDetailsPage:
     # ===========================
     def wait_loaded(self):
         """Wait until the details title is visible."""
-        print("🕒 Waiting for Product Details page to load...")
-        self.wait.until(EC.visibility_of_element_located(self._title_x))
-        print("✅ Details page is visible.")
+        logger.debug("🕒 Waiting for Product Details page to load...")
+        self.wait.until(waits.visibility_of_element_located(self._title_x))
+        logger.debug("✅ Details page is visible.")
 
     # ===========================
     # URL helpers
@@ -47,7 +53,7 @@ class ProductDetailsPage:
         parsed = urlparse(url)
         q = parse_qs(parsed.query)
         item_id = q.get("id", [None])[0]
-        print(f"🔗 URL: {url} | item_id={item_id}")
+        logger.debug("🔗 URL: %s | item_id=%s", url, item_id)
         return item_id
 
     # ===========================
@@ -56,27 +62,27 @@ class ProductDetailsPage:
     def get_title(self) -> str:
         self.wait_loaded()
         text = self.driver.find_element(*self._title_x).text.strip()
-        print(f"🏷  Title: {text}")
+        logger.debug("🏷  Title: %s", text)
         return text
 
     def get_description(self) -> str:
         self.wait_loaded()
         text = self.driver.find_element(*self._desc_x).text.strip()
-        print(f"📝 Description: {text[:80]}{'...' if len(text) > 80 else ''}")
+        logger.debug("📝 Description: %s%s", text[:80], '...' if len(text) > 80 else '')
         return text
 
     def get_price(self) -> float:
         self.wait_loaded()
         raw = self.driver.find_element(*self._price_x).text.strip()  # e.g., "$29.99"
         price = float(raw.replace("$", ""))
-        print(f"💲 Price: {price}")
+        logger.debug("💲 Price: %s", price)
         return price
 
     def image_src(self) -> str:
         """Return the image src URL."""
         self.wait_loaded()
         src = self.driver.find_element(*self._image_x).get_attribute("src") or ""
-        print(f"🖼  Image src: {src}")
+        logger.debug("🖼  Image src: %s", src)
         return src
 
     def is_image_loaded(self) -> bool:
@@ -88,32 +94,30 @@ class ProductDetailsPage:
         loaded = bool(self.driver.execute_script(
             "return arguments[0].complete && arguments[0].naturalWidth > 0;", img
         ))
-        print(f"🖼  Image loaded? {loaded}")
+        logger.debug("🖼  Image loaded? %s", loaded)
         return loaded
 
     def get_cart_count(self) -> int:
-        """Return the cart badge count; if badge is absent, return 0."""
-        try:
-            badge = self.driver.find_element(*self._cart_badge_x)
-            count = int(badge.text.strip())
-            print(f"🛒 Cart badge: {count}")
-            return count
-        except Exception:
-            print("🛒 Cart badge not visible → treating as 0.")
-            return 0
+        """Return the cart badge count; if badge is absent, return 0 (no implicit wait)."""
+        count = badge_count(self.driver, self._cart_badge_x)
+        if count:
+            logger.debug("🛒 Cart badge: %s", count)
+        else:
+            logger.debug("🛒 Cart badge not visible → treating as 0.")
+        return count
 
     def is_in_cart(self) -> bool:
         """
         Determine if current product is in cart by checking primary button text ("Remove").
         """
         self.wait_loaded()
-        try:
-            btn_text = self.driver.find_element(*self._primary_btn_x).text.strip().lower()
-            in_cart = "remove" in btn_text
-            print(f"🧩 is_in_cart? {in_cart} (button='{btn_text}')")
-            return in_cart
-        except Exception:
+        button = probe(self.driver, self._primary_btn_x)
+        if not button["present"]:
             return False
+        btn_text = (button["text"] or "").lower()
+        in_cart = "remove" in btn_text
+        logger.debug("🧩 is_in_cart? %s (button='%s')", in_cart, btn_text)
+        return in_cart
 
     # ===========================
     # Actions
@@ -127,10 +131,10 @@ class ProductDetailsPage:
         btn = self.driver.find_element(*self._primary_btn_x)
         label = btn.text.strip().lower()
         if "add to cart" in label:
-            print("➕ Clicking 'Add to cart'...")
+            logger.debug("➕ Clicking 'Add to cart'...")
             btn.click()
             return True
-        print(f"ℹ️ Not adding. Button label is '{label}' (already in cart?).")
+        logger.info("ℹ️ Not adding. Button label is '%s' (already in cart?).", label)
         return False
 
     def remove_from_cart(self) -> bool:
@@ -142,10 +146,10 @@ class ProductDetailsPage:
         btn = self.driver.find_element(*self._primary_btn_x)
         label = btn.text.strip().lower()
         if "remove" in label:
-            print("➖ Clicking 'Remove'...")
+            logger.debug("➖ Clicking 'Remove'...")
             btn.click()
             return True
-        print(f"ℹ️ Not removing. Button label is '{label}' (not in cart?).")
+        logger.info("ℹ️ Not removing. Button label is '%s' (not in cart?).", label)
         return False
 
     def toggle_add_remove(self) -> str:
@@ -159,17 +163,25 @@ class ProductDetailsPage:
         # Wait for label to change
         self.wait.until(lambda d: d.find_element(*self._primary_btn_x).text.strip() != before)
         after = self.driver.find_element(*self._primary_btn_x).text.strip()
-        print(f"🔁 Toggled button: '{before}' -> '{after}'")
+        logger.debug("🔁 Toggled button: '%s' -> '%s'", before, after)
         return after
 
     def back_to_products(self):
         """Click 'Back to products' and return to inventory page."""
-        print("🔙 Clicking 'Back to products'...")
-        self.wait.until(EC.element_to_be_clickable(self._back_btn_x)).click()
-        print("✅ Back to products clicked.")
+        logger.debug("🔙 Clicking 'Back to products'...")
+        self.wait.until(waits.element_to_be_clickable(self._back_btn_x)).click()
+        logger.info("✅ Back to products clicked.")
 
     def open_cart_from_header(self):
         """Open the cart page by clicking the cart icon in the header."""
-        print("🧭 Opening Cart from header...")
-        self.wait.until(EC.element_to_be_clickable(self._cart_link_x)).click()
-        print("✅ Cart page opened from header.")
+        logger.debug("🧭 Opening Cart from header...")
+        self.wait.until(waits.element_to_be_clickable(self._cart_link_x)).click()
+        logger.info("✅ Cart page opened from header.")
+
+    # ===========================
+    # Visual baseline
+    # ===========================
+    def check_visual(self, name: str = "product_details") -> dict | None:
+        """Compare the product details with their baseline (see utilis/visual.py); the cart badge is ignored."""
+        self.wait_loaded()
+        return visual.check(self.driver, name, ignore=[self._cart_badge_x])
@@ -0,0 +1,20 @@
+# tests/conftest.py
+import pytest
+
+from utilis import run_stats
+
+
+@pytest.fixture
+def stats(monkeypatch) -> dict:
+    """
+    {key: amount} of what the code under test adds to run_stats (sections
+    merged); notes are dropped. Keeps unit tests out of the run summary.
+    """
+    counters = {}
+
+    def add(section, key, amount=1):
+        counters[key] = counters.get(key, 0) + amount
+
+    monkeypatch.setattr(run_stats, "add", add)
+    monkeypatch.setattr(run_stats, "note", lambda section, line: None)
+    return counters
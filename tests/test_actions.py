@@ -0,0 +1,83 @@
+# tests/test_actions.py
+import json
+
+import pytest
+
+from utilis import actions
+
+KEY = "chrome | click | id=finish"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    # configure() replaces the module state; monkeypatch puts the session's back afterwards
+    for name in ("_path", "_enabled", "_learned", "_run_counts"):
+        monkeypatch.setattr(actions, name, getattr(actions, name))
+    path = tmp_path / ".action_strategies.json"
+    actions.configure(path, enabled=True)
+    return path
+
+
+def _record(strategy, ok, times=1):
+    for _ in range(times):
+        actions.record(KEY, strategy, ok=ok)
+
+
+class TestActionOrder:
+
+    def test_one_native_failure_keeps_native_first(self, store):
+        _record("native", ok=False)
+        _record("js", ok=True)
+        assert actions.order("click", KEY) == ["native", "js"]
+
+    def test_repeated_native_failures_promote_js(self, store):
+        _record("native", ok=True)
+        _record("native", ok=False, times=actions.PROMOTE_AFTER)
+        _record("js", ok=True, times=actions.PROMOTE_AFTER)
+        assert actions.order("click", KEY) == ["js", "native"]
+
+    def test_native_still_succeeding_is_not_demoted(self, store):
+        _record("native", ok=True, times=5)
+        _record("native", ok=False, times=actions.PROMOTE_AFTER)
+        assert actions.order("click", KEY) == ["native", "js"]
+
+    def test_promoted_js_periodically_retries_native(self, store):
+        _record("native", ok=False, times=actions.PROMOTE_AFTER)
+        orders = []
+        for _ in range(actions.RETRY_EVERY):
+            orders.append(actions.order("click", KEY))
+            _record(orders[-1][0], ok=orders[-1][0] == "js")
+        assert ["native", "js"] in orders
+        assert orders.count(["js", "native"]) == actions.RETRY_EVERY - 1
+
+    def test_old_counts_decay(self, store):
+        _record("native", ok=False, times=actions.HISTORY + 1)
+        actions.save()
+        saved = json.loads(store.read_text(encoding="utf-8"))[KEY]["native"]
+        assert saved["failed"] <= actions.HISTORY
+        # the controller still gets every failure of this run
+        assert actions.learned()[KEY]["native"]["failed"] == actions.HISTORY + 1
+
+    def test_disabled_cache_uses_default_order_and_counts_nothing(self, store):
+        actions.configure(store, enabled=False)
+        _record("native", ok=False, times=actions.PROMOTE_AFTER)
+        assert actions.order("click", KEY) == ["native", "js"]
+        assert actions.learned() == {}
+
+
+class TestActionStore:
+
+    def test_counts_survive_a_run_and_workers_add_up(self, store):
+        _record("native", ok=False, times=2)
+        actions.save()
+        actions.configure(store, enabled=True)
+        assert actions.order("click", KEY) == ["native", "js"]
+        # A worker of the next run reports one more failure: now it is repeated
+        actions.merge({KEY: {"native": {"ok": 0, "failed": 1}}})
+        assert actions.order("click", KEY) == ["js", "native"]
+        assert actions.learned() == {}
+
+    def test_old_file_format_is_ignored(self, store):
+        store.write_text(json.dumps({KEY: "js"}), encoding="utf-8")
+        actions.configure(store, enabled=True)
+        assert actions.order("click", KEY) == ["native", "js"]
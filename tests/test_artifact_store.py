@@ -0,0 +1,117 @@
+# tests/test_artifact_store.py
+import os
+import time
+
+import pytest
+
+from utilis import artifact_store
+
+HOUR = 3600
+
+
+@pytest.fixture
+def root(tmp_path, stats):
+    # `stats`: fake artifacts must not show up in the run summary
+    saved = dict(artifact_store._settings)
+    yield tmp_path / "artifacts"
+    artifact_store._settings.clear()
+    artifact_store._settings.update(saved)
+
+
+def _put(root, run, data, test="tests/test_x.py::test_x"):
+    artifact_store.configure(root, run=run)
+    return artifact_store.put(data, test, "failure")
+
+
+def _age(path, seconds=2 * HOUR):
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+class TestPut:
+
+    def test_same_content_is_stored_once(self, root):
+        first = _put(root, "run-1", b"screenshot")
+        second = _put(root, "run-2", b"screenshot")
+        assert first == second
+        assert len(list((root / "blobs").glob("*/*"))) == 1
+        assert len(list((root / "index").glob("*.jsonl"))) == 2
+
+    def test_unconfigured_run_gets_a_sortable_id(self, root):
+        artifact_store.configure(root, run=None)
+        artifact_store.put(b"screenshot", None, "manual")
+        (index,) = (root / "index").glob("*.jsonl")
+        run = index.name.split("--", 1)[0]
+        assert run == artifact_store.current_run() and run[:8].isdigit()
+        # a later run sorts after it, so gc drops the ad-hoc artifacts first
+        _put(root, "99991231-235959-1", b"later")
+        assert artifact_store.gc(root, keep_runs=1)["runs_dropped"] == [run]
+
+    def test_dedupe_touches_the_blob(self, root):
+        blob = _put(root, "run-1", b"screenshot")
+        _age(blob)
+        _put(root, "run-2", b"screenshot")
+        assert blob.stat().st_mtime > time.time() - 60
+
+
+class TestGc:
+
+    def test_keep_runs_drops_the_oldest_runs_and_their_blobs(self, root):
+        blobs = [_put(root, f"run-{i}", f"shot {i}".encode()) for i in range(3)]
+        for blob in blobs:
+            _age(blob)
+
+        result = artifact_store.gc(root, keep_runs=2)
+
+        assert result["runs_dropped"] == ["run-0"] and result["blobs_removed"] == 1
+        assert [blob.exists() for blob in blobs] == [False, True, True]
+
+    def test_blob_referenced_by_a_kept_run_survives(self, root):
+        shared = _put(root, "run-0", b"same error page")
+        _put(root, "run-1", b"same error page")
+        _age(shared)
+
+        artifact_store.gc(root, keep_runs=1)
+
+        assert shared.exists()
+
+    def test_max_mb_drops_oldest_runs_but_keeps_the_newest(self, root):
+        blobs = [_put(root, f"run-{i}", bytes([i]) * 400_000) for i in range(3)]
+        for blob in blobs:
+            _age(blob)
+
+        result = artifact_store.gc(root, keep_runs=None, max_mb=0.5)
+
+        assert result["runs_dropped"] == ["run-0", "run-1"]
+        assert [blob.exists() for blob in blobs] == [False, False, True]
+        # even when the newest run alone is over the limit
+        assert artifact_store.gc(root, keep_runs=None, max_mb=0.1)["runs_dropped"] == []
+        assert blobs[2].exists()
+
+    def test_recent_unindexed_blobs_and_staging_files_are_kept(self, root):
+        recent = _put(root, "run-0", b"recent")
+        old = _put(root, "run-0", b"old")
+        _age(old)
+        for path in (root / "index").glob("*.jsonl"):
+            path.unlink()
+        staging = root / "staging" / "gw0"
+        staging.mkdir(parents=True)
+        (staging / "new.tmp").write_bytes(b"x")
+        (staging / "old.tmp").write_bytes(b"x")
+        _age(staging / "old.tmp")
+
+        result = artifact_store.gc(root)
+
+        assert result["blobs_removed"] == 1
+        assert recent.exists() and not old.exists()
+        assert (staging / "new.tmp").exists() and not (staging / "old.tmp").exists()
+
+    def test_no_grace_removes_every_unindexed_file(self, root):
+        blob = _put(root, "run-0", b"shot")
+        for path in (root / "index").glob("*.jsonl"):
+            path.unlink()
+
+        artifact_store.gc(root, grace_minutes=0)
+
+        assert not blob.exists()
+        assert not any((root / "blobs").iterdir())
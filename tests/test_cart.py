@@ -4,45 +4,32 @@ import allure
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 from pages.cart_page import CartPage
 from pages.base_page import BasePage
+from utilis.cart_state import cart_badge_matches
+from utilis.logger import get_logger
+
+logger = get_logger(__name__)
 
 @pytest.mark.usefixtures("driver")
 class TestCart:
 
     @pytest.fixture(autouse=True)
-    def setup(self, driver, base_url, request):
+    def setup(self, logged_in_driver, request):
         """
-        - Open base URL
-        - Wait for login inputs (refresh once if needed)
-        - Login with standard_user
+        - Start logged in as standard_user (session cookie, no login form)
         - Land on Inventory page
         - After each test, take a screenshot
         """
-        self.driver = driver
+        self.driver = logged_in_driver
         self.base_page = BasePage(self.driver)
-        self.login = LoginPage(self.driver)
         self.inventory = InventoryPage(self.driver)
         self.cart = CartPage(self.driver)
 
-        print("🌐 Opening base URL and logging in...")
-        self.driver.get(base_url)
-
-        # Guard first paint for stability
-        try:
-            WebDriverWait(self.driver, 12).until(EC.presence_of_element_located(("id", "user-name")))
-            WebDriverWait(self.driver, 12).until(EC.presence_of_element_located(("id", "password")))
-        except Exception:
-            self.driver.refresh()
-            WebDriverWait(self.driver, 12).until(EC.presence_of_element_located(("id", "user-name")))
-            WebDriverWait(self.driver, 12).until(EC.presence_of_element_located(("id", "password")))
-
-        self.login.login("standard_user", "secret_sauce")
-        WebDriverWait(self.driver, 12).until(EC.url_contains("inventory.html"))
+        # logged_in_driver already injected the session cookie and opened inventory.html
         self.inventory.wait_loaded()
-        print("✅ Logged in and on Inventory page.")
+        logger.info("✅ Logged in and on Inventory page.")
         yield
         try:
             self.base_page.take_screenshot(request.node.name)
@@ -78,6 +65,11 @@ class TestCart:
         # Badge may update immediately or after nav; allow >=1
         assert self.cart.get_cart_count() >= 1
 
+        # Visual baseline (--visual; None when off or batched to the end of the run)
+        result = self.cart.check_visual()
+        if result is not None:
+            assert result["ok"], f"Cart differs from {result['baseline']}: {result.get('reason') or result['diff']}"
+
     @allure.story("Continue shopping returns to inventory and allows new add")
     def test_continue_shopping_navigate_and_add(self):
         first = "Sauce Labs Bolt T-Shirt"
@@ -110,7 +102,7 @@ class TestCart:
 
         # Clear everything (safe if already empty)
         removed = self.cart.clear_cart()
-        print(f"Removed count reported: {removed}")
+        logger.debug("Removed count reported: %s", removed)
 
         # Verify empty
         items = self.cart.get_cart_items()
@@ -124,15 +116,17 @@ class TestCart:
         self.inventory.wait_loaded()
 
     @allure.story("Checkout button navigates to step one page")
+    @pytest.mark.cart("Sauce Labs Backpack")
     def test_checkout_navigates_to_step_one(self):
-        assert self.inventory.add_to_cart_by_name("Sauce Labs Backpack")
+        # Cart is seeded through localStorage by logged_in_driver
+        assert cart_badge_matches(self.driver, ["Sauce Labs Backpack"])
         self.inventory.open_cart()
         self.cart.wait_loaded()
 
         # Checkout
         self.cart.checkout()
         WebDriverWait(self.driver, 10).until(EC.url_contains("checkout-step-one.html"))
-        print("🧾 On Checkout Step One page.")
+        logger.debug("🧾 On Checkout Step One page.")
 
         # Navigate back to cart and continue shopping to restore baseline
         self.driver.back()
@@ -1,53 +1,41 @@
 # tests/test_checkout_complete_e2e.py
-import math
 import pytest
 import allure
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from pages.base_page import BasePage
-from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 from pages.cart_page import CartPage
 from pages.checkout_complete_page import CheckoutCompletePage
+from pages.checkout_step_one_page import CheckoutStepOnePage
+from pages.checkout_step_two_page import CheckoutStepTwoPage
+from utilis.cart_state import cart_badge_matches
+from utilis.logger import get_logger
 
-def _float_eq(a: float, b: float, tol: float = 1e-2) -> bool:
-    return math.isclose(a, b, rel_tol=0, abs_tol=tol)
+logger = get_logger(__name__)
 
 @pytest.mark.usefixtures("driver")
 class TestCheckoutCompleteE2E:
 
     @pytest.fixture(autouse=True)
-    def setup(self, driver, base_url, request):
+    def setup(self, logged_in_driver, request):
         """
-        - Open base URL
-        - Guard login inputs (refresh once if needed)
-        - Login and land on Inventory
+        - Start logged in as standard_user (session cookie, no login form)
+        - Land on Inventory
         - After each test, take a screenshot
         """
-        self.driver = driver
+        self.driver = logged_in_driver
         self.base_page = BasePage(self.driver)
-        self.login = LoginPage(self.driver)
         self.inventory = InventoryPage(self.driver)
         self.cart = CartPage(self.driver)
+        self.step_one = CheckoutStepOnePage(self.driver)
+        self.step_two = CheckoutStepTwoPage(self.driver)
         self.complete = CheckoutCompletePage(self.driver)
 
-        print("🌐 Opening base URL and logging in...")
-        self.driver.get(base_url)
-
-        # Guard first paint of login inputs (stability)
-        try:
-            WebDriverWait(self.driver, 12).until(EC.presence_of_element_located(("id", "user-name")))
-            WebDriverWait(self.driver, 12).until(EC.presence_of_element_located(("id", "password")))
-        except Exception:
-            self.driver.refresh()
-            WebDriverWait(self.driver, 12).until(EC.presence_of_element_located(("id", "user-name")))
-            WebDriverWait(self.driver, 12).until(EC.presence_of_element_located(("id", "password")))
-
-        self.login.login("standard_user", "secret_sauce")
-        WebDriverWait(self.driver, 12).until(EC.url_contains("inventory.html"))
+        # logged_in_driver already injected the session cookie and opened inventory.html
         self.inventory.wait_loaded()
-        print("✅ Logged in and on Inventory page.")
+        logger.info("✅ Logged in and on Inventory page.")
 
         yield
         try:
@@ -56,110 +44,53 @@ class TestCheckoutCompleteE2E:
             pass
 
     @allure.story("Add two items, verify price + tax + total, finish checkout, and go back home")
+    @pytest.mark.cart("Sauce Labs Backpack", "Sauce Labs Bike Light")
     def test_complete_checkout_two_items_verify_totals_and_back(self):
-        # 1) Add two items
+        # 1) Two items were seeded into the cart by logged_in_driver
         items = ["Sauce Labs Backpack", "Sauce Labs Bike Light"]
-        for name in items:
-            print(f"👜 Adding item: {name}")
-            assert self.inventory.add_to_cart_by_name(name), f"Failed adding '{name}'"
-        print(f"🛒 Cart badge after add: {self.inventory.get_cart_count()}")
+        assert cart_badge_matches(self.driver, items), "Cart badge should match the seeded cart"
+        logger.debug("🛒 Cart badge after seeding: %s", self.inventory.get_cart_count())
 
         # 2) Go to Cart
         self.inventory.open_cart()
         self.cart.wait_loaded()
 
-        # 3) Checkout (Step One) — XPath inline (no POM for step 1/2)
-        print("🧭 Proceeding to Checkout Step One...")
+        # 3) Checkout (Step One)
+        logger.debug("🧭 Proceeding to Checkout Step One...")
         checkout_btn_x = ("xpath", "//button[@id='checkout']")
         WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(checkout_btn_x)).click()
-        WebDriverWait(self.driver, 10).until(EC.url_contains("checkout-step-one.html"))
-
-        # Fill Step One
-        print("📝 Filling Step One (Your Information)...")
-        first_x = ("xpath", "//input[@id='first-name']")
-        last_x  = ("xpath", "//input[@id='last-name']")
-        postal_x= ("xpath", "//input[@id='postal-code']")
-        cont_x  = ("xpath", "//input[@id='continue' or @data-test='continue']")
-
-        WebDriverWait(self.driver, 10).until(EC.presence_of_element_located(first_x)).send_keys("Amisha")
-        WebDriverWait(self.driver, 10).until(EC.presence_of_element_located(last_x)).send_keys("Nath")
-        WebDriverWait(self.driver, 10).until(EC.presence_of_element_located(postal_x)).send_keys("560001")
-        # click continue with scroll/JS safety
-        cont_btn = WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(cont_x))
-        try:
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", cont_btn)
-        except Exception:
-            pass
-        try:
-            cont_btn.click()
-        except Exception as e:
-            print(f"⚠️ Continue normal click failed: {e}; trying JS click...")
-            self.driver.execute_script("arguments[0].click();", cont_btn)
-
-        # 4) Step Two — Verify prices + tax + total
-        WebDriverWait(self.driver, 10).until(EC.url_contains("checkout-step-two.html"))
-        print("🧮 Verifying line prices, item total, tax, and grand total...")
-
-        # Collect line prices
-        price_cells_x = ("xpath", "//div[contains(@class,'inventory_item_price')]")
-        price_elems = WebDriverWait(self.driver, 10).until(EC.presence_of_all_elements_located(price_cells_x))
-        line_prices = []
-        for el in price_elems:
-            try:
-                line_prices.append(float(el.text.strip().replace("$", "")))
-            except Exception:
-                pass
-        print(f"💵 Line item prices: {line_prices}")
-        computed_item_total = round(sum(line_prices), 2)
-
-        # Read summary labels
-        item_total_x = ("xpath", "//div[contains(@class,'summary_subtotal_label')]")
-        tax_x        = ("xpath", "//div[contains(@class,'summary_tax_label')]")
-        total_x      = ("xpath", "//div[contains(@class,'summary_total_label')]")
-
-        def _parse_amount(text: str) -> float:
-            try:
-                return float(text.split("$")[-1].strip())
-            except Exception:
-                return 0.0
-
-        item_total_val = _parse_amount(WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(item_total_x)).text.strip())
-        tax_val = _parse_amount(WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(tax_x)).text.strip())
-        total_val = _parse_amount(WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(total_x)).text.strip())
-
-        print(f"🧾 Summary -> Item total: {item_total_val}, Tax: {tax_val}, Total: {total_val}")
-        print(f"🧮 Computed item total from lines: {computed_item_total}")
-
-        assert _float_eq(item_total_val, computed_item_total), \
-            f"Item total mismatch. Summary={item_total_val}, Computed={computed_item_total}"
-        assert _float_eq(total_val, round(item_total_val + tax_val, 2)), \
-            f"Grand total mismatch. Summary={total_val}, Computed={round(item_total_val + tax_val, 2)}"
+        self.step_one.wait_loaded()
+
+        # Fill Step One (utilis.fast_fill: one script for the whole form)
+        filled = self.step_one.fill_info("Amisha", "Nath", "560001")
+        assert filled == {"first_name": "Amisha", "last_name": "Nath", "postal_code": "560001"}, \
+            f"Step One fields not filled: {filled}"
+        self.step_one.continue_checkout()
+
+        # 4) Step Two — Verify prices + tax + total (one script, Decimal arithmetic)
+        logger.debug("🧮 Verifying line prices, item total, tax, and grand total...")
+        summary = self.step_two.get_summary()
+        assert sorted(line["name"] for line in summary["lines"]) == sorted(items), f"Unexpected lines: {summary['lines']}"
+        assert summary["item_total_ok"], \
+            f"Item total mismatch. Summary={summary['item_total']}, Computed={summary['computed_item_total']}"
+        assert summary["total_ok"], \
+            f"Grand total mismatch. Summary={summary['total']}, Computed={summary['item_total']} + {summary['tax']}"
 
         # 5) Finish checkout
-        print("✅ Clicking Finish...")
-        finish_btn_x = ("xpath", "//button[@id='finish']")
-        try:
-            btn = WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(finish_btn_x))
-            try:
-                self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn)
-            except Exception:
-                pass
-            btn.click()
-        except Exception as e:
-            print(f"⚠️ Finish normal click failed: {e}; trying JS click...")
-            btn = self.driver.find_element(*finish_btn_x)
-            self.driver.execute_script("arguments[0].click();", btn)
+        self.step_two.finish()
 
         # 6) Validate Checkout Complete and go back home
         WebDriverWait(self.driver, 10).until(EC.url_contains("checkout-complete.html"))
         self.complete.wait_loaded()
         assert self.complete.is_thank_you_visible() is True, "Thank-you header should be visible"
-        print("🎉 Checkout complete page validated.")
+        logger.debug("🎉 Checkout complete page validated.")
+
+        # Visual baseline (--visual; None when off or batched to the end of the run)
+        result = self.complete.check_visual()
+        if result is not None:
+            assert result["ok"], f"Thank-you page differs from {result['baseline']}: {result.get('reason') or result['diff']}"
 
         self.complete.back_home()
         WebDriverWait(self.driver, 10).until(EC.url_contains("inventory.html"))
         self.inventory.wait_loaded()
-        print("🏠 Back on Inventory page.")
\ No newline at end of file
+        logger.debug("🏠 Back on Inventory page.")
\ No newline at end of file
@@ -0,0 +1,107 @@
+# tests/test_command_stats.py
+import json
+
+import pytest
+
+from utilis import command_stats
+
+
+class _Driver:
+    def execute(self, command, params=None):
+        return None
+
+
+@pytest.fixture
+def driver(monkeypatch, stats):
+    monkeypatch.setattr(command_stats, "_active", None)
+    monkeypatch.setattr(command_stats, "_results", {})
+    driver = _Driver()
+    command_stats.install(driver)
+    return driver
+
+
+def _helper_sends(driver, command):
+    driver.execute(command, {})
+
+
+class TestCommandTally:
+
+    def test_commands_are_attributed_to_the_test(self, driver):
+        command_stats.start("tests/test_x.py::test_commands_are_attributed_to_the_test")
+        driver.execute("findElement", {})
+        driver.execute("findElement", {})
+        _helper_sends(driver, "clickElement")
+        done = command_stats.finish()
+
+        assert done.count == 3
+        callers = {(caller, command): count for (caller, command), (count, _) in done.rows.items()}
+        assert callers == {
+            ("test: test_commands_are_attributed_to_the_test", "findElement"): 2,
+            # innermost test-file frame wins, like a page method would
+            ("test: _helper_sends", "clickElement"): 1,
+        }
+
+    def test_summary_counts_only_tests_that_sent_commands(self, driver, stats):
+        command_stats.start("t::unit")
+        command_stats.finish()
+        assert stats == {}
+        command_stats.start("t::browser")
+        driver.execute("getTitle", {})
+        command_stats.finish()
+        assert stats["commands"] == 1
+
+    def test_nothing_is_counted_outside_a_test(self, driver):
+        driver.execute("findElement", {})
+        assert command_stats.finish() is None
+        assert command_stats.results() == {}
+
+    def test_finished_tests_are_kept_for_the_report(self, driver):
+        command_stats.start("t::a", budget=5)
+        driver.execute("getTitle", {})
+        command_stats.finish()
+        assert command_stats.results()["t::a"]["commands"] == 1
+        assert command_stats.results()["t::a"]["budget"] == 5
+
+    def test_install_twice_counts_once(self, driver):
+        command_stats.install(driver)
+        command_stats.start("t::a")
+        driver.execute("getTitle", {})
+        assert command_stats.finish().count == 1
+
+
+class TestBudget:
+
+    def _run(self, driver, commands, budget):
+        command_stats.start("t::a", budget=budget)
+        for _ in range(commands):
+            driver.execute("findElement", {})
+        return command_stats.finish()
+
+    def test_within_budget(self, driver):
+        assert command_stats.over_budget(self._run(driver, 3, budget=3)) is None
+
+    def test_no_budget(self, driver):
+        assert command_stats.over_budget(self._run(driver, 50, budget=None)) is None
+
+    def test_over_budget_names_the_top_callers(self, driver):
+        message = command_stats.over_budget(self._run(driver, 4, budget=3))
+        assert message.startswith("4 WebDriver commands, budget is 3")
+        assert "test: _run findElement x4" in message
+
+
+class TestWriteJson:
+
+    def test_no_commands_writes_nothing(self, driver, tmp_path):
+        command_stats.start("t::unit")
+        command_stats.finish()
+        command_stats.write_json(tmp_path / "command_stats.json")
+        assert not (tmp_path / "command_stats.json").exists()
+
+    def test_results_of_all_workers_are_written(self, driver, tmp_path):
+        command_stats.start("t::a")
+        driver.execute("getTitle", {})
+        command_stats.finish()
+        command_stats.merge({"t::b": {"commands": 2, "seconds": 0.1, "budget": None, "rows": []}})
+        command_stats.write_json(tmp_path / "command_stats.json")
+        data = json.loads((tmp_path / "command_stats.json").read_text(encoding="utf-8"))
+        assert sorted(data) == ["t::a", "t::b"]
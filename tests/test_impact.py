@@ -0,0 +1,142 @@
+# tests/test_impact.py
+import textwrap
+
+import pytest
+
+from utilis import impact
+from utilis.impact import DependencyMap
+
+
+def _write(root, files: dict):
+    for name, text in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(text), encoding="utf-8")
+
+
+@pytest.fixture
+def project(tmp_path):
+    _write(tmp_path, {
+        "pages/__init__.py": "",
+        "pages/login_page.py": """
+            from utilis.helpers import read_users
+            from . import base_page
+            import selenium
+            """,
+        "pages/base_page.py": "import os\n",
+        "pages/other_page.py": "",
+        "utilis/__init__.py": "",
+        "utilis/helpers.py": """
+            \"\"\"Reads "credentials.csv" (see data/README).\"\"\"
+            USERS = "data/users.csv"
+
+            def read_users():
+                \"\"\"Also mentions products.json.\"\"\"
+                return open("data/" + "items.json")
+            """,
+        "data/credentials.csv": "user,password\n",
+        "data/users.csv": "user\n",
+        "data/products.json": "[]\n",
+        "data/items.json": "[]\n",
+        "data/s.csv": "\n",
+        "tests/__init__.py": "",
+        "tests/test_login.py": "from pages.login_page import *\n",
+    })
+    return tmp_path
+
+
+class TestDependencyMap:
+
+    def test_transitive_project_imports(self, project):
+        inputs = DependencyMap(project).inputs(project / "tests" / "test_login.py")
+        assert {"tests/test_login.py", "tests/__init__.py", "pages/__init__.py", "pages/login_page.py",
+                "pages/base_page.py", "utilis/__init__.py", "utilis/helpers.py"} <= set(inputs)
+        assert "pages/other_page.py" not in inputs
+
+    def test_third_party_and_stdlib_are_not_inputs(self, project):
+        deps = DependencyMap(project)
+        assert deps.module_file("selenium") is None
+        assert deps.module_file("os") is None
+        assert deps.module_file("pages.base_page") == project / "pages" / "base_page.py"
+
+    def test_data_file_named_by_a_literal(self, project):
+        inputs = DependencyMap(project).inputs(project / "utilis" / "helpers.py")
+        assert "data/users.csv" in inputs    # a path ending in the file name
+        assert "data/items.json" in inputs   # the file name itself
+
+    def test_docstrings_do_not_name_data_files(self, project):
+        inputs = DependencyMap(project).inputs(project / "utilis" / "helpers.py")
+        assert "data/credentials.csv" not in inputs
+        assert "data/products.json" not in inputs
+
+    def test_file_name_inside_another_literal_does_not_match(self, project):
+        # "data/users.csv" contains "s.csv" but does not name data/s.csv
+        inputs = DependencyMap(project).inputs(project / "utilis" / "helpers.py")
+        assert "data/s.csv" not in inputs
+
+    def test_digest_follows_the_content(self, project):
+        path = project / "data" / "users.csv"
+        before = DependencyMap(project).digest(path)
+        path.write_text("user\nadmin\n", encoding="utf-8")
+        assert DependencyMap(project).digest(path) != before
+        assert DependencyMap(project).digest(project / "data" / "gone.csv") == "missing"
+
+    def test_unparsable_module_has_no_imports(self, project):
+        _write(project, {"pages/broken.py": "def (:\n"})
+        assert DependencyMap(project).direct_inputs(project / "pages" / "broken.py") == {project / "pages" / "__init__.py"}
+
+
+class _Config:
+    def __init__(self, rootpath, **options):
+        self.rootpath = rootpath
+        self.options = {
+            "--browser": "chrome", "--driver-mode": "fresh", "--driver-service": "per-test", "--pace": "ci",
+            "--waits": "event", "--fast-fill": "on", "--action-cache": "on", "--adaptive-timeouts": "off",
+            "--read-cache": "on", "--profile-template": False, "--pool-max-uses": 20,
+            "--visual": "off", "--screenshots": "on-failure", "--visual-baselines": "visual_baselines",
+        }
+        self.options.update(options)
+
+    def getoption(self, name):
+        return self.options[name]
+
+
+class TestImpactSettings:
+
+    def test_local_site_settings_are_part_of_a_pass(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("LOCAL_CATALOG_SIZE", raising=False)
+        small = impact.ImpactSelector(_Config(tmp_path), enabled=True).settings
+        monkeypatch.setenv("LOCAL_CATALOG_SIZE", "10000")
+        large = impact.ImpactSelector(_Config(tmp_path), enabled=True).settings
+        assert small != large
+
+    def test_read_cache_is_part_of_a_pass(self, tmp_path):
+        on = impact.ImpactSelector(_Config(tmp_path), enabled=True).settings
+        selector = impact.ImpactSelector(_Config(tmp_path, **{"--read-cache": "off"}), enabled=True)
+        assert selector.why_run({"settings": on}, {}) == "settings changed: read_cache"
+
+    def test_visual_mode_is_part_of_a_pass(self, tmp_path):
+        off = impact.ImpactSelector(_Config(tmp_path), enabled=True).settings
+        selector = impact.ImpactSelector(_Config(tmp_path, **{"--visual": "check"}), enabled=True)
+        assert selector.why_run({"settings": off}, {}) == "settings changed: visual"
+
+
+class TestImpactBaselines:
+
+    def test_baselines_are_inputs_of_visual_modules_only(self, project):
+        _write(project, {
+            "utilis/visual.py": "",
+            "pages/grid_page.py": "from utilis import visual\n",
+            "tests/test_grid.py": "from pages.grid_page import GridPage\n",
+            "tests/test_plain.py": "import os\n",
+            "visual_baselines/chrome/grid.png": "png",
+            "visual_baselines/chrome/grid.npy": "npy",
+        })
+        selector = impact.ImpactSelector(_Config(project), enabled=True)
+        grid = selector.inputs_for("tests/test_grid.py::test_grid")
+        assert {"visual_baselines/chrome/grid.png", "visual_baselines/chrome/grid.npy"} <= set(grid)
+        assert not any(p.startswith("visual_baselines/") for p in selector.inputs_for("tests/test_plain.py::test_x"))
+
+        (project / "visual_baselines" / "chrome" / "grid.png").write_text("new png", encoding="utf-8")
+        edited = impact.ImpactSelector(_Config(project), enabled=True).inputs_for("tests/test_grid.py::test_grid")
+        assert edited["visual_baselines/chrome/grid.png"] != grid["visual_baselines/chrome/grid.png"]
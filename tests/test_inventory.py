@@ -4,35 +4,32 @@ import allure
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 from pages.base_page import BasePage
+from utilis.logger import get_logger
+
+logger = get_logger(__name__)
 
 @pytest.mark.usefixtures("driver")
 class TestInventory:
 
     @pytest.fixture(autouse=True)
-    def setup(self, driver, base_url, request):
+    def setup(self, logged_in_driver, request):
         """
-        - Open base URL
-        - Login with standard_user
+        - Start logged in as standard_user (session cookie, no login form)
         - Land on Inventory page
         - After each test, take a screenshot (attached to Allure if available)
         """
-        self.driver = driver
+        self.driver = logged_in_driver
         self.base_page = BasePage(self.driver)
-        self.login = LoginPage(self.driver)
         self.inventory = InventoryPage(self.driver)
 
-        print("🌐 Opening base URL and logging in...")
-        self.driver.get(base_url)
-        self.login.login("standard_user", "secret_sauce")
-        WebDriverWait(self.driver, 10).until(EC.url_contains("inventory.html"))
+        # logged_in_driver already injected the session cookie and opened inventory.html
         self.inventory.wait_loaded()
-        print("✅ Logged in and on Inventory page.")
+        logger.info("✅ Logged in and on Inventory page.")
 
         yield
-        # Always capture a screenshot at the end of the test
+        # Screenshot at the end of the test (kept per --screenshots policy; default: failures only)
         try:
             self.base_page.take_screenshot(request.node.name)
         except Exception:
@@ -51,6 +48,11 @@ class TestInventory:
         assert self.inventory.remove_from_cart_by_name(product) is True, "Failed to remove item from cart"
         assert self.inventory.get_cart_count() == 0, "Cart badge should return to 0 after remove"
 
+        # Visual baseline (--visual; None when off or batched to the end of the run)
+        result = self.inventory.check_visual()
+        if result is not None:
+            assert result["ok"], f"Inventory differs from {result['baseline']}: {result.get('reason') or result['diff']}"
+
     @allure.story("Sorting by Name and Price")
     def test_sorting_name_and_price(self):
         # 🔧 Extra nudge: global scroll bottom → top (helps Edge stabilize),
@@ -61,25 +63,26 @@ class TestInventory:
         except Exception:
             pass
 
+        # Each sort is applied and its order checked in one browser round trip
         # Name A→Z
-        self.inventory.sort_by("az")
-        names_az = self.inventory.get_item_names()
-        assert names_az == sorted(names_az), "Names should be sorted ascending (A→Z)"
+        result = self.inventory.sort_and_verify("az")
+        assert result["ok"], f"A→Z sort not reached: {result['reason']}"
+        assert result["after"] == sorted(result["after"]), "Names should be sorted ascending (A→Z)"
 
         # Name Z→A
-        self.inventory.sort_by("za")
-        names_za = self.inventory.get_item_names()
-        assert names_za == sorted(names_za, reverse=True), "Names should be sorted descending (Z→A)"
+        result = self.inventory.sort_and_verify("za")
+        assert result["ok"], f"Z→A sort not reached: {result['reason']}"
+        assert result["after"] == sorted(result["after"], reverse=True), "Names should be sorted descending (Z→A)"
 
         # Price low→high
-        self.inventory.sort_by("lohi")
-        prices_lohi = self.inventory.get_item_prices()
-        assert prices_lohi == sorted(prices_lohi), "Prices should be ascending (low→high)"
+        result = self.inventory.sort_and_verify("lohi")
+        assert result["ok"], f"low→high sort not reached: {result['reason']}"
+        assert result["prices"] == sorted(result["prices"]), "Prices should be ascending (low→high)"
 
         # Price high→low
-        self.inventory.sort_by("hilo")
-        prices_hilo = self.inventory.get_item_prices()
-        assert prices_hilo == sorted(prices_hilo, reverse=True), "Prices should be descending (high→low)"
+        result = self.inventory.sort_and_verify("hilo")
+        assert result["ok"], f"high→low sort not reached: {result['reason']}"
+        assert result["prices"] == sorted(result["prices"], reverse=True), "Prices should be descending (high→low)"
 
     @allure.story("Open product details and navigate back to products")
     def test_open_product_details_and_back(self):
@@ -95,9 +98,9 @@ class TestInventory:
         assert title_el.text.strip() == product, "Product title mismatch on details page"
 
         # Back to inventory
-        print("🔙 Navigating back to products...")
+        logger.debug("🔙 Navigating back to products...")
         back_btn = WebDriverWait(self.driver, 10).until(lambda d: d.find_element("id", "back-to-products"))
         back_btn.click()
         WebDriverWait(self.driver, 10).until(EC.url_contains("inventory.html"))
         self.inventory.wait_loaded()
-        print("✅ Back on Inventory page.")
\ No newline at end of file
+        logger.info("✅ Back on Inventory page.")
\ No newline at end of file
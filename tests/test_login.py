@@ -41,7 +41,7 @@ class TestLogin:
         self.driver.get(base_url)
         # hand control to the test
         yield
-        # 🔽 Always take a screenshot after each test (pass node name for readable file)
+        # 🔽 Screenshot after each test (pass node name for readable file); kept per --screenshots policy
         try:
             self.base_page.take_screenshot(request.node.name)
         except Exception:
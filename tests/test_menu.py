@@ -9,41 +9,32 @@ from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 from pages.cart_page import CartPage
 from pages.menu_page import MenuPage
+from utilis.cart_state import cart_badge_matches
+from utilis.logger import get_logger
+
+logger = get_logger(__name__)
 
 @pytest.mark.usefixtures("driver")
 class TestMenu:
 
     @pytest.fixture(autouse=True)
-    def setup(self, driver, base_url, request):
+    def setup(self, logged_in_driver, request):
         """
-        - Open base URL
-        - Guard login inputs (refresh once if needed)
-        - Login and land on Inventory
+        - Start logged in as standard_user (session cookie, no login form)
+        - Land on Inventory
         - Build POMs
         - Screenshot after each test
         """
-        self.driver = driver
+        self.driver = logged_in_driver
         self.base_page = BasePage(self.driver)
         self.login = LoginPage(self.driver)
         self.inventory = InventoryPage(self.driver)
         self.cart = CartPage(self.driver)
         self.menu = MenuPage(self.driver)
 
-        print("🌐 Opening base URL and logging in…")
-        self.driver.get(base_url)
-
-        try:
-            WebDriverWait(self.driver, 12).until(EC.presence_of_element_located(("id", "user-name")))
-            WebDriverWait(self.driver, 12).until(EC.presence_of_element_located(("id", "password")))
-        except Exception:
-            self.driver.refresh()
-            WebDriverWait(self.driver, 12).until(EC.presence_of_element_located(("id", "user-name")))
-            WebDriverWait(self.driver, 12).until(EC.presence_of_element_located(("id", "password")))
-
-        self.login.login("standard_user", "secret_sauce")
-        WebDriverWait(self.driver, 12).until(EC.url_contains("inventory.html"))
+        # logged_in_driver already injected the session cookie and opened inventory.html
         self.inventory.wait_loaded()
-        print("✅ Logged in and on Inventory page.")
+        logger.info("✅ Logged in and on Inventory page.")
 
         yield
         try:
@@ -59,10 +50,10 @@ class TestMenu:
         assert self.menu.is_closed() is True, "Menu should be closed"
 
     @allure.story("Reset App State clears cart badge and state")
+    @pytest.mark.cart("Sauce Labs Backpack", "Sauce Labs Bike Light")
     def test_reset_app_state_clears_cart(self):
-        # Put some state: add two items
-        assert self.inventory.add_to_cart_by_name("Sauce Labs Backpack")
-        assert self.inventory.add_to_cart_by_name("Sauce Labs Bike Light")
+        # Some state was seeded by logged_in_driver: two items in the cart
+        assert cart_badge_matches(self.driver, ["Sauce Labs Backpack", "Sauce Labs Bike Light"])
         assert self.inventory.get_cart_count() >= 2
 
         # Reset via menu
@@ -105,9 +96,9 @@ class TestMenu:
         # Some networks/headless runs may block external nav; handle gracefully
         try:
             WebDriverWait(self.driver, 10).until(lambda d: "sauce" in d.current_url.lower())
-            print(f"🌍 About URL: {self.driver.current_url}")
+            logger.debug("🌍 About URL: %s", self.driver.current_url)
         except Exception:
-            print("⚠️ Could not verify external 'About' URL (network/headless/CSP). Continuing…")
+            logger.warning("⚠️ Could not verify external 'About' URL (network/headless/CSP). Continuing…")
 
         # Navigate back to inventory (browser back)
         self.driver.back()
@@ -0,0 +1,77 @@
+# tests/test_probe.py
+from types import SimpleNamespace
+
+import pytest
+
+from utilis import probe
+
+BADGE = ("css selector", ".shopping_cart_badge")
+
+
+def _state(present=True, displayed=True, text="1"):
+    return {"count": int(present), "present": present, "displayed": present and displayed,
+            "text": text if present else None, "element": None}
+
+
+class _Driver:
+    """Answers the probe script with the queued page states (the last one repeats)."""
+
+    def __init__(self, *states, implicit_wait=2.0):
+        self.states = list(states)
+        self.calls = []
+        self.timeouts = SimpleNamespace(implicit_wait=implicit_wait)
+
+    def execute_script(self, script, *args):
+        self.calls.append(args)
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+
+@pytest.fixture(autouse=True)
+def fast_poll(monkeypatch):
+    monkeypatch.setattr(probe, "POLL", 0.001)
+
+
+class TestProbe:
+
+    def test_present_element_is_not_a_negative_answer(self, stats):
+        driver = _Driver(_state(text="2"))
+        assert probe.probe(driver, BADGE)["text"] == "2"
+        assert driver.calls == [BADGE]
+        assert stats == {}
+
+    def test_absent_element_counts_the_implicit_wait_saved(self, stats):
+        assert probe.probe(_Driver(_state(present=False)), BADGE)["present"] is False
+        assert stats["negative answers"] == 1
+        assert 1.9 < stats["wait time saved (s)"] <= 2.0
+
+    def test_no_answer_is_absent(self, stats):
+        assert probe.probe(_Driver(None), BADGE) == probe._EMPTY
+
+    def test_implicit_wait_is_asked_once(self, stats):
+        driver = _Driver(_state(present=False))
+        probe.probe(driver, BADGE)
+        driver.timeouts = None
+        probe.probe(driver, BADGE, baseline=None)
+        assert stats["wait time saved (s)"] > 3.8
+
+    def test_badge_count(self, stats):
+        assert probe.badge_count(_Driver(_state(text="3")), BADGE) == 3
+        assert probe.badge_count(_Driver(_state(present=False)), BADGE) == 0
+
+
+class TestNegativeWaits:
+
+    def test_expect_absent_returns_once_nothing_matches(self, stats):
+        driver = _Driver(_state(), _state(), _state(present=False))
+        assert probe.expect_absent(driver, BADGE, timeout=1.0, baseline=10.0) is True
+        assert len(driver.calls) == 3
+        assert stats["negative answers"] == 1 and stats["wait time saved (s)"] > 9.0
+
+    def test_expect_absent_gives_up_after_its_budget(self, stats):
+        assert probe.expect_absent(_Driver(_state()), BADGE, timeout=0.05) is False
+        assert stats == {"negative waits timed out": 1}
+
+    def test_expect_hidden_accepts_a_present_but_hidden_match(self, stats):
+        driver = _Driver(_state(), _state(displayed=False))
+        assert probe.expect_hidden(driver, BADGE, timeout=1.0) is True
+        assert probe.expect_absent(driver, BADGE, timeout=0.05) is False
@@ -4,34 +4,31 @@ import allure
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 from pages.product_details_page import ProductDetailsPage
 from pages.base_page import BasePage
+from utilis.logger import get_logger
+
+logger = get_logger(__name__)
 
 @pytest.mark.usefixtures("driver")
 class TestProductDetails:
 
     @pytest.fixture(autouse=True)
-    def setup(self, driver, base_url, request):
+    def setup(self, logged_in_driver, request):
         """
-        - Open base URL
-        - Login with standard_user
+        - Start logged in as standard_user (session cookie, no login form)
         - Land on Inventory page
         - After each test, take a screenshot (attached to Allure if available)
         """
-        self.driver = driver
+        self.driver = logged_in_driver
         self.base_page = BasePage(self.driver)
-        self.login = LoginPage(self.driver)
         self.inventory = InventoryPage(self.driver)
         self.details = ProductDetailsPage(self.driver)
 
-        print("🌐 Opening base URL and logging in...")
-        self.driver.get(base_url)
-        self.login.login("standard_user", "secret_sauce")
-        WebDriverWait(self.driver, 12).until(EC.url_contains("inventory.html"))
+        # logged_in_driver already injected the session cookie and opened inventory.html
         self.inventory.wait_loaded()
-        print("✅ Logged in and on Inventory page.")
+        logger.info("✅ Logged in and on Inventory page.")
         yield
         try:
             self.base_page.take_screenshot(request.node.name)
@@ -59,6 +56,11 @@ class TestProductDetails:
         assert self.details.get_description() != "", "Description should not be empty"
         assert self.details.get_price() > 0.0, "Price should be positive"
 
+        # Visual baseline (--visual; None when off or batched to the end of the run)
+        result = self.details.check_visual()
+        if result is not None:
+            assert result["ok"], f"Details differ from {result['baseline']}: {result.get('reason') or result['diff']}"
+
     @allure.story("Add on details and verify state persists across back/forward (XPath)")
     def test_add_persists_across_navigation(self):
         product = "Sauce Labs Bike Light"
@@ -72,13 +74,13 @@ class TestProductDetails:
             assert self.details.get_cart_count() == start_badge + 1, "Cart badge should increment"
 
         # Browser back to inventory
-        print("⬅️  Browser back to inventory...")
+        logger.debug("⬅️  Browser back to inventory...")
         self.driver.back()
         WebDriverWait(self.driver, 12).until(EC.url_contains("inventory.html"))
         self.inventory.wait_loaded()
 
         # Browser forward back to details
-        print("➡️  Browser forward back to details...")
+        logger.debug("➡️  Browser forward back to details...")
         self.driver.forward()
         self.details.wait_loaded()
 
@@ -109,7 +111,7 @@ class TestProductDetails:
         # Open Cart via header link from details (XPath inside POM)
         self.details.open_cart_from_header()
         WebDriverWait(self.driver, 12).until(EC.url_contains("cart.html"))
-        print("🧾 On Cart page via header from details.")
+        logger.debug("🧾 On Cart page via header from details.")
 
         # ✅ Use "Continue Shopping" on Cart to return to Inventory (XPath)
         continue_btn = WebDriverWait(self.driver, 12).until(
@@ -133,59 +135,59 @@ class TestProductDetails:
         assert self.inventory.open_product_by_name(product), f"Could not open details for '{product}'"
         self.details.wait_loaded()
         WebDriverWait(self.driver, 10).until(EC.url_contains("inventory-item.html"))
-        print("🔗 On Product Details page.")
+        logger.debug("🔗 On Product Details page.")
 
         # Window controls
         try:
-            print("🧰 Maximizing window...")
+            logger.debug("🧰 Maximizing window...")
             self.driver.maximize_window()
         except Exception as e:
-            print(f"⚠️ maximize_window() failed: {e}")
+            logger.warning("⚠️ maximize_window() failed: %s", e)
 
         try:
-            print("🧰 Minimizing window...")
+            logger.debug("🧰 Minimizing window...")
             self.driver.minimize_window()  # Selenium 4+
         except Exception as e:
-            print(f"⚠️ minimize_window() failed: {e}. Using small size fallback.")
+            logger.warning("⚠️ minimize_window() failed: %s. Using small size fallback.", e)
             try:
                 self.driver.set_window_rect(x=0, y=0, width=300, height=200)
             except Exception as ie:
-                print(f"❌ set_window_rect fallback failed: {ie}")
+                logger.warning("❌ set_window_rect fallback failed: %s", ie)
 
         # Restore and set custom size
         try:
-            print("🧰 Restoring via maximize...")
+            logger.debug("🧰 Restoring via maximize...")
             self.driver.maximize_window()
         except Exception:
             pass
         try:
-            print("🧰 Setting custom window size 1280x800...")
+            logger.debug("🧰 Setting custom window size 1280x800...")
             self.driver.set_window_size(1280, 800)
         except Exception as e:
-            print(f"⚠️ set_window_size failed: {e}")
+            logger.warning("⚠️ set_window_size failed: %s", e)
 
         # Open Cart from header (XPath in POM)
         self.details.open_cart_from_header()
         WebDriverWait(self.driver, 10).until(EC.url_contains("cart.html"))
-        print("🧾 On Cart page.")
+        logger.debug("🧾 On Cart page.")
 
         # Back → should go to Details
-        print("⬅️  Browser back...")
+        logger.debug("⬅️  Browser back...")
         self.driver.back()
         WebDriverWait(self.driver, 10).until(EC.url_contains("inventory-item.html"))
         self.details.wait_loaded()
-        print("🔙 Back to Details (via history).")
+        logger.debug("🔙 Back to Details (via history).")
 
         # Back → should go to Inventory
-        print("⬅️  Browser back...")
+        logger.debug("⬅️  Browser back...")
         self.driver.back()
         WebDriverWait(self.driver, 10).until(EC.url_contains("inventory.html"))
         self.inventory.wait_loaded()
-        print("🔙 Back to Inventory (via history).")
+        logger.debug("🔙 Back to Inventory (via history).")
 
         # Forward → should go back to Details
-        print("➡️  Browser forward...")
+        logger.debug("➡️  Browser forward...")
         self.driver.forward()
         WebDriverWait(self.driver, 10).until(EC.url_contains("inventory-item.html"))
         self.details.wait_loaded()
-        print("➡️ Forward to Details (via history).")
\ No newline at end of file
+        logger.debug("➡️ Forward to Details (via history).")
\ No newline at end of file
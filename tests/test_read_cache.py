@@ -0,0 +1,111 @@
+# tests/test_read_cache.py
+import pytest
+from selenium.webdriver.remote.command import Command
+
+from utilis import read_cache
+from utilis.read_cache import READ_TAG, cached_read
+
+
+class _Driver:
+    """Sends commands through `execute` like a WebDriver; the DOM signal is `self.dom`."""
+
+    def __init__(self):
+        self.dom = "doc-1:0"
+        self.sent = []
+
+    def execute(self, command, params=None):
+        self.sent.append(command)
+        if command == Command.W3C_EXECUTE_SCRIPT and params["script"] == read_cache._DOM_SIGNAL_JS:
+            if self.dom is None:
+                raise RuntimeError("no such window")
+            return self.dom
+        return None
+
+    def execute_script(self, script, *args):
+        return self.execute(Command.W3C_EXECUTE_SCRIPT, {"script": script, "args": list(args)})
+
+
+class _Page:
+    def __init__(self, driver):
+        self.driver = driver
+        self.reads = 0
+
+    @cached_read
+    def get_names(self):
+        self.reads += 1
+        return [{"name": "Sauce Labs Backpack"}]
+
+
+@pytest.fixture
+def page(monkeypatch, stats):
+    monkeypatch.setattr(read_cache, "_enabled", True)
+    return _Page(_Driver())
+
+
+class TestReadOnlyCommands:
+
+    @pytest.mark.parametrize("command, params, expected", [
+        (Command.FIND_ELEMENT, None, True),
+        (Command.GET_ELEMENT_TEXT, {}, True),
+        (Command.CLICK_ELEMENT, {}, False),
+        (Command.GET, {"url": "https://www.saucedemo.com"}, False),
+        (Command.W3C_EXECUTE_SCRIPT, {"script": READ_TAG + "return 1;"}, True),
+        (Command.W3C_EXECUTE_SCRIPT, {"script": "  /* isDisplayed */ return 1;"}, True),
+        (Command.W3C_EXECUTE_SCRIPT, {"script": "arguments[0].click();"}, False),
+    ])
+    def test_is_read_only(self, command, params, expected):
+        assert read_cache.is_read_only(command, params) is expected
+
+
+class TestCachedRead:
+
+    def test_unchanged_page_is_read_once(self, page, stats):
+        assert page.get_names() == page.get_names()
+        assert page.reads == 1
+        assert stats == {"misses": 1, "hits": 1}
+
+    def test_page_changing_command_invalidates(self, page):
+        page.get_names()
+        page.driver.execute(Command.CLICK_ELEMENT, {"id": "add-to-cart"})
+        page.get_names()
+        assert page.reads == 2
+
+    def test_untagged_script_invalidates_tagged_does_not(self, page):
+        page.get_names()
+        page.driver.execute_script(READ_TAG + "return document.title;")
+        page.get_names()
+        assert page.reads == 1
+        page.driver.execute_script("window.scrollTo(0, 0);")
+        page.get_names()
+        assert page.reads == 2
+
+    def test_dom_mutation_or_new_document_invalidates(self, page):
+        page.get_names()
+        page.driver.dom = "doc-1:3"
+        page.get_names()
+        page.driver.dom = "doc-2:0"
+        page.get_names()
+        assert page.reads == 3
+
+    def test_unreadable_signal_is_never_a_hit(self, page):
+        page.driver.dom = None
+        page.get_names()
+        page.get_names()
+        assert page.reads == 2
+
+    def test_invalidate(self, page):
+        page.get_names()
+        read_cache.read_cache(page.driver).invalidate()
+        page.get_names()
+        assert page.reads == 2
+
+    def test_hit_returns_a_copy(self, page):
+        page.get_names()[0]["name"] = "changed by the caller"
+        assert page.get_names() == [{"name": "Sauce Labs Backpack"}]
+
+    def test_off_always_reads(self, page, monkeypatch):
+        monkeypatch.setattr(read_cache, "_enabled", False)
+        page.get_names()
+        page.get_names()
+        assert page.reads == 2
+        assert Command.W3C_EXECUTE_SCRIPT not in page.driver.sent
@@ -0,0 +1,100 @@
+# tests/test_tracing.py
+import json
+
+import pytest
+
+from utilis import tracing
+
+
+class _Driver:
+    def execute(self, command, params=None):
+        if command == "clickElement":
+            raise RuntimeError("element click intercepted")
+        return None
+
+
+@tracing.traced
+class _Page:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def open(self):
+        self.driver.execute("get", {})
+
+
+@pytest.fixture
+def trace_dir(tmp_path, monkeypatch, stats):
+    monkeypatch.setattr(tracing, "_settings", dict(tracing._settings))
+    monkeypatch.setattr(tracing, "_run_events", [])
+    monkeypatch.setattr(tracing, "_test", {"nodeid": None, "events": []})
+    tracing.configure(True, tmp_path / "traces", run="run-1", worker="gw0")
+    return tmp_path / "traces" / "run-1"
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as fh:
+        return [event for event in json.load(fh)["traceEvents"] if event["ph"] == "X"]
+
+
+class TestSpans:
+
+    def test_page_method_wait_and_commands_nest_by_time(self, trace_dir):
+        driver = _Driver()
+        tracing.install(driver)
+        tracing.begin_test("tests/test_x.py::test_x")
+        with tracing.span("tests/test_x.py::test_x", "test"):
+            with tracing.span("url_contains('inventory')", "wait", timeout=10):
+                _Page(driver).open()
+        tracing.end_test()
+
+        events = {event["cat"]: event for event in _load(trace_dir / "tests" / "tests_test_x.py_test_x.json")}
+        assert set(events) == {"test", "wait", "page", "command"}
+        assert events["page"]["name"] == "_Page.open" and events["command"]["name"] == "get"
+        assert events["wait"]["args"] == {"timeout": 10, "test": "tests/test_x.py::test_x", "worker": "gw0"}
+        outer = events["test"]
+        for inner in ("wait", "page", "command"):
+            assert outer["ts"] <= events[inner]["ts"]
+            assert events[inner]["ts"] + events[inner]["dur"] <= outer["ts"] + outer["dur"] + 1
+
+    def test_errors_are_recorded_on_the_span(self, trace_dir):
+        driver = _Driver()
+        tracing.install(driver)
+        tracing.begin_test("t::a")
+        with pytest.raises(RuntimeError):
+            with tracing.span("click", "page"):
+                driver.execute("clickElement", {})
+        tracing.end_test()
+        errors = {event["cat"]: event["args"].get("error") for event in _load(trace_dir / "tests" / "t_a.json")}
+        assert errors == {"page": "RuntimeError", "command": "RuntimeError"}
+
+    def test_off_records_nothing(self, trace_dir):
+        tracing.configure(False)
+        tracing.begin_test("t::a")
+        with tracing.span("a", "test"):
+            _Page(_Driver()).open()
+        tracing.end_test()
+        tracing.write_worker()
+        assert tracing.write_run() is None
+        assert not trace_dir.exists()
+
+
+class TestFiles:
+
+    def test_workers_merge_into_one_trace(self, trace_dir):
+        tracing.begin_test("t::a")
+        with tracing.span("t::a", "test"):
+            pass
+        tracing.end_test()
+        with tracing.span("session_login", "fixture"):
+            pass
+        tracing.write_worker()
+        # another worker of the same run
+        other = {"name": "t::b", "cat": "test", "ph": "X", "ts": 1.0, "dur": 2.0, "pid": 1, "tid": 1, "args": {}}
+        (trace_dir / "gw1.json").write_text(json.dumps({"traceEvents": [other]}), encoding="utf-8")
+
+        target = tracing.write_run()
+
+        assert target == trace_dir / "trace.json"
+        assert sorted(event["name"] for event in _load(target)) == ["session_login", "t::a", "t::b"]
+        # a second merge does not read its own output
+        assert len(_load(tracing.write_run())) == 3
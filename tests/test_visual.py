@@ -0,0 +1,198 @@
+# tests/test_visual.py
+import os
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from utilis import visual
+
+
+def _image(height=64, width=64, color=(200, 200, 200)):
+    pixels = np.empty((height, width, 3), np.uint8)
+    pixels[:] = color
+    return pixels
+
+
+def _noise(height, width, channels, seed=0):
+    return np.random.default_rng(seed).integers(0, 256, (height, width, channels), dtype=np.uint8)
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    return a if pa <= pb and pa <= pc else b if pb <= pc else c
+
+
+def _filtered_png(pixels, kinds):
+    """PNG of `pixels` (H, W, 3 or 4) with row y filtered by kinds[y], byte by byte (the spec)."""
+    height, width, bpp = pixels.shape
+    rows = pixels.reshape(height, width * bpp).astype(int)
+    data = bytearray()
+    for y in range(height):
+        data.append(kinds[y])
+        for i in range(width * bpp):
+            a = rows[y, i - bpp] if i >= bpp else 0
+            b = rows[y - 1, i] if y else 0
+            c = rows[y - 1, i - bpp] if y and i >= bpp else 0
+            predicted = (0, a, b, (a + b) >> 1, _paeth(a, b, c))[kinds[y]]
+            data.append((rows[y, i] - predicted) & 0xFF)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2 if bpp == 3 else 6, 0, 0, 0)
+    return (visual._PNG_SIGNATURE + visual._chunk(b"IHDR", header)
+            + visual._chunk(b"IDAT", zlib.compress(bytes(data))) + visual._chunk(b"IEND", b""))
+
+
+@pytest.fixture
+def no_pillow(monkeypatch):
+    """Decode with the zlib + NumPy fallback even where Pillow is installed."""
+    monkeypatch.setattr(visual, "Image", None)
+
+
+@pytest.mark.usefixtures("no_pillow")
+class TestDecodePng:
+
+    @pytest.mark.parametrize("kind", [0, 1, 2, 3, 4], ids=["none", "sub", "up", "average", "paeth"])
+    @pytest.mark.parametrize("channels", [3, 4], ids=["rgb", "rgba"])
+    def test_each_filter_type(self, kind, channels):
+        pixels = _noise(7, 9, channels)
+        decoded = visual.decode_png(_filtered_png(pixels, [kind] * 7))
+        assert np.array_equal(decoded, pixels[:, :, :3])
+
+    def test_mixed_filter_types(self):
+        pixels = _noise(11, 13, 3, seed=1)
+        decoded = visual.decode_png(_filtered_png(pixels, [4, 0, 3, 1, 2, 4, 3, 3, 0, 2, 1]))
+        assert np.array_equal(decoded, pixels)
+
+    def test_encode_png_round_trip(self):
+        pixels = _noise(10, 17, 3, seed=2)
+        assert np.array_equal(visual.decode_png(visual.encode_png(pixels)), pixels)
+
+    def test_not_a_png(self):
+        with pytest.raises(ValueError):
+            visual.decode_png(b"GIF89a")
+
+
+class TestMask:
+
+    def test_rect_is_padded_and_clipped(self):
+        mask = visual.mask_for((20, 20, 3), [(5, 6, 3, 2.5)])
+        pad = visual.MASK_PADDING
+        rows, cols = np.nonzero(mask)
+        assert (rows.min(), rows.max()) == (6 - pad, 6 + 3 + pad - 1)
+        assert (cols.min(), cols.max()) == (5 - pad, 5 + 3 + pad - 1)
+        assert visual.mask_for((20, 20, 3), [(0, 0, 1, 1)])[0, 0]
+
+    def test_no_rects(self):
+        assert not visual.mask_for((4, 4, 3), None).any()
+
+
+class TestVisualCompare:
+
+    def _baseline(self, tmp_path, pixels):
+        baseline = tmp_path / "page.png"
+        visual.write_baseline(baseline, visual.encode_png(pixels))
+        return baseline
+
+    def test_missing_baseline_is_written(self, tmp_path):
+        baseline = tmp_path / "new" / "page.png"
+        result = visual.compare(visual.encode_png(_image()), baseline)
+        assert result["status"] == "new" and result["ok"]
+        assert baseline.exists() and baseline.with_suffix(".npy").exists()
+
+    def test_identical_capture_matches_on_fingerprint(self, tmp_path):
+        baseline = self._baseline(tmp_path, _image())
+        result = visual.compare(visual.encode_png(_image()), baseline)
+        assert (result["status"], result["pass"], result["ok"]) == ("match", "fingerprint", True)
+
+    def test_changed_region_is_a_mismatch(self, tmp_path):
+        baseline = self._baseline(tmp_path, _image())
+        actual = _image()
+        actual[10:20, 10:20] = (0, 0, 0)
+        out = tmp_path / "out"
+        result = visual.compare(visual.encode_png(actual), baseline, out=out, key="grid")
+        assert (result["status"], result["pass"], result["ok"]) == ("mismatch", "pixels", False)
+        assert result["changed"] == 100
+        assert result["diff"] == str(out / "grid.diff.png") and result["actual"] == str(out / "grid.actual.png")
+        assert os.path.exists(result["diff"]) and os.path.exists(result["actual"])
+
+    def test_change_inside_ignored_region_matches(self, tmp_path):
+        baseline = self._baseline(tmp_path, _image())
+        actual = _image()
+        actual[10:20, 10:20] = (0, 0, 0)
+        result = visual.compare(visual.encode_png(actual), baseline, rects=[(10, 10, 10, 10)], out=tmp_path / "out")
+        assert result["status"] == "match" and result["ok"]
+        assert not (tmp_path / "out").exists()
+
+    def test_same_luma_colour_change_is_a_mismatch(self, tmp_path):
+        base = _image()
+        base[16:48, 16:48] = (200, 0, 0)
+        actual = base.copy()
+        actual[16:48, 16:48] = (60, 60, 60)   # about the luma of the red
+        baseline = self._baseline(tmp_path, base)
+
+        result = visual.compare(visual.encode_png(actual), baseline)
+
+        assert result["status"] == "mismatch"
+        assert result["pass"] == "pixels"
+
+    def test_size_change_is_a_mismatch(self, tmp_path):
+        baseline = self._baseline(tmp_path, _image())
+        result = visual.compare(visual.encode_png(_image(64, 72)), baseline)
+        assert result["status"] == "mismatch" and "size" in result["reason"]
+
+    def test_stale_sidecar_is_not_used(self, tmp_path):
+        # The sidecar says "all black"; the baseline PNG, rewritten after it, is grey
+        baseline = self._baseline(tmp_path, _image(color=(0, 0, 0)))
+        baseline.write_bytes(visual.encode_png(_image()))
+        sidecar = baseline.with_suffix(".npy")
+        stamp = baseline.stat().st_mtime
+        os.utime(sidecar, (stamp - 10, stamp - 10))
+        assert visual._baseline_fingerprint(baseline) is None
+
+        result = visual.compare(visual.encode_png(_image()), baseline)
+        assert (result["status"], result["pass"]) == ("match", "pixels")
+
+    def test_fresh_sidecar_is_used(self, tmp_path):
+        baseline = self._baseline(tmp_path, _image())
+        assert np.array_equal(visual._baseline_fingerprint(baseline), visual.fingerprint(_image()))
+
+
+class _ScreenshotDriver:
+    """Just enough of a WebDriver for `visual.check()`."""
+
+    capabilities = {"browserName": "chrome"}
+
+    def __init__(self, pixels):
+        self.png = visual.encode_png(pixels)
+
+    def get_screenshot_as_png(self):
+        return self.png
+
+    def execute_script(self, script, *args):
+        return []
+
+
+class TestVisualBatch:
+
+    @pytest.fixture
+    def batch(self, tmp_path, stats):
+        saved = dict(visual._settings)
+        visual.configure("batch", baselines=tmp_path / "baselines", out=tmp_path / "out", processes=1)
+        yield tmp_path
+        visual._jobs.clear()
+        visual._settings.update(saved)
+
+    def test_capture_is_parked_and_compared_at_the_end(self, batch):
+        visual.write_baseline(batch / "baselines" / "chrome" / "grid.png", visual.encode_png(_image()))
+        changed = _image()
+        changed[10:20, 10:20] = (0, 0, 0)
+
+        assert visual.check(_ScreenshotDriver(_image()), "grid") is None
+        assert visual.check(_ScreenshotDriver(changed), "grid") is None
+        assert len(visual.pending()) == 2
+
+        results = visual.run_batch(batch / "out" / "results.json")
+        assert sorted(result["ok"] for result in results) == [False, True]
+        assert visual.pending() == []
+        assert not list((batch / "out").rglob("parked/*.png"))
@@ -0,0 +1,76 @@
+# tests/test_waits.py
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+
+from utilis import waits
+from utilis.waits import EventWait
+
+
+class _Driver:
+    """`execute_async_script` answers with (or raises) the queued results; `current_url` serves the fallbacks."""
+
+    def __init__(self, *results, url="https://www.saucedemo.com/inventory.html"):
+        self.results = list(results)
+        self.scripts = 0
+        self.current_url = url
+
+    def execute_async_script(self, script, *args):
+        self.scripts += 1
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture(autouse=True)
+def event_mode(monkeypatch):
+    monkeypatch.setattr(waits, "_mode", "event")
+    # Keep the session's wait telemetry clean
+    monkeypatch.setattr(waits.wait_stats, "record", lambda *args, **kwargs: None)
+
+
+class TestEventWait:
+
+    def test_condition_met_in_the_page(self, stats):
+        driver = _Driver({"met": True, "value": "2"})
+        assert EventWait(driver, 5).until(waits.text_to_change(("id", "badge"), "1")) == "2"
+        assert driver.scripts == 1
+        assert stats["event waits"] == 1 and "polling waits" not in stats
+
+    def test_unmet_slices_time_out(self, stats):
+        driver = _Driver({"met": False})
+        with pytest.raises(TimeoutException):
+            EventWait(driver, 0.05).until(waits.url_contains("checkout-complete.html"))
+        assert stats["event waits timed out"] == 1
+
+    def test_script_error_falls_back_to_expected_conditions(self, stats):
+        driver = _Driver({"error": "SyntaxError: bad locator"})
+        assert EventWait(driver, 5).until(waits.url_contains("inventory.html")) is True
+        assert stats["event waits fell back to polling"] == 1 and stats["polling waits"] == 1
+
+    def test_one_unloaded_page_is_rechecked_the_normal_way(self, stats):
+        driver = _Driver(JavascriptException("document unloaded"), {"met": True, "value": True})
+        assert EventWait(driver, 5).until(waits.url_contains("inventory.html")) is True
+        assert driver.scripts == 1 and "polling waits" not in stats
+
+    def test_repeated_script_failures_fall_back_to_polling(self, stats):
+        driver = _Driver(JavascriptException("document unloaded"), url="https://www.saucedemo.com/")
+        with pytest.raises(TimeoutException):
+            EventWait(driver, 0.2, poll_frequency=0.01).until(waits.url_contains("inventory.html"))
+        assert driver.scripts == waits.MAX_SCRIPT_ERRORS
+        assert stats["event waits fell back to polling"] == 1
+
+    def test_plain_callable_is_polled(self, stats):
+        driver = _Driver({"met": True, "value": "unused"})
+        assert EventWait(driver, 5).until(lambda d: d.current_url) == driver.current_url
+        assert driver.scripts == 0 and stats["polling waits"] == 1
+
+    def test_poll_mode_uses_the_expected_condition(self, stats, monkeypatch):
+        monkeypatch.setattr(waits, "_mode", "poll")
+        driver = _Driver({"met": True, "value": "unused"})
+        assert EventWait(driver, 5).until(waits.url_contains("inventory.html")) is True
+        assert driver.scripts == 0 and stats["polling waits"] == 1
+
+    def test_unknown_mode_is_rejected(self):
+        with pytest.raises(ValueError):
+            waits.configure("sleep")
@@ -0,0 +1,110 @@
+# tests/test_xdist_lpt.py
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+
+from utilis import xdist_lpt
+from utilis.xdist_lpt import DurationRecorder, LptScheduling
+
+
+class _Config:
+    def __init__(self, workers=2):
+        self.tx = [f"{workers}*popen"]
+
+    def getvalue(self, name):
+        return self.tx if name == "tx" else None
+
+
+def _report(nodeid, when="call", duration=1.0, skipped=False, start=None):
+    return SimpleNamespace(nodeid=nodeid, when=when, duration=duration, skipped=skipped,
+                           start=start, stop=None if start is None else start + duration)
+
+
+class TestMakespan:
+
+    def test_longest_first_fills_the_gaps(self):
+        assert xdist_lpt.predict_makespan([1, 2, 3, 4, 5, 5], workers=2) == 10
+        assert xdist_lpt.predict_makespan([7, 1, 1], workers=2) == 7
+
+    def test_no_workers_counts_as_one(self):
+        assert xdist_lpt.predict_makespan([1, 2], workers=0) == 3
+
+    @pytest.mark.parametrize("nodeid, unit", [
+        ("tests/test_cart.py::TestCart::test_remove", "tests/test_cart.py::TestCart"),
+        ("tests/test_util.py::test_parse[a]", "tests/test_util.py::test_parse[a]"),
+    ])
+    def test_split_scope(self, nodeid, unit):
+        assert xdist_lpt.split_scope(nodeid) == unit
+
+
+class TestLptScheduling:
+
+    def test_unknown_tests_cost_the_median(self):
+        scheduler = LptScheduling(_Config(), history={"a": 1.0, "b": 3.0, "c": 10.0})
+        assert scheduler.fallback == 3.0
+        assert scheduler.cost(["a", "c", "new"]) == 14.0
+
+    def test_no_history_uses_the_default_cost(self):
+        assert LptScheduling(_Config()).cost(["x", "y"]) == 2 * xdist_lpt.DEFAULT_COST
+
+    def test_most_expensive_unit_goes_first(self, stats, monkeypatch):
+        assigned = []
+        monkeypatch.setattr(LoadScopeScheduling, "_assign_work_unit",
+                            lambda self, node: assigned.append(next(iter(self.workqueue))))
+        history = {"m.py::Short::t1": 1.0, "m.py::Long::t1": 8.0, "m.py::Long::t2": 4.0}
+        scheduler = LptScheduling(_Config(workers=2), history=history)
+        scheduler.assigned_work = {"gw0": {}, "gw1": {}}
+        scheduler.workqueue = OrderedDict([
+            ("m.py::Short", {"m.py::Short::t1": False}),
+            ("m.py::Long", {"m.py::Long::t1": False, "m.py::Long::t2": False}),
+            ("m.py::New", {"m.py::New::t1": False}),
+        ])
+
+        scheduler._assign_work_unit("gw0")
+
+        assert list(scheduler.workqueue) == ["m.py::Long", "m.py::New", "m.py::Short"]
+        assert assigned == ["m.py::Long"]
+        # Long (12s) on one worker, New (median 4s) + Short (1s) on the other
+        assert scheduler.predicted == 12.0
+        assert stats == {"work units": 3, "tests without history": 1, "predicted makespan (s)": 12.0}
+
+
+class TestDurationRecorder:
+
+    def test_phases_add_up_and_history_is_smoothed(self, tmp_path):
+        path = tmp_path / ".test_durations.json"
+        xdist_lpt.save_history(path, {"t::a": 4.0})
+        recorder = DurationRecorder(path, enabled=False)
+        for when, seconds in (("setup", 1.0), ("call", 5.0), ("teardown", 0.0)):
+            recorder.pytest_runtest_logreport(_report("t::a", when, seconds))
+        recorder.pytest_runtest_logreport(_report("t::b", duration=2.0))
+
+        recorder.pytest_sessionfinish(session=None)
+
+        smoothing = xdist_lpt.SMOOTHING
+        assert xdist_lpt.load_history(path) == {"t::a": smoothing * 6.0 + (1 - smoothing) * 4.0, "t::b": 2.0}
+
+    def test_skipped_tests_keep_their_history(self, tmp_path):
+        path = tmp_path / ".test_durations.json"
+        xdist_lpt.save_history(path, {"t::a": 4.0})
+        recorder = DurationRecorder(path, enabled=False)
+        recorder.pytest_runtest_logreport(_report("t::a", "setup", 0.5))
+        recorder.pytest_runtest_logreport(_report("t::a", "call", 0.0, skipped=True))
+        recorder.pytest_runtest_logreport(_report("t::a", "teardown", 0.1))
+        recorder.pytest_sessionfinish(session=None)
+        assert xdist_lpt.load_history(path) == {"t::a": 4.0}
+
+    def test_actual_makespan_is_reported_when_enabled(self, tmp_path, stats):
+        recorder = DurationRecorder(tmp_path / "durations.json", enabled=True)
+        recorder.pytest_runtest_logreport(_report("t::a", duration=3.0, start=100.0))
+        recorder.pytest_runtest_logreport(_report("t::b", duration=1.0, start=101.0))
+        recorder.pytest_sessionfinish(session=None)
+        assert stats["actual makespan (s)"] == 3.0
+
+    def test_unreadable_history_is_empty(self, tmp_path):
+        path = tmp_path / "durations.json"
+        path.write_text("{not json", encoding="utf-8")
+        assert xdist_lpt.load_history(path) == {}
+        assert xdist_lpt.load_history(tmp_path / "missing.json") == {}
@@ -0,0 +1,73 @@
+# tools/bench_fast_fill.py
+"""
+Time per field for clear() + send_keys (keystrokes) vs fast_fill (native
+value setter + input/change events), on the login form of the local Sauce
+Demo stand-in, with the usernames and passwords of data/credentials.csv.
+
+    python tools/bench_fast_fill.py --browser chrome
+    python tools/bench_fast_fill.py --runs 20 --headed
+
+Every sample fills one field with one value from a freshly loaded login page;
+"fallbacks" counts fast fills whose value did not stick and were typed instead.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pages.login_page import LoginPage  # noqa: E402
+from utilis.data_reader import read_csv_data  # noqa: E402
+from utilis.driver_pool import quit_driver  # noqa: E402
+from utilis.drivers import build_driver  # noqa: E402
+from utilis.fast_fill import fill  # noqa: E402
+from utilis.local_site.server import LocalSauceDemo  # noqa: E402
+
+
+def measure(driver, url, locator, values, fast: bool, runs: int) -> tuple:
+    samples, fallbacks = [], 0
+    for _ in range(runs):
+        for value in values:
+            driver.get(url)
+            element = driver.find_element(*locator)
+            start = time.perf_counter()
+            path = fill(driver, element, value, fast=fast)
+            samples.append(time.perf_counter() - start)
+            fallbacks += fast and path == "keys"
+            assert element.get_attribute("value") == value, f"{locator[1]} kept {element.get_attribute('value')!r}"
+    return samples, fallbacks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--browser", default="chrome", choices=("chrome", "edge"))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--headed", action="store_true", help="launch a visible browser")
+    args = parser.parse_args()
+
+    rows = read_csv_data("credentials.csv")
+    fields = {
+        "username": [row["username"] for row in rows if row["username"]],
+        "password": [row["password"] for row in rows if row["password"]],
+    }
+    site = LocalSauceDemo().start()
+    driver = build_driver(args.browser, not args.headed)
+    page = LoginPage(driver)
+    print(f"Browser: {args.browser} | runs={args.runs} | credential rows={len(rows)}\n")
+    print(f"{'field':<10} {'mode':<10} {'mean':>9} {'median':>9} {'fallbacks':>10}")
+    try:
+        for field, values in fields.items():
+            locator = getattr(page, f"{field}_input")
+            for mode, fast in (("keys", False), ("fast", True)):
+                samples, fallbacks = measure(driver, f"{site.url}/", locator, values, fast, args.runs)
+                print(f"{field:<10} {mode:<10} {statistics.mean(samples) * 1000:>7.1f}ms "
+                      f"{statistics.median(samples) * 1000:>7.1f}ms {fallbacks:>10}")
+    finally:
+        quit_driver(driver)
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# tools/bench_inventory_catalog.py
+"""
+WebDriver round trips and time for reading the inventory and adding items,
+per-card (the previous InventoryPage code path) vs batched (get_catalog /
+add_many_to_cart), against the local Sauce Demo stand-in.
+
+    python tools/bench_inventory_catalog.py --browser chrome
+    python tools/bench_inventory_catalog.py --sizes 6 100 1000 --add 5 --runs 3
+
+Each scenario starts from a freshly loaded inventory page with an empty cart;
+only the commands of the scenario itself are counted. Both paths include the
+page's wait_loaded() check, as InventoryPage always did.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pages.inventory_page import InventoryPage  # noqa: E402
+from utilis.auth import SessionLogin  # noqa: E402
+from utilis.command_hooks import CommandListener, add_listener  # noqa: E402
+from utilis.driver_pool import quit_driver  # noqa: E402
+from utilis.drivers import build_driver  # noqa: E402
+from utilis.local_site.server import LocalSauceDemo  # noqa: E402
+
+
+class CommandCounter(CommandListener):
+    def __init__(self):
+        self.count = 0
+
+    def after(self, command, params, elapsed, error):
+        self.count += 1
+
+
+def legacy_names(driver):
+    """find_elements + find_element + .text per card (2N+1 round trips)."""
+    InventoryPage(driver).wait_loaded()
+    names = []
+    for card in driver.find_elements("css selector", ".inventory_item"):
+        names.append(card.find_element("css selector", ".inventory_item_name").text.strip())
+    return names
+
+
+def legacy_add(driver, wanted):
+    """Scan the cards for every product and click its button."""
+    for name in wanted:
+        InventoryPage(driver).wait_loaded()
+        for card in driver.find_elements("css selector", ".inventory_item"):
+            if card.find_element("css selector", ".inventory_item_name").text.strip() == name:
+                card.find_element("css selector", "button.btn_inventory").click()
+                break
+
+
+def run(driver, counter, inventory_url, scenario) -> tuple:
+    driver.execute_script("window.localStorage.removeItem('cart-contents');")
+    driver.get(inventory_url)
+    InventoryPage(driver).wait_loaded()
+    counter.count = 0
+    start = time.perf_counter()
+    scenario()
+    return counter.count, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--browser", default="chrome", choices=("chrome", "edge"))
+    parser.add_argument("--sizes", type=int, nargs="+", default=[6, 100, 1000])
+    parser.add_argument("--add", type=int, default=5, help="number of products added per add scenario")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--headed", action="store_true", help="launch a visible browser")
+    args = parser.parse_args()
+
+    driver = build_driver(args.browser, not args.headed)
+    counter = CommandCounter()
+    add_listener(driver, "bench-counter", counter)
+    print(f"Browser: {args.browser} | runs={args.runs} | add={args.add}\n")
+    print(f"{'items':>6}  {'scenario':<26} {'round trips':>11}  {'median':>9}")
+    try:
+        for size in args.sizes:
+            site = LocalSauceDemo(catalog_size=size).start()
+            try:
+                SessionLogin(site.url).login(driver, "standard_user")
+                inventory_url = f"{site.url}/inventory.html"
+                page = InventoryPage(driver)
+                wanted = [p["name"] for p in sorted(site.products, key=lambda p: p["name"])][-args.add:]
+                scenarios = [
+                    ("names, per card", lambda: legacy_names(driver)),
+                    ("names, get_catalog", page.get_catalog),
+                    (f"add {len(wanted)}, per card", lambda: legacy_add(driver, wanted)),
+                    (f"add {len(wanted)}, add_many_to_cart", lambda: page.add_many_to_cart(wanted)),
+                ]
+                for label, scenario in scenarios:
+                    samples = [run(driver, counter, inventory_url, scenario) for _ in range(args.runs)]
+                    trips = samples[-1][0]
+                    median = statistics.median(seconds for _, seconds in samples)
+                    print(f"{size:>6}  {label:<26} {trips:>11}  {median:>8.3f}s")
+            finally:
+                site.stop()
+    finally:
+        quit_driver(driver)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# tools/bench_profile_template.py
+"""
+Compare browser launch latency with and without the profile template.
+
+    python tools/bench_profile_template.py --browser chrome --runs 10
+    python tools/bench_profile_template.py --browser edge --profile-root /dev/shm
+
+"Launch" is measured from the start of the build until about:blank has
+loaded, i.e. the moment a test could start driving the browser.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utilis.driver_pool import quit_driver  # noqa: E402
+from utilis.drivers import build_driver, configure_profiles, remove_profile_templates  # noqa: E402
+
+
+def measure(browser: str, headless: bool, runs: int) -> list:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        driver = build_driver(browser, headless)
+        driver.get("about:blank")
+        samples.append(time.perf_counter() - start)
+        quit_driver(driver)
+    return samples
+
+
+def summarize(label: str, samples: list):
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    print(f"{label:<18} mean={statistics.mean(samples):.3f}s  "
+          f"median={statistics.median(samples):.3f}s  p95={p95:.3f}s  n={len(samples)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--browser", default="chrome", choices=("chrome", "edge"))
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--headed", action="store_true", help="launch visible browsers")
+    parser.add_argument("--profile-root", default=None)
+    args = parser.parse_args()
+    headless = not args.headed
+
+    configure_profiles(root=args.profile_root, template=False)
+    plain = measure(args.browser, headless, args.runs)
+
+    configure_profiles(root=args.profile_root, template=True)
+    seed_start = time.perf_counter()
+    quit_driver(build_driver(args.browser, headless))  # first launch seeds the template
+    seed = time.perf_counter() - seed_start
+    try:
+        templated = measure(args.browser, headless, args.runs)
+    finally:
+        remove_profile_templates()
+
+    print(f"\nBrowser: {args.browser} | headless={headless} | runs={args.runs}")
+    summarize("empty profile", plain)
+    summarize("template clone", templated)
+    print(f"{'template seed':<18} {seed:.3f}s (one-off, includes first clone)")
+    saved = statistics.mean(plain) - statistics.mean(templated)
+    print(f"Saved per launch: {saved:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Clicks and selects with a learned fallback order.
+
+Several page objects used to hand-roll the same chain for fragile controls:
+scroll into view, wait until clickable, native click, and a JS click when
+that fails. When the native path never works for a control on some browser,
+every run paid its full timeout before reaching the JS click.
+
+ActionExecutor runs the chain and counts, per (browser, action, locator),
+how often each strategy succeeded and failed. Once the default strategy has
+failed PROMOTE_AFTER times and more often than it succeeded, the fallback
+goes first:
+
+    actions = ActionExecutor(driver, timeout=10)
+    actions.click(("xpath", "//button[@id='finish']"))
+    actions.select_by_value(("css selector", "select.product_sort_container"), "az")
+
+Strategies:
+
+    click   native: scroll into view, wait until clickable, element.click()
+            js:     arguments[0].click()
+    select  native: selenium Select.select_by_value
+            js:     set the value and dispatch a bubbling change event
+
+The first strategy tried gets the full timeout, later ones FALLBACK_TIMEOUT.
+A JS click does not check that a user could click the element, so a promoted
+fallback is not final: every RETRY_EVERY-th action on that locator tries the
+default first again, and the counts are halved past HISTORY so that recent
+results outweigh old ones. Native successes demote the fallback again.
+
+The counts are saved to .action_strategies.json at the end of the run
+(xdist workers send this run's counts to the controller, see conftest.py).
+The "actions" summary section shows attempts, failures and time per strategy.
+--action-cache=off (ACTION_CACHE=off) always uses the default order and
+learns nothing.
+"""
+import json
+import os
+import time
+from pathlib import Path
+
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+from selenium.webdriver.support.ui import Select
+
+from utilis import run_stats, waits
+from utilis.logger import get_logger
+from utilis.waits import EventWait
+
+logger = get_logger(__name__)
+
+SECTION = "actions"
+FALLBACK_TIMEOUT = 2.0
+PROMOTE_AFTER = 3
+RETRY_EVERY = 10
+HISTORY = 20
+STRATEGIES = {
+    "click": ("native", "js"),
+    "select": ("native", "js"),
+}
+
+_SELECT_JS = """
+const [select, value] = arguments;
+Object.getOwnPropertyDescriptor(HTMLSelectElement.prototype, 'value').set.call(select, value);
+select.dispatchEvent(new Event('change', {bubbles: true}));
+return select.value === value;
+"""
+
+_path = None
+_enabled = True
+# {key: {strategy: {"ok": n, "failed": n}}}: all runs, and this run only
+_learned = {}
+_run_counts = {}
+
+
+def configure(path, enabled: bool):
+    """Load the counts of previous runs from `path`."""
+    global _path, _enabled, _learned, _run_counts
+    _path = Path(path)
+    _enabled = enabled
+    _learned, _run_counts = {}, {}
+    if enabled:
+        try:
+            with open(_path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            data = {}
+        # Entries of the old format (the last winner only) are dropped
+        _learned = {key: value for key, value in data.items() if isinstance(value, dict)} if isinstance(data, dict) else {}
+
+
+def _add(counts: dict, key: str, strategy: str, outcome: str, n: int = 1):
+    entry = counts.setdefault(key, {}).setdefault(strategy, {"ok": 0, "failed": 0})
+    entry[outcome] = entry.get(outcome, 0) + n
+
+
+def _decay(key: str):
+    for entry in _learned.get(key, {}).values():
+        if entry.get("ok", 0) + entry.get("failed", 0) > HISTORY:
+            entry["ok"], entry["failed"] = entry.get("ok", 0) // 2, entry.get("failed", 0) // 2
+
+
+def record(key: str, strategy: str, ok: bool):
+    """Count one success or failure of `strategy` for `key`."""
+    if not _enabled:
+        return
+    outcome = "ok" if ok else "failed"
+    _add(_learned, key, strategy, outcome)
+    _add(_run_counts, key, strategy, outcome)
+    _decay(key)
+
+
+def learned() -> dict:
+    """This run's counts as a plain dict (sent from xdist workers to the controller)."""
+    return {key: {strategy: dict(entry) for strategy, entry in value.items()} for key, value in _run_counts.items()}
+
+
+def merge(data: dict):
+    """Add the counts of a worker (see `learned()`)."""
+    for key, value in (data or {}).items():
+        for strategy, entry in value.items():
+            for outcome in ("ok", "failed"):
+                _add(_learned, key, strategy, outcome, entry.get(outcome, 0))
+        _decay(key)
+
+
+def save():
+    if _path is None or not _enabled or not _learned:
+        return
+    _path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _path.with_name(f"{_path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(_learned, fh, indent=1, sort_keys=True)
+    os.replace(tmp, _path)
+
+
+def order(action: str, key: str) -> list:
+    """Strategies of `action` for `key`: the default order unless its first one keeps failing."""
+    strategies = list(STRATEGIES[action])
+    counts = _learned.get(key) if _enabled else None
+    if not counts:
+        return strategies
+    default = counts.get(strategies[0], {})
+    failed, ok = default.get("failed", 0), default.get("ok", 0)
+    if failed < PROMOTE_AFTER or failed <= ok:
+        return strategies
+    uses = sum(entry.get("ok", 0) + entry.get("failed", 0) for entry in counts.values())
+    if uses % RETRY_EVERY == 0:
+        # Now and then the default goes first again: it may work by now
+        return strategies
+    fallback = max(strategies[1:], key=lambda name: counts.get(name, {}).get("ok", 0))
+    strategies.remove(fallback)
+    strategies.insert(0, fallback)
+    return strategies
+
+
+def report():
+    """Add one line per strategy (success rate, mean latency) to the run summary."""
+    counters = run_stats.counters().get(SECTION, {})
+    for name in sorted({key.rsplit(" ", 1)[0] for key in counters if key.endswith(" tries")}):
+        tries = counters.get(f"{name} tries", 0)
+        ok = counters.get(f"{name} ok", 0)
+        seconds = counters.get(f"{name} time (s)", 0.0)
+        run_stats.note(SECTION, f"{name}: {ok}/{tries} ok ({ok / tries:.0%}), mean {seconds / tries:.2f}s")
+
+
+class ActionExecutor:
+    """Runs click/select strategies in learned order for one driver."""
+
+    def __init__(self, driver, timeout: float = 10):
+        self.driver = driver
+        self.timeout = timeout
+
+    def _key(self, action: str, locator) -> str:
+        browser = (getattr(self.driver, "capabilities", None) or {}).get("browserName", "-")
+        return f"{browser} | {action} | {locator[0]}={locator[1]}"
+
+    def _run(self, action: str, locator, attempts: dict):
+        key = self._key(action, locator)
+        element = EventWait(self.driver, self.timeout).until(waits.presence_of_element_located(locator))
+        error = None
+        for index, strategy in enumerate(order(action, key)):
+            timeout = self.timeout if index == 0 else FALLBACK_TIMEOUT
+            name = f"{action}/{strategy}"
+            start = time.perf_counter()
+            try:
+                try:
+                    result = attempts[strategy](element, timeout)
+                except StaleElementReferenceException:
+                    element = self.driver.find_element(*locator)
+                    result = attempts[strategy](element, timeout)
+            except WebDriverException as e:
+                error = e
+                record(key, strategy, ok=False)
+                run_stats.add(SECTION, f"{name} tries")
+                run_stats.add(SECTION, f"{name} time (s)", time.perf_counter() - start)
+                logger.warning("⚠️ %s failed on %s: %s; trying next strategy...", name, locator[1], type(e).__name__)
+                continue
+            run_stats.add(SECTION, f"{name} tries")
+            run_stats.add(SECTION, f"{name} ok")
+            run_stats.add(SECTION, f"{name} time (s)", time.perf_counter() - start)
+            record(key, strategy, ok=True)
+            return result
+        raise error
+
+    # ----- click -----
+    def _native_click(self, locator):
+        def attempt(element, timeout):
+            try:
+                self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", element)
+            except WebDriverException:
+                pass
+            EventWait(self.driver, timeout).until(waits.element_to_be_clickable(locator)).click()
+        return attempt
+
+    def _js_click(self, element, timeout):
+        self.driver.execute_script("arguments[0].click();", element)
+
+    def click(self, locator):
+        """Click `locator`, learned strategy first."""
+        self._run("click", locator, {"native": self._native_click(locator), "js": self._js_click})
+
+    # ----- select -----
+    def select_by_value(self, locator, value: str):
+        """Choose option `value` of the <select> at `locator`, learned strategy first."""
+        def native(element, timeout):
+            Select(element).select_by_value(value)
+
+        def js(element, timeout):
+            if not self.driver.execute_script(_SELECT_JS, element, value):
+                raise WebDriverException(f"option {value!r} not selected")
+
+        self._run("select", locator, {"native": native, "js": js})
@@ -0,0 +1,250 @@
+"""
+Content-addressed store for test artifacts (screenshots).
+
+    artifacts/
+      blobs/ab/ab12...ef.png        one file per distinct content (sha256)
+      staging/<worker>/             in-flight writes of one process
+      index/<run>--<worker>.jsonl   one line per artifact: run, test, name, blob, bytes, time
+
+Identical screenshots (e.g. the same error page in every retry) are stored
+once; a name never collides, since it is the hash of the content. Each
+process writes to its own staging directory and index file, then renames
+the finished blob into place, so xdist workers never write the same file.
+
+Optional re-encoding (needs Pillow; PNG is kept when it is missing):
+
+    --artifact-format webp --artifact-quality 80    (or jpeg; default png)
+
+Retention runs at the end of every run (controller only) and by hand:
+
+    python -m utilis.artifact_store gc --keep-runs 20 --max-mb 500
+    python -m utilis.artifact_store stats
+
+gc drops the index files of runs beyond the newest --keep-runs, then drops
+the oldest remaining runs while the blobs exceed --max-mb, then deletes
+blobs no index refers to and staging leftovers. Unindexed blobs and staging
+files younger than --grace-minutes (default 60) are kept: a run that is
+still going may have renamed a blob into place (or deduplicated against an
+old one, which touches it) without having indexed it yet, or may still be
+writing to staging.
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import time
+from pathlib import Path
+
+from utilis import run_stats
+from utilis.logger import get_logger
+
+try:
+    from PIL import Image
+except Exception:
+    Image = None
+
+logger = get_logger(__name__)
+
+SECTION = "artifacts"
+FORMATS = ("png", "webp", "jpeg")
+DEFAULT_ROOT = "artifacts"
+DEFAULT_KEEP_RUNS = 20
+DEFAULT_GRACE_MINUTES = 60
+
+_settings = {"root": Path(DEFAULT_ROOT), "format": "png", "quality": 80, "run": None, "worker": "main"}
+_warned = False
+
+
+def new_run_id() -> str:
+    """Sortable id of a run, shared by all of its workers."""
+    return time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+
+
+def current_run() -> str | None:
+    return _settings["run"]
+
+
+def configure(root, run: str, worker: str = "main", fmt: str = "png", quality: int = 80):
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported artifact format: {fmt}. Supported: {', '.join(FORMATS)}")
+    _settings.update(root=Path(root), run=run, worker=worker, format=fmt, quality=quality)
+
+
+def _encode(png: bytes) -> tuple:
+    """(bytes, extension) in the configured format; PNG when re-encoding is off or impossible."""
+    global _warned
+    fmt = _settings["format"]
+    if fmt == "png":
+        return png, "png"
+    if Image is None:
+        if not _warned:
+            logger.warning("Pillow is not installed; artifacts stay PNG instead of %s.", fmt)
+            _warned = True
+        return png, "png"
+    with Image.open(io.BytesIO(png)) as image:
+        out = io.BytesIO()
+        if fmt == "jpeg":
+            image = image.convert("RGB")
+        image.save(out, format=fmt.upper(), quality=_settings["quality"])
+    return out.getvalue(), "jpg" if fmt == "jpeg" else fmt
+
+
+def _blob_path(root: Path, digest: str, ext: str) -> Path:
+    return root / "blobs" / digest[:2] / f"{digest}.{ext}"
+
+
+def put(data: bytes, test: str | None, name: str) -> Path:
+    """Store `data` (PNG bytes) for `test`; returns the blob path (existing one if already stored)."""
+    root = _settings["root"]
+    if _settings["run"] is None:
+        # Outside a configured run (e.g. a tool): one sortable id for this process, so gc orders it by time
+        _settings["run"] = new_run_id()
+    body, ext = _encode(data)
+    digest = hashlib.sha256(body).hexdigest()
+    blob = _blob_path(root, digest, ext)
+    try:
+        # Touch the blob before indexing it: gc keeps unindexed blobs only while they are recent
+        os.utime(blob)
+        run_stats.add(SECTION, "deduplicated")
+    except FileNotFoundError:
+        staging = root / "staging" / _settings["worker"]
+        staging.mkdir(parents=True, exist_ok=True)
+        tmp = staging / f"{digest}.{ext}.{os.getpid()}.tmp"
+        tmp.write_bytes(body)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp, blob)
+        run_stats.add(SECTION, "blobs written")
+        run_stats.add(SECTION, "MB written", len(body) / 1024 / 1024)
+    _append_index(root, {
+        "run": _settings["run"],
+        "test": test,
+        "name": name,
+        "blob": blob.relative_to(root).as_posix(),
+        "bytes": len(body),
+        "time": time.time(),
+    })
+    return blob
+
+
+def _append_index(root: Path, entry: dict):
+    index = root / "index"
+    index.mkdir(parents=True, exist_ok=True)
+    path = index / f"{entry['run']}--{_settings['worker']}.jsonl"
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write(json.dumps(entry, sort_keys=True) + "\n")
+
+
+def _index_files(root: Path) -> dict:
+    """{run: [index files]}, in run order (oldest first)."""
+    runs = {}
+    for path in sorted((root / "index").glob("*.jsonl")):
+        runs.setdefault(path.name.split("--", 1)[0], []).append(path)
+    return dict(sorted(runs.items()))
+
+
+def _entries(paths) -> list:
+    entries = []
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as fh:
+                entries.extend(json.loads(line) for line in fh if line.strip())
+        except (OSError, ValueError):
+            continue
+    return entries
+
+
+def _size(root: Path, blobs) -> int:
+    return sum((root / blob).stat().st_size for blob in blobs if (root / blob).exists())
+
+
+def gc(root=DEFAULT_ROOT, keep_runs: int | None = DEFAULT_KEEP_RUNS, max_mb: float | None = None,
+       grace_minutes: float = DEFAULT_GRACE_MINUTES) -> dict:
+    """Apply the retention policy; returns what was removed."""
+    root = Path(root)
+    # Files modified after this may belong to a run that is still writing
+    cutoff = time.time() - grace_minutes * 60
+    runs = _index_files(root)
+    dropped = []
+    if keep_runs is not None and len(runs) > keep_runs:
+        for run in list(runs)[:len(runs) - keep_runs]:
+            dropped.append(run)
+            for path in runs.pop(run):
+                path.unlink(missing_ok=True)
+    if max_mb is not None:
+        # Oldest runs first; the newest run always survives
+        while len(runs) > 1:
+            blobs = {entry["blob"] for entry in _entries(p for paths in runs.values() for p in paths)}
+            if _size(root, blobs) <= max_mb * 1024 * 1024:
+                break
+            run = next(iter(runs))
+            dropped.append(run)
+            for path in runs.pop(run):
+                path.unlink(missing_ok=True)
+
+    live = {entry["blob"] for entry in _entries(p for paths in runs.values() for p in paths)}
+    removed, freed = 0, 0
+    for blob in (root / "blobs").glob("*/*"):
+        if blob.relative_to(root).as_posix() in live:
+            continue
+        try:
+            stat = blob.stat()
+        except FileNotFoundError:
+            continue
+        if stat.st_mtime > cutoff:
+            continue
+        freed += stat.st_size
+        blob.unlink(missing_ok=True)
+        removed += 1
+    for path in (root / "staging").glob("*/*"):
+        try:
+            if path.stat().st_mtime <= cutoff:
+                path.unlink(missing_ok=True)
+        except FileNotFoundError:
+            continue
+    for folder in list((root / "blobs").glob("*")) + list((root / "staging").glob("*")):
+        try:
+            if folder.is_dir() and not any(folder.iterdir()):
+                folder.rmdir()
+        except OSError:
+            pass
+    result = {"runs_dropped": dropped, "blobs_removed": removed, "bytes_freed": freed}
+    if dropped or removed:
+        logger.info("artifact gc: %s", result)
+    return result
+
+
+def stats(root=DEFAULT_ROOT) -> dict:
+    root = Path(root)
+    runs = _index_files(root)
+    entries = _entries(p for paths in runs.values() for p in paths)
+    blobs = {entry["blob"] for entry in entries}
+    return {
+        "runs": len(runs),
+        "artifacts": len(entries),
+        "blobs": len(blobs),
+        "stored_mb": round(_size(root, blobs) / 1024 / 1024, 2),
+        "logical_mb": round(sum(entry["bytes"] for entry in entries) / 1024 / 1024, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed artifact store maintenance.")
+    parser.add_argument("command", choices=("gc", "stats"))
+    parser.add_argument("--root", default=os.getenv("ARTIFACT_DIR", DEFAULT_ROOT))
+    parser.add_argument("--keep-runs", type=int, default=DEFAULT_KEEP_RUNS)
+    parser.add_argument("--max-mb", type=float, default=None)
+    parser.add_argument(
+        "--grace-minutes", type=float, default=DEFAULT_GRACE_MINUTES,
+        help="gc keeps unindexed blobs and staging files modified within this many minutes, "
+             "so it is safe while a test run is writing (default: %(default)s)",
+    )
+    args = parser.parse_args()
+    if args.command == "gc":
+        print(json.dumps(gc(args.root, args.keep_runs, args.max_mb, args.grace_minutes), indent=1))
+    else:
+        print(json.dumps(stats(args.root), indent=1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Log in to Sauce Demo by cookie instead of through the login form.
+
+Sauce Demo keeps the logged-in user in the `session-username` cookie and
+`/inventory.html` only checks that cookie. Setting it directly replaces three
+waits, two clear()+send_keys() pairs, a click and a navigation wait with one
+add_cookie() call. Only tests/test_login.py needs the real form.
+
+The cookies that worked are cached per user for the whole session. If the
+site rejects them (it redirects back to the login page), we log in through the
+UI once and cache the cookies the site actually set.
+"""
+from pages.login_page import LoginPage
+from utilis import run_stats, waits
+from utilis.cart_state import seed_cart, write_cart
+from utilis.logger import get_logger
+from utilis.waits import EventWait
+
+logger = get_logger(__name__)
+
+PASSWORD = "secret_sauce"
+SESSION_COOKIE = "session-username"
+
+# Returns "in" once the inventory rendered, "out" when we were bounced to the
+# login page, null while the page is still settling.
+_LANDING_STATE_JS = """
+if (document.getElementById('inventory_container')) { return 'in'; }
+if (document.getElementById('login-button')) { return 'out'; }
+return null;
+"""
+
+
+class SessionLogin:
+    """Session-wide cookie cache: `login(driver, user)` lands on inventory.html."""
+
+    def __init__(self, base_url: str, password: str = PASSWORD, timeout: int = 10):
+        self.base_url = base_url.rstrip("/")
+        self.password = password
+        self.timeout = timeout
+        self._cookies = {}
+
+    def login(self, driver, user: str = "standard_user", cart=None) -> str:
+        """
+        Log `driver` in as `user`; return "cookie" or "ui" (the path taken).
+        `cart` (product names/ids) is written to localStorage before
+        inventory.html loads, so the page renders with it at no extra cost.
+        """
+        cookies = self._cookies.get(user) or [{"name": SESSION_COOKIE, "value": user, "path": "/"}]
+        if self._login_with_cookies(driver, cookies, cart):
+            self._cookies[user] = cookies
+            run_stats.add("session login", "cookie logins")
+            return "cookie"
+
+        logger.warning("Session cookie rejected for %r; falling back to UI login", user)
+        self._login_with_form(driver, user)
+        self._cookies[user] = self._harvest(driver)
+        if cart:
+            seed_cart(driver, cart)
+        run_stats.add("session login", "ui fallbacks")
+        return "ui"
+
+    def _login_with_cookies(self, driver, cookies, cart=None) -> bool:
+        # Cookies (and localStorage) can only be set for the loaded origin
+        driver.get(self.base_url + "/")
+        for cookie in cookies:
+            driver.add_cookie(cookie)
+        if cart:
+            write_cart(driver, cart)
+        driver.get(self.base_url + "/inventory.html")
+        try:
+            state = EventWait(driver, self.timeout).until(
+                lambda d: d.execute_script(_LANDING_STATE_JS)
+            )
+        except Exception:
+            return False
+        return state == "in"
+
+    def _login_with_form(self, driver, user: str):
+        driver.get(self.base_url + "/")
+        LoginPage(driver).login(user, self.password)
+        EventWait(driver, self.timeout).until(waits.url_contains("inventory.html"))
+
+    def _harvest(self, driver) -> list:
+        # Keep only what add_cookie() needs; drop the short expiry the site sets
+        keep = ("name", "value", "path", "secure", "httpOnly")
+        return [
+            {k: v for k, v in cookie.items() if k in keep}
+            for cookie in driver.get_cookies()
+        ]
@@ -1,8 +1,6 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
-import os
+from utilis import screenshots, waits
+from utilis.waits import EventWait
 from utilis.logger import get_logger
 
 logger = get_logger(__name__)
@@ -14,15 +12,13 @@ def wait_for_element(driver, locator, timeout=10, condition="visible"):
     """
     try:
         if condition == "visible":
-            return WebDriverWait(driver, timeout).until(EC.visibility_of_element_located(locator))
+            return EventWait(driver, timeout).until(waits.visibility_of_element_located(locator))
         elif condition == "clickable":
-            return WebDriverWait(driver, timeout).until(EC.element_to_be_clickable(locator))
+            return EventWait(driver, timeout).until(waits.element_to_be_clickable(locator))
         else:
             raise ValueError(f"Unsupported condition: {repr(condition)}")
     except Exception as e:
-        timestamp = int(time.time())
-        screenshot_path = f"screenshots/wait_error_{timestamp}.png"
-        driver.save_screenshot(screenshot_path)
-        logger.error(f"Element not found: {repr(locator)} | Error: {repr(e)}")
-        logger.info(f"Screenshot saved to: {screenshot_path}")
+        # kept only if the test fails (or with --screenshots=always)
+        screenshots.capture(driver, "wait_error")
+        logger.error("Element not found: %r | Error: %r", locator, e)
         raise
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Seed the Sauce Demo cart without clicking through the inventory.
+
+The app keeps the cart as a JSON array of product ids in
+localStorage["cart-contents"] and renders the badge and the Add/Remove
+buttons from it on page load. Writing that key and loading the page once gives
+a prepared cart in a single script call instead of one card scan + click per
+item. Use it for tests that need a cart but do not test adding to it.
+
+    @pytest.mark.cart("Sauce Labs Backpack", "Sauce Labs Bike Light")
+    def test_checkout(...):          # logged_in_driver seeds the cart
+
+    seed_cart(driver, ["Sauce Labs Onesie", 4])   # mid-test, reloads once
+    assert cart_badge_matches(driver)
+"""
+import json
+
+from utilis.logger import get_logger
+from utilis.read_cache import READ_TAG
+
+logger = get_logger(__name__)
+
+CART_KEY = "cart-contents"
+
+# Product ids used by Sauce Demo (inventory-item.html?id=<id>)
+PRODUCT_IDS = {
+    "Sauce Labs Backpack": 4,
+    "Sauce Labs Bike Light": 0,
+    "Sauce Labs Bolt T-Shirt": 1,
+    "Sauce Labs Fleece Jacket": 5,
+    "Sauce Labs Onesie": 2,
+    "Test.allTheThings() T-Shirt (Red)": 3,
+}
+
+_WRITE_JS = "window.localStorage.setItem(arguments[0], JSON.stringify(arguments[1]));"
+
+_READ_JS = READ_TAG + """
+const badge = document.querySelector('.shopping_cart_badge');
+return {
+  badge: badge ? badge.textContent.trim() : null,
+  stored: window.localStorage.getItem(arguments[0])
+};
+"""
+
+
+def resolve_ids(items) -> list:
+    """Map product names / ids (int or numeric str) to a list of unique ids."""
+    ids = []
+    for item in items:
+        if isinstance(item, int) or (isinstance(item, str) and item.isdigit()):
+            product_id = int(item)
+        elif item in PRODUCT_IDS:
+            product_id = PRODUCT_IDS[item]
+        else:
+            raise ValueError(f"Unknown product: {repr(item)}. Known: {sorted(PRODUCT_IDS)}")
+        if product_id not in ids:
+            ids.append(product_id)
+    return ids
+
+
+def write_cart(driver, items) -> list:
+    """Write the cart into localStorage of the current page (no reload)."""
+    ids = resolve_ids(items)
+    driver.execute_script(_WRITE_JS, CART_KEY, ids)
+    return ids
+
+
+def seed_cart(driver, items) -> list:
+    """Replace the cart with `items` and reload once so the app renders it."""
+    ids = write_cart(driver, items)
+    driver.refresh()
+    logger.info("Seeded cart with ids %s", ids)
+    return ids
+
+
+def cart_badge_matches(driver, items=None) -> bool:
+    """
+    True when the header badge shows as many items as localStorage holds
+    (and, if `items` is given, localStorage holds exactly those products).
+    """
+    state = driver.execute_script(_READ_JS, CART_KEY)
+    stored = _parse_ids(state.get("stored"))
+    badge = int(state["badge"]) if state.get("badge") else 0
+    ok = badge == len(stored)
+    if items is not None:
+        ok = ok and sorted(stored) == sorted(resolve_ids(items))
+    if not ok:
+        logger.warning("Cart mismatch: badge=%s, stored=%s, expected=%s", badge, stored, items)
+    return ok
+
+
+def _parse_ids(raw) -> list:
+    if not raw:
+        return []
+    try:
+        return [int(i) for i in json.loads(raw)]
+    except (ValueError, TypeError):
+        return []
@@ -0,0 +1,70 @@
+"""
+Listeners around every WebDriver command sent by one driver instance.
+
+WebElement methods (click, text, send_keys, ...) go through their parent
+driver's `execute`, so wrapping `driver.execute` on the instance is enough to
+see every HTTP command, whether issued by the driver or by an element.
+
+    class Listener(CommandListener):
+        def before(self, command, params): ...
+        def after(self, command, params, elapsed, error): ...
+
+    add_listener(driver, "name", Listener())
+
+Listeners are keyed by name, so installing the same one twice (e.g. on a
+pooled driver) is a no-op. `before` runs in insertion order, `after` in
+reverse order, so listeners nest like context managers.
+"""
+import time
+
+
+class CommandListener:
+    """No-op base class; override what you need."""
+
+    def before(self, command: str, params: dict):
+        pass
+
+    def after(self, command: str, params: dict, elapsed: float, error: Exception | None):
+        pass
+
+
+def add_listener(driver, name: str, listener: CommandListener):
+    listeners = getattr(driver, "_command_listeners", None)
+    if listeners is None:
+        listeners = {}
+        _wrap_execute(driver, listeners)
+    listeners[name] = listener
+
+
+def remove_listener(driver, name: str):
+    listeners = getattr(driver, "_command_listeners", None)
+    if listeners:
+        listeners.pop(name, None)
+
+
+def get_listener(driver, name: str):
+    return (getattr(driver, "_command_listeners", None) or {}).get(name)
+
+
+def _wrap_execute(driver, listeners: dict):
+    original = driver.execute
+
+    def execute(driver_command, params=None):
+        active = list(listeners.values())
+        for listener in active:
+            listener.before(driver_command, params)
+        start = time.perf_counter()
+        try:
+            result = original(driver_command, params)
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            for listener in reversed(active):
+                listener.after(driver_command, params, elapsed, e)
+            raise
+        elapsed = time.perf_counter() - start
+        for listener in reversed(active):
+            listener.after(driver_command, params, elapsed, None)
+        return result
+
+    driver._command_listeners = listeners
+    driver.execute = execute
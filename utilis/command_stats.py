@@ -0,0 +1,170 @@
+"""
+WebDriver commands per test, attributed to the code that sent them.
+
+The `driver` fixture installs a command listener (see utilis/command_hooks.py)
+that counts and times every HTTP command (findElement, getElementText,
+clickElement, executeScript, ...). Each command is attributed to the
+innermost page-object method on the call stack ("InventoryPage.get_catalog"),
+else to the test function ("test: test_sorting_name_and_price"), else to the
+first project function (fixtures, utilis helpers).
+
+Per test, from setup to the end of the call phase:
+
+  * a table (caller x command: count, time) in the pytest-html report,
+  * an entry in reports/command_stats.json (--command-stats-json),
+  * a budget check: @pytest.mark.max_commands(200) fails a test that passed
+    but sent more than 200 commands.
+
+Screenshots and other teardown work are not counted.
+"""
+import html
+import json
+import os
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from utilis import run_stats
+from utilis.command_hooks import CommandListener, add_listener
+
+SECTION = "commands"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_PAGES = str(PROJECT_ROOT / "pages")
+_TESTS = str(PROJECT_ROOT / "tests")
+_ROOT = str(PROJECT_ROOT)
+# Frames of the instrumentation itself never get the blame
+_SKIP = {str(Path(__file__).resolve()), str(PROJECT_ROOT / "utilis" / "command_hooks.py")}
+
+
+def _caller() -> str:
+    """Innermost page-object method, else the test function, else the first project function."""
+    frame = sys._getframe(2)
+    test = project = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_PAGES):
+            owner = frame.f_locals.get("self")
+            prefix = type(owner).__name__ if owner is not None else Path(filename).stem
+            return f"{prefix}.{frame.f_code.co_name}"
+        if filename.startswith(_ROOT) and filename not in _SKIP:
+            if test is None and filename.startswith(_TESTS):
+                test = f"test: {frame.f_code.co_name}"
+            elif project is None:
+                project = f"{Path(filename).stem}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return test or project or "selenium"
+
+
+class CommandTally:
+    """Commands of one test, keyed by (caller, command)."""
+
+    def __init__(self, nodeid: str):
+        self.nodeid = nodeid
+        self.rows = defaultdict(lambda: [0, 0.0])
+        self.budget = None
+
+    @property
+    def count(self) -> int:
+        return sum(count for count, _ in self.rows.values())
+
+    @property
+    def seconds(self) -> float:
+        return sum(seconds for _, seconds in self.rows.values())
+
+    def add(self, caller: str, command: str, elapsed: float):
+        row = self.rows[(caller, command)]
+        row[0] += 1
+        row[1] += elapsed
+
+    def sorted_rows(self) -> list:
+        return sorted(self.rows.items(), key=lambda item: (-item[1][0], item[0]))
+
+    def to_dict(self) -> dict:
+        return {
+            "commands": self.count,
+            "seconds": round(self.seconds, 4),
+            "budget": self.budget,
+            "rows": [
+                {"caller": caller, "command": command, "count": count, "seconds": round(seconds, 4)}
+                for (caller, command), (count, seconds) in self.sorted_rows()
+            ],
+        }
+
+    def to_html(self) -> str:
+        budget = f" / budget {self.budget}" if self.budget is not None else ""
+        rows = "".join(
+            f"<tr><td>{html.escape(caller)}</td><td>{html.escape(command)}</td>"
+            f"<td>{count}</td><td>{seconds * 1000:.0f}</td></tr>"
+            for (caller, command), (count, seconds) in self.sorted_rows()
+        )
+        return (
+            f"<p><b>WebDriver commands: {self.count}{budget}</b> ({self.seconds:.2f}s)</p>"
+            "<table><tr><th>caller</th><th>command</th><th>count</th><th>ms</th></tr>"
+            f"{rows}</table>"
+        )
+
+
+_active = None
+_results = {}
+
+
+class _Recorder(CommandListener):
+    def after(self, command, params, elapsed, error):
+        if _active is not None:
+            _active.add(_caller(), command, elapsed)
+
+
+_RECORDER = _Recorder()
+
+
+def install(driver):
+    """Count the commands of `driver` (no-op when already installed, e.g. pooled drivers)."""
+    add_listener(driver, "command_stats", _RECORDER)
+
+
+def start(nodeid: str, budget: int | None = None):
+    global _active
+    _active = CommandTally(nodeid)
+    _active.budget = budget
+
+
+def finish() -> CommandTally | None:
+    """Stop counting; returns the commands of the test that just ran."""
+    global _active
+    done, _active = _active, None
+    if done is not None:
+        _results[done.nodeid] = done.to_dict()
+        # A browserless test adds no "commands: 0" section to the summary
+        if done.count:
+            run_stats.add(SECTION, "commands", done.count)
+            run_stats.add(SECTION, "command time (s)", done.seconds)
+    return done
+
+
+def over_budget(done: CommandTally | None) -> str | None:
+    """Failure message when `done` sent more commands than its budget."""
+    if done is None or done.budget is None or done.count <= done.budget:
+        return None
+    run_stats.add(SECTION, "tests over budget")
+    top = ", ".join(f"{caller} {command} x{count}" for (caller, command), (count, _) in done.sorted_rows()[:5])
+    return f"{done.count} WebDriver commands, budget is {done.budget} (max_commands). Top: {top}"
+
+
+def results() -> dict:
+    return dict(_results)
+
+
+def merge(data: dict):
+    _results.update(data or {})
+
+
+def write_json(path):
+    """Write the per-test results to `path`; nothing when no test sent a command (e.g. unit tests only)."""
+    if not any(entry["commands"] for entry in _results.values()):
+        return
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(_results, fh, indent=1, sort_keys=True)
+    os.replace(tmp, path)
@@ -13,7 +13,7 @@ def read_csv_data(filename):
 
     data_list = []
     if not os.path.exists(data_path):
-        logger.error(f"File not found: {repr(data_path)}")
+        logger.error("File not found: %r", data_path)
         return []
 
     try:
@@ -21,7 +21,7 @@ def read_csv_data(filename):
             csv_reader = csv.DictReader(file)
             for row in csv_reader:
                 data_list.append(row)
-        logger.info(f"Loaded data from: {filename} ({len(data_list)} records)")
+        logger.info("Loaded data from: %s (%s records)", filename, len(data_list))
     except Exception as e:
-        logger.error(f"Error reading {filename}: {repr(e)}")
+        logger.error("Error reading %s: %r", filename, e)
     return data_list
\ No newline at end of file
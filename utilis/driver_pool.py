@@ -0,0 +1,143 @@
+"""
+Worker-scoped pool of running browser sessions.
+
+Launching Chrome/Edge is the most expensive part of a test, so in `pool` mode
+the `driver` fixture borrows an already-running session from this pool and
+gives it back after the test. Between tests the session is reset (cookies,
+localStorage, sessionStorage, extra windows, window size, about:blank). A
+session is recycled (quit + relaunched on next acquire) after `max_uses`
+tests or as soon as it stops answering.
+
+Each xdist worker is its own process, so a session-scoped pool is per worker.
+"""
+import shutil
+
+from utilis import run_stats
+from utilis.logger import get_logger
+
+logger = get_logger(__name__)
+
+WINDOW_SIZE = (1440, 900)
+
+
+def quit_driver(driver):
+    """Quit the browser and remove its temporary profile directory."""
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.warning("Error quitting driver: %r", e)
+    finally:
+        profile_dir = getattr(driver, "_tmp_profile_dir", None)
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+def is_alive(driver) -> bool:
+    """Cheap health check: a crashed browser/driver cannot list its windows."""
+    try:
+        return bool(driver.window_handles)
+    except Exception:
+        return False
+
+
+def reset_driver(driver):
+    """
+    Bring a used session back to a blank state:
+      1) close every window except the first one
+      2) clear localStorage/sessionStorage of the current origin
+      3) delete all cookies (CDP for every domain when available)
+      4) restore the default window size and load about:blank
+    """
+    handles = driver.window_handles
+    main = handles[0]
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(main)
+
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except Exception:
+        # about:blank / data: URLs have no storage to clear
+        pass
+
+    try:
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    except Exception:
+        driver.delete_all_cookies()
+
+    driver.set_window_size(*WINDOW_SIZE)
+    driver.get("about:blank")
+
+
+class DriverPool:
+    """
+    Hand out running sessions created by `factory` and take them back.
+
+    Counters (also published to the run summary under "driver pool"):
+      launches  - browsers actually started
+      reuses    - tests served by an already-running browser (= launches saved)
+      recycled  - sessions retired after `max_uses`
+      crashed   - sessions retired because they died or failed to reset
+    """
+
+    def __init__(self, factory, max_uses: int = 20):
+        self.factory = factory
+        self.max_uses = max(1, int(max_uses))
+        self._idle = []
+        self._uses = {}
+        self.launches = 0
+        self.reuses = 0
+        self.recycled = 0
+        self.crashed = 0
+
+    def acquire(self):
+        while self._idle:
+            driver = self._idle.pop()
+            if is_alive(driver):
+                self.reuses += 1
+                run_stats.add("driver pool", "launches saved")
+                return driver
+            self._retire(driver, crashed=True)
+
+        driver = self.factory()
+        self._uses[id(driver)] = 0
+        self.launches += 1
+        run_stats.add("driver pool", "launches")
+        return driver
+
+    def release(self, driver):
+        uses = self._uses.get(id(driver), 0) + 1
+        self._uses[id(driver)] = uses
+
+        if not is_alive(driver):
+            self._retire(driver, crashed=True)
+            return
+        if uses >= self.max_uses:
+            logger.info("Recycling browser after %s uses", uses)
+            self.recycled += 1
+            run_stats.add("driver pool", "recycled")
+            self._retire(driver)
+            return
+        try:
+            reset_driver(driver)
+        except Exception as e:
+            logger.warning("Browser reset failed, recycling it: %r", e)
+            self._retire(driver, crashed=True)
+            return
+        self._idle.append(driver)
+
+    def shutdown(self):
+        while self._idle:
+            self._retire(self._idle.pop())
+        logger.info(
+            "Driver pool: %s launches, %s reuses, %s recycled, %s crashed",
+            self.launches, self.reuses, self.recycled, self.crashed,
+        )
+
+    def _retire(self, driver, crashed: bool = False):
+        if crashed:
+            self.crashed += 1
+            run_stats.add("driver pool", "crashed")
+        self._uses.pop(id(driver), None)
+        quit_driver(driver)
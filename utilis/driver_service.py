@@ -0,0 +1,200 @@
+"""
+One long-lived chromedriver / msedgedriver per process.
+
+Normally every `webdriver.Chrome(...)` / `webdriver.Edge(...)` asks Selenium
+Manager for the driver binary, starts a fresh driver process, waits until it
+accepts connections and stops it again on quit(). With
+--driver-service=shared (DRIVER_SERVICE=shared) the driver binary is
+resolved once, the driver process is started once per process (= per xdist
+worker), and every browser session is opened against it through one shared
+keep-alive HTTP connection pool:
+
+    driver = new_session("chrome", options)     # webdriver.Chrome instance
+    driver.quit()                                # ends the session, keeps the service
+
+The service is restarted when it has died (health-checked before every new
+session). The "driver service" section of the run summary shows service
+startup time and session creation time separately.
+"""
+import atexit
+import threading
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+from utilis import run_stats
+from utilis.logger import get_logger
+
+logger = get_logger(__name__)
+
+SECTION = "driver service"
+MODES = ("per-session", "shared")
+
+_mode = "per-session"
+
+# Attributes RemoteWebDriver.__init__ sets to None and fills lazily per session
+# (BiDi modules, the websocket, DevTools); not all exist in every Selenium 4.x
+_SESSION_STATE = (
+    "_websocket_connection", "_script", "_network", "_browser", "_bidi_session", "_browsing_context",
+    "_storage", "_webextension", "_permissions", "_emulation", "_input", "_request", "_devtools",
+)
+
+
+def configure(mode: str):
+    global _mode
+    if mode not in MODES:
+        raise ValueError(f"Unsupported driver service: {mode}. Supported: {', '.join(MODES)}")
+    _mode = mode
+
+
+def is_shared() -> bool:
+    return _mode == "shared"
+
+
+class _SharedSessionMixin:
+    """A Chrome/Edge driver that ends only its session on quit(), never the service."""
+
+    def __init__(self, shared, options):
+        self.service = shared.service
+        RemoteWebDriver.__init__(self, command_executor=shared.connection, options=options)
+        self._is_remote = False
+
+    def quit(self):
+        # RemoteWebDriver.quit() minus two steps. It skips self.service.stop(),
+        # and it leaves self.command_executor open: that is the service's
+        # ChromiumRemoteConnection, whose keep-alive pool the next session reuses.
+        try:
+            # Close the BiDi/CDP websocket (and its thread) before ending the session
+            if getattr(self, "_websocket_connection", None) is not None:
+                self._websocket_connection.close()
+            self.execute(Command.QUIT)
+        except Exception:
+            # Dead browser or service: the next new_session() restarts what is needed
+            pass
+        finally:
+            request = getattr(self, "_request", None)
+            if request is not None:
+                request.dispose()
+            # Per-session BiDi/CDP state: nothing may outlive the session on this object
+            for name in _SESSION_STATE:
+                if hasattr(self, name):
+                    setattr(self, name, None)
+            self.pinned_scripts = {}
+            self.stop_client()
+
+
+class SharedChrome(_SharedSessionMixin, webdriver.Chrome):
+    pass
+
+
+class SharedEdge(_SharedSessionMixin, webdriver.Edge):
+    pass
+
+
+class SharedService:
+    """The driver process of one browser, plus the HTTP connection pool to it."""
+
+    # service class, driver class, vendor prefix, browserName capability
+    BROWSERS = {
+        "chrome": (ChromeService, SharedChrome, "goog", "chrome"),
+        "edge": (EdgeService, SharedEdge, "ms", "MicrosoftEdge"),
+    }
+
+    def __init__(self, browser: str, driver_path: str | None = None):
+        self.browser = browser
+        self.service_class, self.driver_class, self.vendor, self.browser_name = self.BROWSERS[browser]
+        self.driver_path = driver_path
+        self.browser_path = None
+        self.service = None
+        self.connection = None
+        self._resolved = False
+        self._lock = threading.Lock()
+
+    def _resolve(self, options):
+        """Driver (and browser) binary, looked up once."""
+        if self._resolved:
+            return
+        probe = self.service_class(executable_path=self.driver_path)
+        finder = DriverFinder(probe, options)
+        self.driver_path = probe.env_path() or self.driver_path or finder.get_driver_path()
+        self.browser_path = finder.get_browser_path() or None
+        self._resolved = True
+        logger.info("%s driver resolved once: %s", self.browser, self.driver_path)
+
+    def alive(self) -> bool:
+        if self.service is None or self.service.process is None:
+            return False
+        return self.service.process.poll() is None and self.service.is_connectable()
+
+    def _start(self):
+        restart = self.service is not None
+        if restart:
+            logger.warning("%s driver service died; restarting it.", self.browser)
+            self.stop()
+        start = time.perf_counter()
+        self.service = self.service_class(executable_path=self.driver_path)
+        self.service.start()
+        self.connection = ChromiumRemoteConnection(
+            remote_server_addr=self.service.service_url,
+            vendor_prefix=self.vendor,
+            browser_name=self.browser_name,
+            keep_alive=True,
+        )
+        run_stats.add(SECTION, "service restarts" if restart else "service starts")
+        run_stats.add(SECTION, "service startup (s)", time.perf_counter() - start)
+
+    def new_session(self, options):
+        with self._lock:
+            self._resolve(options)
+            if not self.alive():
+                self._start()
+        if self.browser_path:
+            options.binary_location = self.browser_path
+            options.browser_version = None
+        start = time.perf_counter()
+        driver = self.driver_class(self, options)
+        run_stats.add(SECTION, "sessions")
+        run_stats.add(SECTION, "session creation (s)", time.perf_counter() - start)
+        return driver
+
+    def stop(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+        if self.service is not None:
+            self.service.stop()
+            self.service = None
+
+
+_services = {}
+_services_lock = threading.Lock()
+
+
+def new_session(browser: str, options, driver_path: str | None = None):
+    """Open a browser session against this process's shared `browser` driver service."""
+    with _services_lock:
+        shared = _services.get(browser)
+        if shared is None:
+            shared = _services[browser] = SharedService(browser, driver_path)
+    return shared.new_session(options)
+
+
+def stop_all():
+    """Stop every shared driver service (end of the pytest session / interpreter exit)."""
+    with _services_lock:
+        services = list(_services.values())
+        _services.clear()
+    for shared in services:
+        try:
+            shared.stop()
+        except Exception as e:
+            logger.warning("Error stopping %s driver service: %r", shared.browser, e)
+
+
+atexit.register(stop_all)
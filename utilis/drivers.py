@@ -0,0 +1,180 @@
+# utilis/drivers.py
+"""
+Browser factories used by the `driver` fixture (conftest.py), the driver pool,
+the pre-warmer and the benchmarks under tools/.
+
+With --driver-service=shared, sessions are opened against one long-lived
+driver process per worker (see utilis/driver_service.py).
+"""
+import functools
+import os
+import tempfile
+import uuid
+from pathlib import Path
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.edge.service import Service as EdgeService
+import shutil as sh
+
+from utilis import driver_service
+from utilis.logger import get_logger
+from utilis.profile_template import ProfileTemplate, default_root, needs_disable_dev_shm
+
+logger = get_logger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Set by configure_profiles() (see pytest_configure in conftest.py)
+_profile_root = None
+_profile_templates = {}
+
+@functools.lru_cache(maxsize=None)
+def get_edge_driver_path():
+    """
+    Look for msedgedriver.exe under the PROJECT ROOT (where conftest.py lives),
+    and a few common locations. This matches where you placed the file:
+    <project>/drivers/edgedriver_win64/msedgedriver.exe
+    The answer is cached for the process: the search runs once, not per browser.
+    """
+    # ✅ Point to the project root (where conftest.py lives)
+    project_root = PROJECT_ROOT
+
+    possible_paths = [
+        project_root / "drivers" / "edgedriver_win64" / "msedgedriver.exe",
+        project_root / "drivers" / "msedgedriver.exe",
+        Path("C:/WebDrivers/msedgedriver.exe"),
+        Path.home() / "WebDrivers" / "msedgedriver.exe",
+        Path("msedgedriver.exe"),
+    ]
+
+    path_driver = sh.which("msedgedriver")
+    if path_driver:
+        logger.info("✓ Found Edge driver in PATH: %s", path_driver)
+        return path_driver
+
+    for path in possible_paths:
+        if path.exists() and path.is_file():
+            logger.info("✓ Found Edge driver at: %s", path)
+            return str(path)
+
+    logger.warning("✗ Edge driver not found. Searched locations:")
+    for path in possible_paths:
+        status = "EXISTS" if path.exists() else "NOT FOUND"
+        logger.warning("  [%s] %s", status, path)
+    return None
+
+def configure_profiles(root: str | None = None, template: bool = False):
+    """
+    Choose where per-session profiles are created and whether they are cloned
+    from a seeded template (see utilis/profile_template.py).
+    """
+    global _profile_root
+    _profile_root = root or (default_root() if template else None)
+    remove_profile_templates()
+    if template:
+        for browser, build in (("chrome", build_chrome), ("edge", build_edge)):
+            _profile_templates[browser] = ProfileTemplate(
+                browser,
+                seed=lambda path, build=build: _seed_profile(build, path),
+                root=_profile_root,
+            )
+
+def remove_profile_templates():
+    for template in _profile_templates.values():
+        template.remove()
+    _profile_templates.clear()
+
+def new_profile_dir(browser: str) -> str:
+    """Fresh user-data-dir for one session: a template clone or an empty temp dir."""
+    template = _profile_templates.get(browser)
+    if template:
+        return template.clone()
+    if _profile_root:
+        os.makedirs(_profile_root, exist_ok=True)
+    return tempfile.mkdtemp(prefix=f"{browser}_{uuid.uuid4().hex}_", dir=_profile_root)
+
+def _seed_profile(build, path: str):
+    driver = build(headless=True, profile_dir=path)
+    try:
+        driver.get("about:blank")
+    finally:
+        # plain quit(): the template directory must survive
+        driver.quit()
+
+def build_chrome(headless: bool, profile_dir: str | None = None) -> webdriver.Chrome:
+    options = ChromeOptions()
+    profile = profile_dir or new_profile_dir("chrome")
+    options.add_argument(f"--user-data-dir={profile}")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--no-first-run")
+    options.add_argument("--no-default-browser-check")
+    if needs_disable_dev_shm():
+        options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1440,900")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+    if headless:
+        options.add_argument("--headless=new")
+
+    if driver_service.is_shared():
+        driver = driver_service.new_session("chrome", options)
+    else:
+        driver = webdriver.Chrome(options=options)
+    # attach profile so the fixture can clean it up after the test
+    driver._tmp_profile_dir = profile
+    return driver
+
+def build_edge(headless: bool, profile_dir: str | None = None) -> webdriver.Edge:
+    options = EdgeOptions()
+    profile = profile_dir or new_profile_dir("edge")
+    options.add_argument(f"--user-data-dir={profile}")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--no-first-run")
+    options.add_argument("--no-default-browser-check")
+    if needs_disable_dev_shm():
+        options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1440,900")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+    if headless:
+        options.add_argument("--headless=new")
+
+    driver_path = get_edge_driver_path()
+    if driver_path and driver_service.is_shared():
+        driver = driver_service.new_session("edge", options, driver_path=driver_path)
+    elif driver_path:
+        logger.info("→ Using Edge driver from: %s", driver_path)
+        service = EdgeService(executable_path=driver_path)
+        driver = webdriver.Edge(service=service, options=options)
+    else:
+        project_root = PROJECT_ROOT
+        error_msg = f"""
+╔════════════════════════════════════════════════════════════════╗
+║                   Edge Driver Not Found!                       ║
+╚════════════════════════════════════════════════════════════════╝
+The driver should be at:
+  {project_root / 'drivers' / 'edgedriver_win64' / 'msedgedriver.exe'}
+If the file exists but wasn't found, try:
+1. Move msedgedriver.exe directly to:
+   {project_root / 'drivers' / 'msedgedriver.exe'}
+2. Or place it on PATH and retry.
+Your Edge version: (example) 141.0.3537.92
+Driver download: https://msedgedriver.azureedge.net/141.0.3537.92/edgedriver_win64.zip
+        """
+        raise FileNotFoundError(error_msg)
+
+    # attach profile so the fixture can clean it up after the test
+    driver._tmp_profile_dir = profile
+    return driver
+
+def build_driver(browser: str, headless: bool):
+    if browser == "chrome":
+        return build_chrome(headless=headless)
+    if browser == "edge":
+        return build_edge(headless=headless)
+    raise ValueError(f"Unsupported browser: {browser}. Supported browsers: chrome, edge")
@@ -0,0 +1,104 @@
+"""
+Fast text entry for (React-controlled) inputs.
+
+`element.clear()` + `element.send_keys(text)` makes the browser replay one
+key event per character. With --fast-fill (FAST_FILL=1) `fill()` instead sets
+the value in a single execute_script:
+
+  * through the native HTMLInputElement / HTMLTextAreaElement value setter,
+    so React's value tracker notices the change (a plain `el.value = ...`
+    is ignored by React),
+  * followed by bubbling `input` and `change` events,
+
+and reads the value back. When it did not stick (e.g. a masked input that
+rewrites its value) the field is cleared and typed the normal way.
+
+    fill(driver, element, "standard_user")
+
+Without --fast-fill `fill()` is exactly clear() + send_keys(). Fields filled
+and fallbacks are counted in the "fast fill" section of the run summary.
+
+`fill_many()` does the same for a whole form: with --fast-fill the fields are
+located, set and read back in one execute_script; only the fields whose value
+did not stick cost extra round trips.
+
+    fill_many(driver, [(("id", "first-name"), "Amisha"), (("id", "postal-code"), "560001")])
+"""
+from utilis import run_stats
+from utilis.probe import LOCATE_JS
+
+SECTION = "fast fill"
+
+# arguments: [[target, text], ...], target an element or a [using, value]
+# locator; returns the values after the events (null for a field that was
+# not found). fill() is the one-field case.
+_FILL_MANY_JS = LOCATE_JS + """
+return arguments[0].map(function ([target, text]) {
+  const el = Array.isArray(target) ? locateAll(target[0], target[1])[0] : target;
+  if (!el) { return null; }
+  const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+  el.focus();
+  Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, text);
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+  el.blur();
+  return el.value;
+});
+"""
+
+# arguments: [element, ...]; returns their values
+_VALUES_JS = "return arguments[0].map(el => el.value);"
+
+_enabled = False
+
+
+def configure(enabled: bool):
+    global _enabled
+    _enabled = enabled
+
+
+def type_keys(element, text: str):
+    """The classic path: clear, then one key event per character."""
+    element.clear()
+    element.send_keys(text)
+
+
+def fill(driver, element, text: str, fast: bool | None = None) -> str:
+    """
+    Put `text` into `element`. `fast` overrides --fast-fill for this call.
+    Returns "fast" or "keys", the path that produced the value.
+    """
+    if not (_enabled if fast is None else fast):
+        type_keys(element, text)
+        return "keys"
+    if (driver.execute_script(_FILL_MANY_JS, [[element, text]]) or [None])[0] == text:
+        run_stats.add(SECTION, "fields filled")
+        return "fast"
+    run_stats.add(SECTION, "fell back to keystrokes")
+    type_keys(element, text)
+    return "keys"
+
+
+def fill_many(driver, fields, fast: bool | None = None) -> list:
+    """
+    Put every text of `fields` ([(locator, text), ...]) into the element its
+    locator finds. `fast` overrides --fast-fill for this call. Returns the
+    values read back, in order: one execute_script in all with --fast-fill,
+    otherwise keystrokes per field and one script reading the values.
+    """
+    if not (_enabled if fast is None else fast):
+        elements = [driver.find_element(*locator) for locator, _ in fields]
+        for element, (_, text) in zip(elements, fields):
+            type_keys(element, text)
+        return list(driver.execute_script(_VALUES_JS, elements))
+    values = driver.execute_script(_FILL_MANY_JS, [[list(locator), text] for locator, text in fields]) or []
+    values = list(values) + [None] * (len(fields) - len(values))
+    for i, (locator, text) in enumerate(fields):
+        if values[i] == text:
+            run_stats.add(SECTION, "fields filled")
+            continue
+        run_stats.add(SECTION, "fell back to keystrokes")
+        element = driver.find_element(*locator)
+        type_keys(element, text)
+        values[i] = element.get_attribute("value")
+    return values
@@ -0,0 +1,313 @@
+"""
+Test impact selection.
+
+Every test module depends on a set of input files:
+  * the module itself and, transitively, every project module it imports
+    (pages/*, utilis/*, ...), found by parsing the import statements;
+  * data files those modules name in a string literal (docstrings aside):
+    the literal is the file name or a path ending in it, e.g.
+    "credentials.csv" or "data/credentials.csv" -> data/credentials.csv;
+  * conftest.py (with its own imports) and pytest.ini, shared by all tests;
+  * the visual baselines (--visual-baselines, PNG + .npy), for the modules
+    that depend on utilis/visual.py through their page objects.
+
+After a test passes, the hashes of its inputs are stored in the pytest cache
+together with the run settings (browser, BASE_URL, HEADLESS, driver mode
+and service, pacing, wait mode, fast fill, action cache, adaptive timeouts,
+read cache, profile template, pool max uses, visual mode, screenshot policy
+and the LOCAL_* settings of the local site).
+On the next run with --impact=on a test is deselected when its inputs and
+settings are identical to that last pass. Failed or never-passed tests
+always run. --impact=off (the default) runs everything and still records
+the passes.
+
+The "impact" section of the summary lists, per test module, what was skipped
+or run and why; the number of deselected tests is also printed at the end of
+the terminal summary.
+"""
+import ast
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from utilis import run_stats
+
+SECTION = "impact"
+CACHE_KEY = "impact/passed"
+GLOBAL_INPUTS = ("conftest.py", "pytest.ini")
+DATA_DIR = "data"
+_SKIP_DIRS = {"__pycache__", ".pytest_cache", ".git"}
+VISUAL_MODULE = "utilis/visual.py"
+LOCAL_SITE_ENV = ("LOCAL_CATALOG_SIZE", "LOCAL_LATENCY", "LOCAL_JITTER_MS", "LOCAL_GLITCH_MS", "LOCAL_SEED")
+
+
+class DependencyMap:
+    """Resolves and hashes the input files of project modules under `root`."""
+
+    def __init__(self, root):
+        self.root = Path(root).resolve()
+        self._digests = {}
+        self._direct = {}
+        self._closure = {}
+
+    def rel(self, path: Path) -> str:
+        """Path relative to the root; absolute for files outside it (e.g. a baselines folder elsewhere)."""
+        path = path.resolve()
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def digest(self, path: Path) -> str:
+        key = self.rel(path)
+        if key not in self._digests:
+            try:
+                self._digests[key] = hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+            except OSError:
+                self._digests[key] = "missing"
+        return self._digests[key]
+
+    def module_file(self, name: str):
+        """Project file of dotted module `name`, or None for third-party/stdlib."""
+        base = self.root.joinpath(*name.split("."))
+        for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def _package_inits(self, path: Path):
+        """__init__.py files that are imported before `path` itself."""
+        folder = path.parent
+        while folder != self.root and self.root in folder.parents:
+            init = folder / "__init__.py"
+            if init.is_file() and init != path:
+                yield init
+            folder = folder.parent
+
+    def _imported_names(self, tree, path: Path):
+        package = self.rel(path.parent).replace("/", ".") if path.parent != self.root else ""
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    yield alias.name
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level:
+                    parts = package.split(".") if package else []
+                    parts = parts[:len(parts) - (node.level - 1)]
+                    base = ".".join(parts + ([base] if base else []))
+                for alias in node.names:
+                    # "from pkg import name": name may be a submodule or an attribute
+                    yield f"{base}.{alias.name}" if base else alias.name
+                if base:
+                    yield base
+
+    @staticmethod
+    def _literals(tree) -> set:
+        """String constants of `tree`, docstrings left out."""
+        docstrings = set()
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                body = node.body
+                if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+                    docstrings.add(id(body[0].value))
+        return {node.value for node in ast.walk(tree)
+                if isinstance(node, ast.Constant) and isinstance(node.value, str) and id(node) not in docstrings}
+
+    def _data_files(self, tree, path: Path):
+        """Non-Python files (data/, or in the package of `path`) named by a string literal."""
+        literals = {literal.replace("\\", "/") for literal in self._literals(tree)}
+        if not literals:
+            return
+        folders = {self.root / DATA_DIR}
+        if path.parent != self.root:
+            folders.add(path.parent)
+        for folder in folders:
+            if not folder.is_dir():
+                continue
+            for dirpath, dirnames, filenames in os.walk(folder):
+                dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+                for filename in filenames:
+                    if filename.endswith((".py", ".pyc")):
+                        continue
+                    if filename in literals or any(literal.endswith("/" + filename) for literal in literals):
+                        yield Path(dirpath) / filename
+
+    def direct_inputs(self, path: Path) -> set:
+        key = self.rel(path)
+        if key not in self._direct:
+            found = set(self._package_inits(path))
+            try:
+                tree = ast.parse(path.read_bytes(), filename=str(path))
+            except (OSError, SyntaxError, ValueError):
+                tree = None
+            if tree is not None:
+                for name in self._imported_names(tree, path):
+                    module = self.module_file(name)
+                    if module is not None:
+                        found.add(module)
+                        found.update(self._package_inits(module))
+                found.update(self._data_files(tree, path))
+            found.discard(path)
+            self._direct[key] = found
+        return self._direct[key]
+
+    def folder_inputs(self, folder: Path) -> dict:
+        """{path: digest} of every file under `folder`."""
+        found = {}
+        if folder.is_dir():
+            for dirpath, dirnames, filenames in os.walk(folder):
+                dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+                for filename in filenames:
+                    path = Path(dirpath) / filename
+                    found[self.rel(path)] = self.digest(path)
+        return dict(sorted(found.items()))
+
+    def inputs(self, path: Path) -> dict:
+        """{relative path: digest} of `path` and everything it depends on."""
+        key = self.rel(path)
+        if key not in self._closure:
+            seen, stack = {path.resolve()}, [path.resolve()]
+            while stack:
+                current = stack.pop()
+                if current.suffix != ".py":
+                    continue
+                for dependency in self.direct_inputs(current):
+                    dependency = dependency.resolve()
+                    if dependency not in seen:
+                        seen.add(dependency)
+                        stack.append(dependency)
+            self._closure[key] = {self.rel(p): self.digest(p) for p in sorted(seen)}
+        return self._closure[key]
+
+
+class ImpactSelector:
+    """pytest plugin: deselects unaffected tests and records passes."""
+
+    def __init__(self, config, enabled: bool):
+        self.config = config
+        self.enabled = enabled
+        self.deps = DependencyMap(config.rootpath)
+        self.baselines = Path(config.rootpath) / config.getoption("--visual-baselines")
+        self.settings = {
+            "browser": config.getoption("--browser").lower(),
+            "base_url": os.getenv("BASE_URL", "https://www.saucedemo.com"),
+            "headless": os.getenv("HEADLESS", "false").lower() in {"1", "true", "yes", "on"},
+            "driver_mode": config.getoption("--driver-mode"),
+            "driver_service": config.getoption("--driver-service"),
+            "pace": config.getoption("--pace"),
+            "waits": config.getoption("--waits"),
+            "fast_fill": config.getoption("--fast-fill"),
+            "action_cache": config.getoption("--action-cache"),
+            "adaptive_timeouts": config.getoption("--adaptive-timeouts"),
+            "read_cache": config.getoption("--read-cache"),
+            "profile_template": config.getoption("--profile-template"),
+            "pool_max_uses": config.getoption("--pool-max-uses"),
+            # a pass with --visual=off compared nothing; --screenshots changes what a test captures
+            "visual": config.getoption("--visual"),
+            "screenshots": config.getoption("--screenshots"),
+            # the local site (BASE_URL=local): catalog size, latency, ... change outcomes
+            **{name.lower(): os.getenv(name) for name in LOCAL_SITE_ENV},
+        }
+        self._global = None
+        # xdist workers only select; the controller sees every report and records
+        self.record = not hasattr(config, "workerinput")
+        self.passed = set()
+        self.failed = set()
+        self.deselected = 0
+
+    def inputs_for(self, nodeid: str) -> dict:
+        if self._global is None:
+            self._global = {}
+            for name in GLOBAL_INPUTS:
+                path = self.deps.root / name
+                if path.is_file():
+                    self._global.update(self.deps.inputs(path))
+        inputs = dict(self._global)
+        module = self.deps.inputs(self.deps.root / nodeid.split("::", 1)[0])
+        inputs.update(module)
+        # Page objects with check_visual(): a new or edited baseline changes the outcome
+        if VISUAL_MODULE in module:
+            inputs.update(self.deps.folder_inputs(self.baselines))
+        return inputs
+
+    def why_run(self, previous, inputs: dict) -> str:
+        if not previous:
+            return "no recorded pass"
+        if previous.get("settings") != self.settings:
+            changed = sorted(k for k, v in self.settings.items() if previous.get("settings", {}).get(k) != v)
+            return "settings changed: " + ", ".join(changed)
+        old = previous.get("inputs", {})
+        changed = sorted((set(old) ^ set(inputs)) | {p for p in inputs if old.get(p) != inputs[p]})
+        return "changed: " + ", ".join(changed)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        if not self.enabled:
+            run_stats.note(SECTION, "impact selection off: running all tests")
+            return
+        if any("::" in arg for arg in config.args):
+            # Tests picked by node id on the command line always run
+            run_stats.note(SECTION, "tests selected by node id: impact selection not applied")
+            return
+
+        previous = config.cache.get(CACHE_KEY, {})
+        selected, deselected, reasons = [], [], {}
+        for item in items:
+            inputs = self.inputs_for(item.nodeid)
+            entry = previous.get(item.nodeid)
+            module = item.nodeid.split("::", 1)[0]
+            if entry and entry.get("settings") == self.settings and entry.get("inputs") == inputs:
+                deselected.append(item)
+                reason = f"skipped, {len(inputs)} inputs unchanged since last pass"
+            else:
+                selected.append(item)
+                reason = "run, " + self.why_run(entry, inputs)
+            reasons.setdefault(module, {}).setdefault(reason, 0)
+            reasons[module][reason] += 1
+
+        for module, counts in reasons.items():
+            for reason, count in counts.items():
+                run_stats.note(SECTION, f"{module}: {count} {reason}")
+        run_stats.note(SECTION, f"selected {len(selected)} of {len(items)} tests (--impact=off runs all)")
+        if deselected:
+            self.deselected = len(deselected)
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.deselected:
+            terminalreporter.write_line(
+                f"impact: {self.deselected} test(s) deselected, unchanged since their last pass "
+                f"(--impact=off runs all)",
+                yellow=True,
+            )
+
+    def pytest_runtest_logreport(self, report):
+        if not self.record:
+            return
+        if report.failed:
+            self.failed.add(report.nodeid)
+        elif report.when == "call" and report.passed:
+            self.passed.add(report.nodeid)
+
+    def pytest_sessionfinish(self, session):
+        if not (self.passed or self.failed):
+            return
+        recorded = self.config.cache.get(CACHE_KEY, {})
+        for nodeid in self.failed:
+            recorded.pop(nodeid, None)
+        for nodeid in self.passed - self.failed:
+            recorded[nodeid] = {"settings": self.settings, "inputs": self.inputs_for(nodeid)}
+        self.config.cache.set(CACHE_KEY, recorded)
+
+
+def register(config, enabled: bool):
+    """Install the selector (needs the cache provider, i.e. not with -p no:cacheprovider)."""
+    if getattr(config, "cache", None) is None:
+        return None
+    selector = ImpactSelector(config, enabled)
+    config.pluginmanager.register(selector, "impact_selector")
+    return selector
@@ -0,0 +1,75 @@
+"""
+Product catalog of the local Sauce Demo stand-in.
+
+The first six products are the real Sauce Demo ones (same ids, names and
+prices, so tests and utilis/cart_state.PRODUCT_IDS work unchanged). Larger
+catalogs are padded with deterministic generated products.
+"""
+import random
+
+MIN_SIZE = 6
+MAX_SIZE = 10_000
+
+# (id, name, price in cents, description)
+BASE_PRODUCTS = [
+    (4, "Sauce Labs Backpack", 2999,
+     "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising "
+     "style with unequaled laptop and tablet protection."),
+    (0, "Sauce Labs Bike Light", 999,
+     "A red light isn't the desired state in testing but it sure helps when riding your bike "
+     "at night. Water-resistant with 3 lighting modes, 1 AAA battery included."),
+    (1, "Sauce Labs Bolt T-Shirt", 1599,
+     "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, "
+     "100% ringspun combed cotton, heather gray with red bolt."),
+    (5, "Sauce Labs Fleece Jacket", 4999,
+     "It's not every day that you come across a midweight quarter-zip fleece jacket capable of "
+     "handling everything from a relaxing day outdoors to a busy day at the office."),
+    (2, "Sauce Labs Onesie", 799,
+     "Rib snap infant onesie for the junior automation engineer in development. Reinforced "
+     "3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."),
+    (3, "Test.allTheThings() T-Shirt (Red)", 1599,
+     "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to "
+     "automate a few tests. Super-soft and comfy ringspun combed cotton."),
+]
+
+_ADJECTIVES = ("Classic", "Deluxe", "Compact", "Rugged", "Vintage", "Premium", "Travel", "Pro")
+_NOUNS = ("Mug", "Cap", "Hoodie", "Sticker Pack", "Water Bottle", "Notebook", "Tote Bag", "Socks")
+
+
+def slug(name: str) -> str:
+    """Button id suffix the way Sauce Demo builds it ("add-to-cart-<slug>")."""
+    return "-".join(name.lower().split())
+
+
+def build_catalog(size: int = MIN_SIZE, seed: int = 0) -> list:
+    """
+    Return `size` products as dicts {id, name, desc, price (cents), slug}.
+    The same (size, seed) always yields the same catalog.
+    """
+    size = int(size)
+    if not MIN_SIZE <= size <= MAX_SIZE:
+        raise ValueError(f"Catalog size must be between {MIN_SIZE} and {MAX_SIZE}, got {size}")
+
+    products = [
+        {"id": pid, "name": name, "price": price, "desc": desc}
+        for pid, name, price, desc in BASE_PRODUCTS
+    ]
+    rng = random.Random(seed)
+    for pid in range(len(BASE_PRODUCTS), size):
+        adjective = _ADJECTIVES[pid % len(_ADJECTIVES)]
+        noun = _NOUNS[(pid // len(_ADJECTIVES)) % len(_NOUNS)]
+        name = f"Sauce Labs {adjective} {noun} {pid:05d}"
+        products.append({
+            "id": pid,
+            "name": name,
+            "price": rng.randint(299, 9999),
+            "desc": f"Generated product #{pid} for catalog-size testing: a {adjective.lower()} "
+                    f"{noun.lower()} with the Sauce Labs logo.",
+        })
+    for product in products:
+        product["slug"] = slug(product["name"])
+    return products
+
+
+def format_price(cents: int) -> str:
+    return f"${cents / 100:.2f}"
@@ -0,0 +1,216 @@
+"""
+HTML for the local Sauce Demo stand-in.
+
+Every id, class and data-test attribute the page objects in pages/ rely on is
+kept identical to www.saucedemo.com. Lists that depend on the cart (cart,
+checkout overview) are rendered client-side from localStorage by
+static/app.js, exactly like the real app.
+"""
+import json
+from html import escape
+
+from utilis.local_site.catalog import format_price
+
+TAX_RATE = 0.08
+
+
+def _layout(page: str, body: str, app: dict, with_catalog: bool = False) -> str:
+    app = dict(app, page=page)
+    catalog_script = '<script src="/catalog.js"></script>' if with_catalog else ""
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Swag Labs</title>
+<link rel="stylesheet" href="/static/app.css">
+<script>window.APP = {json.dumps(app)};</script>
+{catalog_script}
+<script src="/static/app.js"></script>
+</head>
+<body>
+<div id="root"><div class="page_wrapper"><div id="page_wrapper">
+{body}
+</div></div></div>
+</body>
+</html>"""
+
+
+def _header(title: str, secondary: str = "") -> str:
+    return f"""<div id="header_container" class="header_container" data-test="header-container">
+  <div class="primary_header" data-test="primary-header">
+    <div id="menu_button_container">
+      <button type="button" id="react-burger-menu-btn">Open Menu</button>
+      <div class="bm-menu-wrap" aria-hidden="true">
+        <div class="bm-menu">
+          <nav class="bm-item-list">
+            <a id="inventory_sidebar_link" class="bm-item menu-item" href="/inventory.html" data-test="inventory-sidebar-link">All Items</a>
+            <a id="about_sidebar_link" class="bm-item menu-item" href="https://saucelabs.com/" data-test="about-sidebar-link">About</a>
+            <a id="logout_sidebar_link" class="bm-item menu-item" href="/" data-test="logout-sidebar-link">Logout</a>
+            <a id="reset_sidebar_link" class="bm-item menu-item" href="#" data-test="reset-sidebar-link">Reset App State</a>
+          </nav>
+        </div>
+        <div class="bm-cross-button"><button type="button" id="react-burger-cross-btn">Close Menu</button></div>
+      </div>
+    </div>
+    <div class="header_label"><div class="app_logo">Swag Labs</div></div>
+    <div id="shopping_cart_container" class="shopping_cart_container">
+      <a class="shopping_cart_link" href="/cart.html" data-test="shopping-cart-link"></a>
+    </div>
+  </div>
+  <div class="header_secondary_container" data-test="secondary-header">
+    <span class="title" data-test="title">{escape(title)}</span>
+    {secondary}
+  </div>
+</div>"""
+
+
+def login(app: dict) -> str:
+    body = """<div class="login_container"><div class="login_logo">Swag Labs</div>
+  <div class="login_wrapper"><form id="login_form">
+    <input class="input_error form_input" placeholder="Username" type="text" data-test="username" id="user-name" name="user-name" autocorrect="off" autocapitalize="none">
+    <input class="input_error form_input" placeholder="Password" type="password" data-test="password" id="password" name="password" autocorrect="off" autocapitalize="none">
+    <div class="error-message-container"></div>
+    <input type="submit" class="submit-button btn_action" data-test="login-button" id="login-button" name="login-button" value="Login">
+  </form></div>
+</div>"""
+    return _layout("login", body, app)
+
+
+def _inventory_card(product: dict, image: str) -> str:
+    pid, name, slug = product["id"], escape(product["name"]), product["slug"]
+    return f"""<div class="inventory_item" data-test="inventory-item" data-name="{name}" data-price="{product['price']}">
+  <div class="inventory_item_img"><a href="/inventory-item.html?id={pid}" id="item_{pid}_img_link" data-test="item-{pid}-img-link"><img alt="{name}" class="inventory_item_img" src="{image}"></a></div>
+  <div class="inventory_item_description" data-test="inventory-item-description">
+    <div class="inventory_item_label">
+      <a href="/inventory-item.html?id={pid}" id="item_{pid}_title_link" data-test="item-{pid}-title-link"><div class="inventory_item_name" data-test="inventory-item-name">{name}</div></a>
+      <div class="inventory_item_desc" data-test="inventory-item-desc">{escape(product['desc'])}</div>
+    </div>
+    <div class="pricebar">
+      <div class="inventory_item_price" data-test="inventory-item-price">{format_price(product['price'])}</div>
+      <button class="btn btn_primary btn_small btn_inventory" data-id="{pid}" data-slug="{slug}" id="add-to-cart-{slug}" name="add-to-cart-{slug}" data-test="add-to-cart-{slug}">Add to cart</button>
+    </div>
+  </div>
+</div>"""
+
+
+def inventory(app: dict, products: list, image_for) -> str:
+    ordered = sorted(products, key=lambda p: p["name"])
+    sort_box = """<span class="select_container">
+      <span class="active_option" data-test="active-option">Name (A to Z)</span>
+      <select class="product_sort_container" data-test="product_sort_container">
+        <option value="az">Name (A to Z)</option>
+        <option value="za">Name (Z to A)</option>
+        <option value="lohi">Price (low to high)</option>
+        <option value="hilo">Price (high to low)</option>
+      </select>
+    </span>"""
+    cards = "\n".join(_inventory_card(p, image_for(p)) for p in ordered)
+    body = f"""{_header("Products", sort_box)}
+<div id="inventory_container" class="inventory_container" data-test="inventory-container">
+  <div class="inventory_list" data-test="inventory-list">
+{cards}
+  </div>
+</div>"""
+    return _layout("inventory", body, app)
+
+
+def item(app: dict, product: dict | None, image_for) -> str:
+    if product is None:
+        details = """<div class="inventory_details_name large_size" data-test="inventory-item-name">ITEM NOT FOUND</div>
+    <div class="inventory_details_desc large_size" data-test="inventory-item-desc">We're sorry, but your call could not be completed as dialled.</div>"""
+    else:
+        name = escape(product["name"])
+        details = f"""<img alt="{name}" class="inventory_details_img" src="{image_for(product)}" data-test="item-sauce-labs-img">
+    <div class="inventory_details_desc_container">
+      <div class="inventory_details_name large_size" data-test="inventory-item-name">{name}</div>
+      <div class="inventory_details_desc large_size" data-test="inventory-item-desc">{escape(product['desc'])}</div>
+      <div class="inventory_details_price" data-test="inventory-item-price">{format_price(product['price'])}</div>
+      <button class="btn btn_primary btn_small btn_inventory" data-id="{product['id']}" id="add-to-cart" name="add-to-cart" data-test="add-to-cart">Add to cart</button>
+    </div>"""
+    back = '<button class="btn btn_secondary back btn_large inventory_details_back_button" id="back-to-products" name="back-to-products" data-test="back-to-products">Back to products</button>'
+    body = f"""{_header("", back)}
+<div class="inventory_details" data-test="inventory-container">
+  <div class="inventory_details_container">
+    {details}
+  </div>
+</div>"""
+    return _layout("item", body, app)
+
+
+def cart(app: dict) -> str:
+    body = f"""{_header("Your Cart")}
+<div id="cart_contents_container" class="cart_contents_container" data-test="cart-contents-container">
+  <div class="cart_list" data-test="cart-list">
+    <div class="cart_quantity_label" data-test="cart-quantity-label">QTY</div>
+    <div class="cart_desc_label" data-test="cart-desc-label">Description</div>
+  </div>
+  <div class="cart_footer">
+    <button class="btn btn_secondary back btn_medium" id="continue-shopping" name="continue-shopping" data-test="continue-shopping">Continue Shopping</button>
+    <button class="btn btn_action btn_medium checkout_button" id="checkout" name="checkout" data-test="checkout">Checkout</button>
+  </div>
+</div>"""
+    return _layout("cart", body, app, with_catalog=True)
+
+
+def step_one(app: dict) -> str:
+    body = f"""{_header("Checkout: Your Information")}
+<div id="checkout_info_container" class="checkout_info_container" data-test="checkout-info-container">
+  <form id="checkout_info_form">
+    <div class="checkout_info">
+      <input class="input_error form_input" placeholder="First Name" type="text" data-test="firstName" id="first-name" name="firstName">
+      <input class="input_error form_input" placeholder="Last Name" type="text" data-test="lastName" id="last-name" name="lastName">
+      <input class="input_error form_input" placeholder="Zip/Postal Code" type="text" data-test="postalCode" id="postal-code" name="postalCode">
+      <div class="error-message-container"></div>
+    </div>
+    <div class="checkout_buttons">
+      <button type="button" class="btn btn_secondary back btn_medium cart_cancel_link" id="cancel" name="cancel" data-test="cancel">Cancel</button>
+      <input type="submit" class="submit-button btn btn_primary cart_button btn_action" data-test="continue" id="continue" name="continue" value="Continue">
+    </div>
+  </form>
+</div>"""
+    return _layout("step-one", body, app)
+
+
+def step_two(app: dict) -> str:
+    body = f"""{_header("Checkout: Overview")}
+<div id="checkout_summary_container" class="checkout_summary_container" data-test="checkout-summary-container">
+  <div class="cart_list" data-test="cart-list">
+    <div class="cart_quantity_label" data-test="cart-quantity-label">QTY</div>
+    <div class="cart_desc_label" data-test="cart-desc-label">Description</div>
+  </div>
+  <div class="summary_info">
+    <div class="summary_info_label" data-test="payment-info-label">Payment Information:</div>
+    <div class="summary_value_label" data-test="payment-info-value">SauceCard #31337</div>
+    <div class="summary_info_label" data-test="shipping-info-label">Shipping Information:</div>
+    <div class="summary_value_label" data-test="shipping-info-value">Free Pony Express Delivery!</div>
+    <div class="summary_info_label" data-test="total-info-label">Price Total</div>
+    <div class="summary_subtotal_label" data-test="subtotal-label">Item total: $0.00</div>
+    <div class="summary_tax_label" data-test="tax-label">Tax: $0.00</div>
+    <div class="summary_info_label summary_total_label" data-test="total-label">Total: $0.00</div>
+    <div class="cart_footer">
+      <button class="btn btn_secondary back btn_medium cart_cancel_link" id="cancel" name="cancel" data-test="cancel">Cancel</button>
+      <button class="btn btn_action btn_medium cart_button" id="finish" name="finish" data-test="finish">Finish</button>
+    </div>
+  </div>
+</div>"""
+    return _layout("step-two", body, dict(app, taxRate=TAX_RATE), with_catalog=True)
+
+
+def complete(app: dict) -> str:
+    body = f"""{_header("Checkout: Complete!")}
+<div id="checkout_complete_container" class="checkout_complete_container" data-test="checkout-complete-container">
+  <img alt="Pony Express" class="pony_express" src="/static/img/pony-express.png" data-test="pony-express">
+  <h2 class="complete-header" data-test="complete-header">Thank you for your order!</h2>
+  <div class="complete-text" data-test="complete-text">Your order has been dispatched, and will arrive just as fast as the pony can get there!</div>
+  <button class="btn btn_primary btn_small" id="back-to-products" name="back-to-products" data-test="back-to-products">Back Home</button>
+</div>"""
+    return _layout("complete", body, app)
+
+
+def catalog_js(products: list) -> str:
+    data = {
+        p["id"]: {"id": p["id"], "name": escape(p["name"]), "desc": escape(p["desc"]),
+                  "price": p["price"], "slug": p["slug"]}
+        for p in products
+    }
+    return f"window.CATALOG = {json.dumps(data)};"
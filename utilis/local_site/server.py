@@ -0,0 +1,253 @@
+"""
+Local stand-in for www.saucedemo.com.
+
+Serves the login, inventory, item, cart, checkout step one/two and complete
+pages with the ids, classes and data-test attributes the page objects use, so
+the suite runs offline and deterministically:
+
+    BASE_URL=local pytest                  # conftest starts it per worker
+    python -m utilis.local_site.server --catalog-size 1000 --port 8000
+
+Knobs (arguments or environment variables):
+    catalog_size  LOCAL_CATALOG_SIZE  6..10,000 products (default 6)
+    latency       LOCAL_LATENCY       per-route delay in ms, e.g.
+                                      "inventory.html=150,cart.html=40,*=10"
+    jitter_ms     LOCAL_JITTER_MS     +/- uniform jitter added to every delay
+    glitch_ms     LOCAL_GLITCH_MS     extra delay for performance_glitch_user
+                                      on inventory pages (default 2500)
+    seed          LOCAL_SEED          seed for the catalog and the jitter
+
+Personas: standard_user, locked_out_user (cannot log in), problem_user (one
+image for every product, broken sorting and "Remove"),
+performance_glitch_user (slow inventory pages).
+"""
+import argparse
+import os
+import random
+import struct
+import threading
+import time
+import zlib
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlparse
+
+from utilis.local_site import pages
+from utilis.local_site.catalog import MIN_SIZE, build_catalog
+from utilis.logger import get_logger
+
+logger = get_logger(__name__)
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+PASSWORD = "secret_sauce"
+USERS = ("standard_user", "locked_out_user", "problem_user", "performance_glitch_user")
+LOCKED_USERS = ("locked_out_user",)
+
+# Pages that bounce to the login page without a valid session cookie
+PROTECTED = {
+    "/inventory.html", "/inventory-item.html", "/cart.html",
+    "/checkout-step-one.html", "/checkout-step-two.html", "/checkout-complete.html",
+}
+
+
+def parse_latency(spec: str | None) -> dict:
+    """'inventory.html=150,*=10' -> {'/inventory.html': 0.15, '*': 0.01} (seconds)."""
+    latency = {}
+    for part in (spec or "").split(","):
+        if not part.strip():
+            continue
+        route, _, ms = part.partition("=")
+        route = route.strip()
+        if route != "*" and not route.startswith("/"):
+            route = "/" + route
+        latency[route] = float(ms) / 1000.0
+    return latency
+
+
+def _png(width: int, height: int, rgb: tuple) -> bytes:
+    """Solid-colour RGB PNG (enough for img.complete / naturalWidth checks)."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    row = b"\x00" + bytes(rgb) * width
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(row * height))
+            + chunk(b"IEND", b""))
+
+
+class LocalSauceDemo:
+    """A threaded HTTP server on 127.0.0.1; `url` is valid after `start()`."""
+
+    def __init__(self, catalog_size: int = MIN_SIZE, latency: dict | None = None,
+                 jitter_ms: float = 0.0, glitch_ms: float = 2500.0, seed: int = 0,
+                 host: str = "127.0.0.1", port: int = 0):
+        self.products = build_catalog(catalog_size, seed=seed)
+        self.by_id = {p["id"]: p for p in self.products}
+        self.latency = latency or {}
+        self.jitter = jitter_ms / 1000.0
+        self.glitch = glitch_ms / 1000.0
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._catalog_js = pages.catalog_js(self.products).encode("utf-8")
+        self._images = {}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @classmethod
+    def from_env(cls, **overrides):
+        kwargs = {
+            "catalog_size": int(os.getenv("LOCAL_CATALOG_SIZE", str(MIN_SIZE))),
+            "latency": parse_latency(os.getenv("LOCAL_LATENCY")),
+            "jitter_ms": float(os.getenv("LOCAL_JITTER_MS", "0")),
+            "glitch_ms": float(os.getenv("LOCAL_GLITCH_MS", "2500")),
+            "seed": int(os.getenv("LOCAL_SEED", "0")),
+        }
+        kwargs.update(overrides)
+        return cls(**kwargs)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="local-saucedemo", daemon=True)
+        self._thread.start()
+        logger.info("Local Sauce Demo serving %s products at %s", len(self.products), self.url)
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    # ---------- request handling ----------
+    def delay_for(self, path: str, user: str | None) -> float:
+        delay = self.latency.get(path, self.latency.get("*", 0.0))
+        if self.jitter:
+            with self._rng_lock:
+                delay += self._rng.uniform(-self.jitter, self.jitter)
+        if user == "performance_glitch_user" and path in ("/inventory.html", "/inventory-item.html"):
+            delay += self.glitch
+        return max(0.0, delay)
+
+    def image_for(self, user: str | None):
+        if user == "problem_user":
+            return lambda product: "/static/img/sl-404.png"
+        return lambda product: f"/static/img/{product['id']}.png"
+
+    def image(self, name: str) -> bytes | None:
+        if name not in self._images:
+            if name == "sl-404":
+                rgb = (90, 60, 40)
+            elif name == "pony-express":
+                rgb = (61, 220, 145)
+            elif name.isdigit() and int(name) in self.by_id:
+                pid = int(name)
+                rgb = ((pid * 53) % 256, (pid * 97) % 256, (pid * 193) % 256)
+            else:
+                return None
+            self._images[name] = _png(64, 64, rgb)
+        return self._images[name]
+
+    def render(self, path: str, query: dict, user: str | None) -> str | None:
+        app = {"persona": user, "users": list(USERS), "lockedUsers": list(LOCKED_USERS), "password": PASSWORD}
+        if path in ("/", "/index.html"):
+            return pages.login(app)
+        if path == "/inventory.html":
+            return pages.inventory(app, self.products, self.image_for(user))
+        if path == "/inventory-item.html":
+            raw_id = query.get("id", [""])[0]
+            product = self.by_id.get(int(raw_id)) if raw_id.isdigit() else None
+            return pages.item(app, product, self.image_for(user))
+        if path == "/cart.html":
+            return pages.cart(app)
+        if path == "/checkout-step-one.html":
+            return pages.step_one(app)
+        if path == "/checkout-step-two.html":
+            return pages.step_two(app)
+        if path == "/checkout-complete.html":
+            return pages.complete(app)
+        return None
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                path = parsed.path
+                cookie = SimpleCookie(self.headers.get("Cookie", ""))
+                user = unquote(cookie["session-username"].value) if "session-username" in cookie else None
+
+                if path == "/catalog.js":
+                    return self._send(200, site._catalog_js, "application/javascript", cache=True)
+                if path.startswith("/static/img/") and path.endswith(".png"):
+                    body = site.image(path[len("/static/img/"):-len(".png")])
+                    if body is None:
+                        return self._send(404, b"not found", "text/plain")
+                    return self._send(200, body, "image/png", cache=True)
+                if path in ("/static/app.js", "/static/app.css"):
+                    kind = "application/javascript" if path.endswith(".js") else "text/css"
+                    return self._send(200, (STATIC_DIR / path.rsplit("/", 1)[1]).read_bytes(), kind, cache=True)
+                if path == "/favicon.ico":
+                    return self._send(204, b"", "image/x-icon")
+
+                delay = site.delay_for(path, user)
+                if delay:
+                    time.sleep(delay)
+                if path in PROTECTED and (user not in USERS or user in LOCKED_USERS):
+                    self.send_response(302)
+                    self.send_header("Location", "/")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                html = site.render(path, parse_qs(parsed.query), user)
+                if html is None:
+                    return self._send(404, b"<h1>404 Not Found</h1>", "text/html")
+                return self._send(200, html.encode("utf-8"), "text/html; charset=utf-8")
+
+            def _send(self, status: int, body: bytes, content_type: str, cache: bool = False):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "max-age=3600" if cache else "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("local-saucedemo: " + format % args)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the local Sauce Demo stand-in.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--catalog-size", type=int, default=int(os.getenv("LOCAL_CATALOG_SIZE", str(MIN_SIZE))))
+    parser.add_argument("--latency", default=os.getenv("LOCAL_LATENCY"), help="e.g. 'inventory.html=150,*=10'")
+    parser.add_argument("--jitter-ms", type=float, default=float(os.getenv("LOCAL_JITTER_MS", "0")))
+    args = parser.parse_args()
+    site = LocalSauceDemo.from_env(
+        catalog_size=args.catalog_size,
+        latency=parse_latency(args.latency),
+        jitter_ms=args.jitter_ms,
+        port=args.port,
+    ).start()
+    print(f"Serving at {site.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+// Client-side behaviour of the local Sauce Demo stand-in.
+// Same storage contract as the real app: the cart is a JSON array of product
+// ids in localStorage["cart-contents"], the user is the "session-username" cookie.
+(function () {
+  'use strict';
+
+  var CART_KEY = 'cart-contents';
+  var APP = window.APP || {};
+
+  // ---------- cart ----------
+  function getCart() {
+    try {
+      var ids = JSON.parse(window.localStorage.getItem(CART_KEY) || '[]');
+      return Array.isArray(ids) ? ids.map(Number) : [];
+    } catch (e) {
+      return [];
+    }
+  }
+
+  function setCart(ids) {
+    if (ids.length) {
+      window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+    } else {
+      window.localStorage.removeItem(CART_KEY);
+    }
+    renderBadge();
+  }
+
+  function toggleCart(id) {
+    var cart = getCart();
+    var index = cart.indexOf(id);
+    if (index >= 0) {
+      cart.splice(index, 1);
+    } else {
+      cart.push(id);
+    }
+    setCart(cart);
+  }
+
+  function renderBadge() {
+    var link = document.querySelector('.shopping_cart_link');
+    if (!link) { return; }
+    var badge = link.querySelector('.shopping_cart_badge');
+    var count = getCart().length;
+    if (!count) {
+      if (badge) { badge.remove(); }
+      return;
+    }
+    if (!badge) {
+      badge = document.createElement('span');
+      badge.className = 'shopping_cart_badge';
+      badge.setAttribute('data-test', 'shopping-cart-badge');
+      link.appendChild(badge);
+    }
+    badge.textContent = String(count);
+  }
+
+  // Add/Remove buttons carry data-id and data-slug; ids follow the real app
+  function renderButton(button) {
+    var inCart = getCart().indexOf(Number(button.dataset.id)) >= 0;
+    var id = button.dataset.slug ? (inCart ? 'remove-' : 'add-to-cart-') + button.dataset.slug
+                                 : (inCart ? 'remove' : 'add-to-cart');
+    button.textContent = inCart ? 'Remove' : 'Add to cart';
+    button.id = id;
+    button.name = id;
+    button.setAttribute('data-test', id);
+    button.classList.toggle('btn_primary', !inCart);
+    button.classList.toggle('btn_secondary', inCart);
+  }
+
+  function renderButtons() {
+    var buttons = document.querySelectorAll('button.btn_inventory');
+    for (var i = 0; i < buttons.length; i++) { renderButton(buttons[i]); }
+  }
+
+  function onInventoryButton(event) {
+    var button = event.target.closest('button.btn_inventory');
+    if (!button) { return; }
+    var id = Number(button.dataset.id);
+    // problem_user: "Remove" silently does nothing, like on the real site
+    if (APP.persona === 'problem_user' && getCart().indexOf(id) >= 0) { return; }
+    toggleCart(id);
+    renderButton(button);
+  }
+
+  // ---------- header / menu ----------
+  function initMenu() {
+    var wrap = document.querySelector('.bm-menu-wrap');
+    if (!wrap) { return; }
+    function show(open) {
+      wrap.style.display = open ? 'block' : 'none';
+      wrap.setAttribute('aria-hidden', open ? 'false' : 'true');
+    }
+    document.getElementById('react-burger-menu-btn').addEventListener('click', function () { show(true); });
+    document.getElementById('react-burger-cross-btn').addEventListener('click', function () { show(false); });
+    document.getElementById('logout_sidebar_link').addEventListener('click', function (event) {
+      event.preventDefault();
+      document.cookie = 'session-username=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT';
+      window.location.href = '/';
+    });
+    document.getElementById('reset_sidebar_link').addEventListener('click', function (event) {
+      event.preventDefault();
+      setCart([]);
+      renderButtons();
+    });
+  }
+
+  // ---------- pages ----------
+  function initLogin() {
+    var form = document.getElementById('login_form');
+    var error = document.querySelector('.error-message-container');
+    function fail(message) {
+      error.innerHTML = '<h3 data-test="error">Epic sadface: ' + message + '</h3>';
+      error.classList.add('error');
+    }
+    form.addEventListener('submit', function (event) {
+      event.preventDefault();
+      var user = document.getElementById('user-name').value;
+      var password = document.getElementById('password').value;
+      if (!user) { return fail('Username is required'); }
+      if (!password) { return fail('Password is required'); }
+      if (APP.users.indexOf(user) < 0 || password !== APP.password) {
+        return fail('Username and password do not match any user in this service');
+      }
+      if (APP.lockedUsers.indexOf(user) >= 0) {
+        return fail('Sorry, this user has been locked out.');
+      }
+      document.cookie = 'session-username=' + encodeURIComponent(user) + '; path=/';
+      window.location.href = '/inventory.html';
+    });
+  }
+
+  function compareBy(order) {
+    return function (a, b) {
+      var an = a.dataset.name, bn = b.dataset.name;
+      var ap = Number(a.dataset.price), bp = Number(b.dataset.price);
+      switch (order) {
+        case 'za': return an < bn ? 1 : an > bn ? -1 : 0;
+        case 'lohi': return ap - bp;
+        case 'hilo': return bp - ap;
+        default: return an < bn ? -1 : an > bn ? 1 : 0;
+      }
+    };
+  }
+
+  function initInventory() {
+    var list = document.querySelector('.inventory_list');
+    var select = document.querySelector('select.product_sort_container');
+    var active = document.querySelector('.active_option');
+    renderButtons();
+    list.addEventListener('click', onInventoryButton);
+    select.addEventListener('change', function () {
+      active.textContent = select.options[select.selectedIndex].text;
+      if (APP.persona === 'problem_user') { return; }  // sorting is broken for problem_user
+      var items = Array.prototype.slice.call(list.children);
+      items.sort(compareBy(select.value));
+      var fragment = document.createDocumentFragment();
+      items.forEach(function (item) { fragment.appendChild(item); });
+      list.appendChild(fragment);
+    });
+  }
+
+  function initItem() {
+    var button = document.querySelector('button.btn_inventory');
+    if (!button) { return; }
+    renderButton(button);
+    button.addEventListener('click', onInventoryButton);
+    document.getElementById('back-to-products').addEventListener('click', function () {
+      window.location.href = '/inventory.html';
+    });
+  }
+
+  function money(cents) { return '$' + (cents / 100).toFixed(2); }
+
+  function cartLines() {
+    var catalog = window.CATALOG || {};
+    return getCart().map(function (id) { return catalog[id]; }).filter(Boolean);
+  }
+
+  function lineHtml(product, withRemove) {
+    return '<div class="cart_item" data-test="inventory-item">' +
+      '<div class="cart_quantity" data-test="item-quantity">1</div>' +
+      '<div class="cart_item_label">' +
+        '<a href="/inventory-item.html?id=' + product.id + '" id="item_' + product.id + '_title_link">' +
+          '<div class="inventory_item_name" data-test="inventory-item-name">' + product.name + '</div></a>' +
+        '<div class="inventory_item_desc" data-test="inventory-item-desc">' + product.desc + '</div>' +
+        '<div class="item_pricebar">' +
+          '<div class="inventory_item_price" data-test="inventory-item-price">' + money(product.price) + '</div>' +
+          (withRemove ? '<button class="btn btn_secondary btn_small cart_button" data-id="' + product.id +
+            '" id="remove-' + product.slug + '" data-test="remove-' + product.slug + '">Remove</button>' : '') +
+        '</div>' +
+      '</div>' +
+    '</div>';
+  }
+
+  function initCart() {
+    var list = document.querySelector('.cart_list');
+    list.insertAdjacentHTML('beforeend', cartLines().map(function (p) { return lineHtml(p, true); }).join(''));
+    list.addEventListener('click', function (event) {
+      var button = event.target.closest('button.cart_button');
+      if (!button) { return; }
+      toggleCart(Number(button.dataset.id));
+      button.closest('.cart_item').remove();
+    });
+    document.getElementById('continue-shopping').addEventListener('click', function () {
+      window.location.href = '/inventory.html';
+    });
+    document.getElementById('checkout').addEventListener('click', function () {
+      window.location.href = '/checkout-step-one.html';
+    });
+  }
+
+  function initStepOne() {
+    var error = document.querySelector('.error-message-container');
+    document.getElementById('checkout_info_form').addEventListener('submit', function (event) {
+      event.preventDefault();
+      var fields = [['first-name', 'First Name'], ['last-name', 'Last Name'], ['postal-code', 'Postal Code']];
+      for (var i = 0; i < fields.length; i++) {
+        if (!document.getElementById(fields[i][0]).value) {
+          error.innerHTML = '<h3 data-test="error">Error: ' + fields[i][1] + ' is required</h3>';
+          error.classList.add('error');
+          return;
+        }
+      }
+      window.location.href = '/checkout-step-two.html';
+    });
+    document.getElementById('cancel').addEventListener('click', function () {
+      window.location.href = '/cart.html';
+    });
+  }
+
+  function initStepTwo() {
+    var lines = cartLines();
+    var itemTotal = lines.reduce(function (sum, p) { return sum + p.price; }, 0);
+    var tax = Math.round(itemTotal * APP.taxRate);
+    document.querySelector('.cart_list').insertAdjacentHTML(
+      'beforeend', lines.map(function (p) { return lineHtml(p, false); }).join(''));
+    document.querySelector('.summary_subtotal_label').textContent = 'Item total: ' + money(itemTotal);
+    document.querySelector('.summary_tax_label').textContent = 'Tax: ' + money(tax);
+    document.querySelector('.summary_total_label').textContent = 'Total: ' + money(itemTotal + tax);
+    document.getElementById('finish').addEventListener('click', function () {
+      window.location.href = '/checkout-complete.html';
+    });
+    document.getElementById('cancel').addEventListener('click', function () {
+      window.location.href = '/inventory.html';
+    });
+  }
+
+  function initComplete() {
+    setCart([]);
+    document.getElementById('back-to-products').addEventListener('click', function () {
+      window.location.href = '/inventory.html';
+    });
+  }
+
+  var PAGES = {
+    login: initLogin, inventory: initInventory, item: initItem, cart: initCart,
+    'step-one': initStepOne, 'step-two': initStepTwo, complete: initComplete
+  };
+
+  document.addEventListener('DOMContentLoaded', function () {
+    renderBadge();
+    initMenu();
+    if (PAGES[APP.page]) { PAGES[APP.page](); }
+  });
+})();
@@ -1,32 +1,154 @@
+"""
+Project logging: one queue, one listener thread, JSON lines per worker.
+
+Every logger from `get_logger()` hands its records to a shared QueueHandler;
+a QueueListener thread formats and writes them, so a page object never waits
+for the console or the disk. Call sites pass %-style arguments
+(logger.debug("Price: %s", price)): below the verbosity nothing is built at
+all, and the message is formatted on the listener thread when it is written.
+
+    console                      message only
+    reports/logs/<worker>.jsonl  one JSON object per record, rotated by size
+
+The listener writes the console on its own schedule, so pytest only captures
+a record with its test when the queue is drained before the phase's capture
+ends: conftest.py calls `drain()` at the end of setup, call and teardown.
+Records logged outside a test phase (collection, session finish) go straight
+to the live console.
+
+--log-verbosity (LOG_VERBOSITY):
+
+    quiet    warnings and errors only (CI)
+    steps    (default) page-level steps and their results
+    chatty   every element read, click, keystroke and wait
+"""
+import atexit
+import json
 import logging
 import os
-from datetime import datetime
+import queue
+from decimal import Decimal
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
 
-# Create log directory if not present
 LOG_DIR = "reports/logs"
-os.makedirs(LOG_DIR, exist_ok=True)
+VERBOSITY = {"quiet": logging.WARNING, "steps": logging.INFO, "chatty": logging.DEBUG}
 
-LOG_FILE = os.path.join(LOG_DIR, f"test_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+_settings = {"level": logging.INFO, "worker": "main"}
+_queue = queue.Queue()
+_loggers = {}
+_listener = None
 
-def get_logger(name=__name__):
-    """Setup and return a logger instance."""
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
+# Arguments that cannot change between the call and the listener formatting them
+_SCALARS = (str, int, float, bool, bytes, Decimal, type(None))
+
+
+def _frozen(value) -> bool:
+    return isinstance(value, _SCALARS) or (isinstance(value, tuple) and all(_frozen(v) for v in value))
+
+
+class _LazyQueueHandler(QueueHandler):
+    """Enqueue records unformatted; the listener thread formats them."""
+
+    def prepare(self, record):
+        # Lists, dicts, exceptions ... may change (or die) before the listener
+        # gets to them: render those now, leave the rest for later.
+        if record.args and not (isinstance(record.args, tuple) and all(_frozen(a) for a in record.args)):
+            record.msg, record.args = record.getMessage(), None
+        record.test = os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0] or None
+        return record
+
+
+class _ProjectLogger(logging.Logger):
+    """A logger outside the logging.getLogger() registry, with no parent."""
+
+    def isEnabledFor(self, level):
+        # Its level is always set; no registry cache to invalidate when it changes
+        return not self.disabled and level >= self.level and level > self.manager.disable
 
-    if not logger.handlers:
-        # File Handler
-        file_handler = logging.FileHandler(LOG_FILE)
-        file_format = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        file_handler.setFormatter(file_format)
 
-        # Console Handler
-        console_handler = logging.StreamHandler()
-        console_format = logging.Formatter("%(message)s")
-        console_handler.setFormatter(console_format)
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "time": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "worker": _settings["worker"],
+            "test": getattr(record, "test", None),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
 
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
 
-        logger.propagate = False  # Prevent duplicate logs
+_HANDLER = _LazyQueueHandler(_queue)
 
-    return logger
\ No newline at end of file
+
+def _console():
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+def _start(*handlers):
+    global _listener
+    stop()
+    _listener = QueueListener(_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def configure(verbosity: str = "steps", log_dir=LOG_DIR, worker: str = "main",
+              max_mb: float = 10, backups: int = 3):
+    """
+    Set the verbosity of every project logger and write `<log_dir>/<worker>.jsonl`
+    (rotated at `max_mb`, keeping `backups` old files) next to the console.
+    """
+    if verbosity not in VERBOSITY:
+        raise ValueError(f"Unsupported log verbosity: {verbosity}. Supported: {', '.join(VERBOSITY)}")
+    _settings.update(level=VERBOSITY[verbosity], worker=worker)
+    for logger in _loggers.values():
+        logger.setLevel(_settings["level"])
+    Path(log_dir).mkdir(parents=True, exist_ok=True)
+    file_handler = RotatingFileHandler(
+        Path(log_dir) / f"{worker}.jsonl",
+        maxBytes=int(max_mb * 1024 * 1024),
+        backupCount=backups,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(JsonFormatter())
+    _start(_console(), file_handler)
+
+
+def drain():
+    """Block until every queued record is written (e.g. before pytest reads a test's output)."""
+    if _listener is not None:
+        _queue.join()
+
+
+def stop():
+    """Write what is queued and stop the listener thread (and close its files)."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(stop)
+
+
+def get_logger(name=__name__):
+    """Return a project logger: non-blocking, at the configured verbosity."""
+    logger = _loggers.get(name)
+    if logger is None:
+        # Not registered with logging.getLogger(): pytest hooks its (synchronous)
+        # log capture and log_cli handlers onto every registered non-propagating
+        # logger, which would format and echo each record a second time.
+        logger = _loggers[name] = _ProjectLogger(name, _settings["level"])
+        logger.addHandler(_HANDLER)
+        logger.propagate = False
+        if _listener is None:
+            _start(_console())
+    return logger
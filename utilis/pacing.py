@@ -0,0 +1,72 @@
+"""
+Pacing: optional pauses that make a run watchable by a human.
+
+    --pace=ci    no pauses at all
+    --pace=demo  0.5s before and after every browser test (the historical behaviour)
+    --pace=step  demo pauses plus a short pause around every page-object
+                 action (click, typing, navigation)
+
+Every pause goes through `pace(event)`, which is a dictionary lookup and an
+early return in `ci` mode. conftest.py only paces tests that use the `driver`
+fixture (directly or through logged_in_driver); unit tests never sleep.
+"""
+import time
+
+from selenium.webdriver.remote.command import Command
+
+from utilis.command_hooks import CommandListener, add_listener
+
+MODES = ("ci", "demo", "step")
+
+_DELAYS = {
+    "ci": {},
+    "demo": {"before_test": 0.5, "after_test": 0.5},
+    "step": {"before_test": 0.5, "after_test": 0.5, "before_action": 0.3, "after_action": 0.3},
+}
+
+# WebDriver commands that correspond to a user-visible action
+ACTION_COMMANDS = {
+    Command.CLICK_ELEMENT,
+    Command.SEND_KEYS_TO_ELEMENT,
+    Command.CLEAR_ELEMENT,
+    Command.GET,
+    Command.GO_BACK,
+    Command.GO_FORWARD,
+    Command.REFRESH,
+}
+
+_mode = "demo"
+
+
+def configure(mode: str):
+    global _mode
+    if mode not in MODES:
+        raise ValueError(f"Unsupported pace: {mode}. Supported: {', '.join(MODES)}")
+    _mode = mode
+
+
+def mode() -> str:
+    return _mode
+
+
+def pace(event: str):
+    """Sleep for the delay configured for `event` in the current mode (if any)."""
+    delay = _DELAYS[_mode].get(event)
+    if delay:
+        time.sleep(delay)
+
+
+class _ActionPacer(CommandListener):
+    def before(self, command, params):
+        if command in ACTION_COMMANDS:
+            pace("before_action")
+
+    def after(self, command, params, elapsed, error):
+        if command in ACTION_COMMANDS:
+            pace("after_action")
+
+
+def install(driver):
+    """Pause around actions of `driver` when running in `step` mode."""
+    if _mode == "step":
+        add_listener(driver, "pacing", _ActionPacer())
@@ -0,0 +1,85 @@
+"""
+Background pre-warming of browser sessions.
+
+In `prewarm` mode every test still gets its own fresh browser, but the launch
+of the next one overlaps with the body of the current test: a daemon thread
+keeps up to `depth` ready-to-use drivers (each with its own `_tmp_profile_dir`)
+in a queue and the `driver` fixture simply takes the next one.
+"""
+import queue
+import threading
+import time
+
+from utilis import run_stats
+from utilis.driver_pool import quit_driver
+from utilis.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DriverPrewarmer:
+    """
+    Keep `depth` browsers launched ahead of time.
+
+    take()     - next warm driver (blocks while one is still launching; builds
+                 inline if the background thread has stopped)
+    shutdown() - stop the thread and quit every warm driver nobody took
+    """
+
+    def __init__(self, factory, depth: int = 1):
+        self.factory = factory
+        self.depth = max(1, int(depth))
+        self._ready = queue.Queue(maxsize=self.depth)
+        # One slot per warm browser: taken before a launch, given back by take()
+        self._slots = threading.Semaphore(self.depth)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="driver-prewarm", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            # Wait for a free slot before launching, so at most `depth` browsers
+            # are warm at once; keep checking whether we should stop
+            if not self._slots.acquire(timeout=0.2):
+                continue
+            try:
+                driver = self.factory()
+            except Exception as e:
+                self._slots.release()
+                logger.error("Pre-warm launch failed, falling back to inline launches: %r", e)
+                return
+            if self._stop.is_set():
+                quit_driver(driver)
+                return
+            self._ready.put_nowait(driver)
+
+    def take(self):
+        start = time.perf_counter()
+        if not self._ready.empty():
+            run_stats.add("prewarm", "warm hits")
+        while True:
+            try:
+                driver = self._ready.get(timeout=0.2)
+                self._slots.release()
+                break
+            except queue.Empty:
+                if not self._thread.is_alive():
+                    run_stats.add("prewarm", "inline launches")
+                    return self.factory()
+        run_stats.add("prewarm", "seconds waited for launch", time.perf_counter() - start)
+        return driver
+
+    def shutdown(self):
+        self._stop.set()
+        self._thread.join(timeout=60)
+        unused = 0
+        while True:
+            try:
+                driver = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            quit_driver(driver)
+            unused += 1
+        if unused:
+            run_stats.add("prewarm", "unused warm browsers", unused)
+        logger.info("Pre-warmer stopped; quit %s unused browser(s)", unused)
@@ -0,0 +1,148 @@
+"""
+Element probes that do not wait.
+
+`driver.find_element` honours the implicit wait (2s in the `driver` fixture),
+so checking for something that is legitimately missing, like the cart badge
+of an empty cart, costs the full implicit wait. A probe asks the page
+directly with one execute_script and answers immediately:
+
+    state = probe(driver, ("css selector", ".shopping_cart_badge"))
+    state["present"], state["displayed"], state["count"], state["text"], state["element"]
+
+Negative waits get their own short budget instead of a positive wait's
+timeout:
+
+    expect_absent(driver, locator, timeout=1.0)   # True once nothing matches
+    expect_hidden(driver, locator, timeout=1.0)   # True once nothing is displayed
+
+Every negative answer is counted in the "probes" section of the run summary
+together with the wait time it saved: the implicit wait (or the positive
+wait that would have been used) minus the time the probe actually took.
+"""
+import pkgutil
+import time
+
+from utilis import run_stats
+from utilis.read_cache import READ_TAG
+
+SECTION = "probes"
+DEFAULT_BUDGET = 1.0
+POLL = 0.05
+
+# locateAll(using, value): every element a locator matches, for the in-page
+# scripts of probe, waits, visual and fast_fill. Locator strategies as used by
+# the page objects (string-based, no By import); any other strategy is CSS.
+LOCATE_JS = """
+function locateAll(using, value) {
+  if (using === 'xpath') {
+    const found = [];
+    const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < result.snapshotLength; i++) { found.push(result.snapshotItem(i)); }
+    return found;
+  }
+  if (using === 'link text') {
+    return Array.from(document.querySelectorAll('a')).filter(a => a.textContent.trim() === value);
+  }
+  let css = value;
+  if (using === 'id') { css = '#' + CSS.escape(value); }
+  else if (using === 'class name') { css = '.' + CSS.escape(value); }
+  else if (using === 'name') { css = '[name="' + value.replace(/"/g, '\\\\"') + '"]'; }
+  return Array.from(document.querySelectorAll(css));
+}
+"""
+
+# "displayed" uses Selenium's own isDisplayed atom, so it agrees with
+# WebElement.is_displayed(); filled in by _probe_js().
+_PROBE_TEMPLATE = READ_TAG + LOCATE_JS + """
+const [using, value] = arguments;
+const found = locateAll(using, value);
+const shown = (%s);
+const first = found[0] || null;
+return {
+  count: found.length,
+  present: found.length > 0,
+  displayed: found.some(el => shown(el)),
+  text: first ? (first.innerText || first.textContent || '').trim() : null,
+  element: first
+};
+"""
+
+_probe_script = None
+
+
+def _probe_js() -> str:
+    global _probe_script
+    if _probe_script is None:
+        atom = pkgutil.get_data("selenium.webdriver.remote", "isDisplayed.js").decode("utf8")
+        _probe_script = _PROBE_TEMPLATE % atom
+    return _probe_script
+
+
+_EMPTY = {"count": 0, "present": False, "displayed": False, "text": None, "element": None}
+
+
+def implicit_wait(driver) -> float:
+    """The driver's implicit wait in seconds (asked once, then remembered)."""
+    value = getattr(driver, "_probe_implicit_wait", None)
+    if value is None:
+        try:
+            value = float(driver.timeouts.implicit_wait)
+        except Exception:
+            value = 0.0
+        driver._probe_implicit_wait = value
+    return value
+
+
+def _run(driver, locator) -> dict:
+    return driver.execute_script(_probe_js(), locator[0], locator[1]) or dict(_EMPTY)
+
+
+def _record_negative(driver, elapsed: float, baseline: float | None):
+    if baseline is None:
+        baseline = implicit_wait(driver)
+    run_stats.add(SECTION, "negative answers")
+    run_stats.add(SECTION, "wait time saved (s)", max(0.0, baseline - elapsed))
+
+
+def probe(driver, locator, baseline: float | None = None) -> dict:
+    """
+    State of `locator` right now, without any implicit wait.
+    `baseline` is what a waiting lookup would have cost when nothing matches
+    (default: the implicit wait); used for the saved-time figure only.
+    """
+    start = time.perf_counter()
+    state = _run(driver, locator)
+    if not state["present"]:
+        _record_negative(driver, time.perf_counter() - start, baseline)
+    return state
+
+
+def _wait_for(driver, locator, done, timeout: float, baseline: float | None) -> bool:
+    start = time.perf_counter()
+    deadline = start + timeout
+    while True:
+        state = _run(driver, locator)
+        if done(state):
+            _record_negative(driver, time.perf_counter() - start, baseline)
+            return True
+        if time.perf_counter() >= deadline:
+            run_stats.add(SECTION, "negative waits timed out")
+            return False
+        time.sleep(POLL)
+
+
+def expect_absent(driver, locator, timeout: float = DEFAULT_BUDGET, baseline: float | None = None) -> bool:
+    """True as soon as nothing matches `locator`; False if something still does after `timeout`."""
+    return _wait_for(driver, locator, lambda state: not state["present"], timeout, baseline)
+
+
+def expect_hidden(driver, locator, timeout: float = DEFAULT_BUDGET, baseline: float | None = None) -> bool:
+    """True as soon as no match of `locator` is displayed (or none exists); False after `timeout`."""
+    return _wait_for(driver, locator, lambda state: not state["displayed"], timeout, baseline)
+
+
+def badge_count(driver, locator) -> int:
+    """Cart badge number, 0 when the badge is absent (no implicit wait)."""
+    state = probe(driver, locator)
+    text = (state["text"] or "").strip()
+    return int(text) if state["present"] and text.isdigit() else 0
@@ -0,0 +1,137 @@
+"""
+Template browser profiles.
+
+A brand-new `--user-data-dir` makes Chrome/Edge run their first-run setup on
+every launch. With a template, one profile per browser is seeded once per run
+(launch, load about:blank, quit) and every session then starts from a cheap
+copy of it. Copies are copy-on-write reflinks where the filesystem supports
+them and plain copies otherwise. Hardlinks are deliberately not used: the
+browser rewrites files such as `Preferences` and its SQLite stores in place,
+so hardlinked clones would write into the template and into each other.
+
+The root directory defaults to /dev/shm (tmpfs) when it is writable, so the
+clones never touch the disk.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+from utilis import run_stats
+from utilis.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Lock files of a running browser and caches that are not worth cloning
+_PRUNE = (
+    "SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile",
+    "Cache", "Code Cache", "GPUCache", "ShaderCache", "GrShaderCache",
+    "GraphiteDawnCache", "DawnCache", "Crashpad",
+)
+
+_reflink_supported = None
+
+
+def default_root() -> str:
+    """PROFILE_ROOT if set, else /dev/shm when writable, else the system temp dir."""
+    env_root = os.getenv("PROFILE_ROOT")
+    if env_root:
+        return env_root
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+def needs_disable_dev_shm(min_bytes: int = 512 * 1024 * 1024) -> bool:
+    """
+    True unless /dev/shm is known to be large enough for the browser.
+    Containers often mount a 64 MB /dev/shm, where --disable-dev-shm-usage
+    is still required to avoid renderer crashes.
+    """
+    if not sys.platform.startswith("linux"):
+        return True
+    try:
+        stat = os.statvfs("/dev/shm")
+    except OSError:
+        return True
+    return stat.f_frsize * stat.f_blocks < min_bytes
+
+
+def copy_tree(src: str, dst: str) -> str:
+    """Copy `src` into the existing directory `dst`; return the method used."""
+    global _reflink_supported
+    if _reflink_supported is not False and sys.platform.startswith("linux") and shutil.which("cp"):
+        result = subprocess.run(
+            ["cp", "-a", "--reflink=always", os.path.join(src, "."), dst],
+            capture_output=True,
+        )
+        if result.returncode == 0:
+            _reflink_supported = True
+            return "reflink"
+        # e.g. tmpfs / ext4: no reflinks, remember and use a regular copy
+        _reflink_supported = False
+        shutil.rmtree(dst, ignore_errors=True)
+        os.makedirs(dst, exist_ok=True)
+    shutil.copytree(src, dst, symlinks=True, dirs_exist_ok=True)
+    return "copy"
+
+
+def _prune(profile_dir: str):
+    for dirpath, dirnames, filenames in os.walk(profile_dir):
+        for name in list(dirnames):
+            if name in _PRUNE:
+                shutil.rmtree(os.path.join(dirpath, name), ignore_errors=True)
+                dirnames.remove(name)
+        for name in filenames:
+            if name in _PRUNE:
+                try:
+                    os.remove(os.path.join(dirpath, name))
+                except OSError:
+                    pass
+
+
+class ProfileTemplate:
+    """
+    One seeded profile for `browser`, cloned per session by `clone()`.
+
+    `seed(path)` must launch the browser on `path` and quit it; it runs lazily
+    on the first clone (thread-safe, so the pre-warm thread may trigger it).
+    """
+
+    def __init__(self, browser: str, seed, root: str | None = None):
+        self.browser = browser
+        self.seed = seed
+        self.root = root or default_root()
+        self.path = None
+        self._lock = threading.Lock()
+
+    def clone(self) -> str:
+        with self._lock:
+            if self.path is None:
+                self._create()
+        target = tempfile.mkdtemp(prefix=f"{self.browser}_{uuid.uuid4().hex}_", dir=self.root)
+        start = time.perf_counter()
+        method = copy_tree(self.path, target)
+        run_stats.add("profile template", f"clones ({method})")
+        run_stats.add("profile template", "clone seconds", time.perf_counter() - start)
+        return target
+
+    def remove(self):
+        if self.path:
+            shutil.rmtree(self.path, ignore_errors=True)
+            self.path = None
+
+    def _create(self):
+        os.makedirs(self.root, exist_ok=True)
+        path = tempfile.mkdtemp(prefix=f"{self.browser}_template_", dir=self.root)
+        start = time.perf_counter()
+        self.seed(path)
+        _prune(path)
+        elapsed = time.perf_counter() - start
+        run_stats.add("profile template", "seed seconds", elapsed)
+        logger.info("Seeded %s profile template at %s in %.2fs", self.browser, path, elapsed)
+        self.path = path
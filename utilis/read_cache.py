@@ -0,0 +1,147 @@
+"""
+Memoized page-object reads.
+
+A page getter decorated with `@cached_read` computes its value once and
+returns it again as long as the page has provably not changed. The cache
+key is a token made of:
+
+  * a command version, bumped by a command listener whenever the driver
+    sends anything that may change the page: a click, typing, navigation,
+    window switches, or an untagged execute_script;
+  * a DOM signal: a MutationObserver installed in the page counts
+    mutations, and every document gets its own id, so re-renders after an
+    asynchronous update or a navigation invalidate the cache too.
+
+Reading the DOM signal is one small script call. A hit costs that call
+instead of a full card or row scan, e.g. inside the polls of a
+WebDriverWait that waits for a list to change.
+
+Read-only scripts that should not bump the version start with READ_TAG:
+
+    driver.execute_script(READ_TAG + "return document.title;")
+
+Hits and misses are counted in the "read cache" section of the run summary.
+--read-cache=off (or READ_CACHE=off) turns caching off.
+"""
+import functools
+
+from selenium.webdriver.remote.command import Command
+
+from utilis import run_stats
+from utilis.command_hooks import CommandListener, add_listener, get_listener
+
+SECTION = "read cache"
+READ_TAG = "/*pom:read*/"
+
+# Commands that never change the page
+READ_COMMANDS = {
+    Command.FIND_ELEMENT, Command.FIND_ELEMENTS,
+    Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS,
+    Command.FIND_ELEMENT_FROM_SHADOW_ROOT, Command.FIND_ELEMENTS_FROM_SHADOW_ROOT,
+    Command.GET_SHADOW_ROOT, Command.W3C_GET_ACTIVE_ELEMENT,
+    Command.GET_ELEMENT_TEXT, Command.GET_ELEMENT_ATTRIBUTE, Command.GET_ELEMENT_PROPERTY,
+    Command.GET_ELEMENT_TAG_NAME, Command.GET_ELEMENT_RECT, Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY,
+    Command.GET_ELEMENT_ARIA_ROLE, Command.GET_ELEMENT_ARIA_LABEL,
+    Command.IS_ELEMENT_SELECTED, Command.IS_ELEMENT_ENABLED,
+    Command.GET_CURRENT_URL, Command.GET_TITLE, Command.GET_PAGE_SOURCE,
+    Command.SCREENSHOT, Command.ELEMENT_SCREENSHOT,
+    Command.W3C_GET_WINDOW_HANDLES, Command.W3C_GET_CURRENT_WINDOW_HANDLE, Command.GET_WINDOW_RECT,
+    Command.GET_ALL_COOKIES, Command.GET_COOKIE, Command.GET_TIMEOUTS, Command.SET_TIMEOUTS,
+    Command.GET_LOG, Command.GET_AVAILABLE_LOG_TYPES, Command.W3C_GET_ALERT_TEXT,
+}
+SCRIPT_COMMANDS = {Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC}
+# Scripts Selenium itself runs for is_displayed() / get_attribute() / get_property()
+READ_SCRIPT_PREFIXES = (READ_TAG, "/* isDisplayed */", "/* getAttribute */", "return arguments[0][arguments[1]]")
+
+_DOM_SIGNAL_JS = READ_TAG + """
+let state = window.__pomReadCache;
+if (!state) {
+  state = {doc: Math.random().toString(36).slice(2), mutations: 0};
+  new MutationObserver(function (records) { state.mutations += records.length; })
+    .observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+  window.__pomReadCache = state;
+}
+return state.doc + ':' + state.mutations;
+"""
+
+_enabled = True
+
+
+def configure(enabled: bool):
+    global _enabled
+    _enabled = enabled
+
+
+def is_read_only(command: str, params) -> bool:
+    if command in READ_COMMANDS:
+        return True
+    if command in SCRIPT_COMMANDS:
+        script = (params or {}).get("script", "").lstrip()
+        return script.startswith(READ_SCRIPT_PREFIXES)
+    return False
+
+
+class ReadCache(CommandListener):
+    """Per-driver cache; installed as the "read_cache" command listener."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.version = 0
+        self._values = {}
+
+    def after(self, command, params, elapsed, error):
+        if not is_read_only(command, params):
+            self.version += 1
+
+    def token(self) -> tuple:
+        try:
+            signal = self.driver.execute_script(_DOM_SIGNAL_JS)
+        except Exception:
+            # No page to observe (e.g. a closed window): never trust the cache
+            signal = object()
+        return self.version, signal
+
+    def get(self, key, compute):
+        token = self.token()
+        cached = self._values.get(key)
+        if cached is not None and cached[0] == token:
+            run_stats.add(SECTION, "hits")
+            return cached[1]
+        run_stats.add(SECTION, "misses")
+        value = compute()
+        self._values[key] = (token, value)
+        return value
+
+    def invalidate(self):
+        self._values.clear()
+        self.version += 1
+
+
+def read_cache(driver) -> ReadCache:
+    """The cache of `driver`, installed on first use."""
+    cache = get_listener(driver, "read_cache")
+    if cache is None:
+        cache = ReadCache(driver)
+        add_listener(driver, "read_cache", cache)
+    return cache
+
+
+def _fresh(value):
+    """Copy lists/dicts so callers can't modify the cached value in place."""
+    if isinstance(value, list):
+        return [dict(v) if isinstance(v, dict) else v for v in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def cached_read(method):
+    """Memoize a page-object getter (the page must have `self.driver`)."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not _enabled:
+            return method(self, *args, **kwargs)
+        key = (type(self).__name__, method.__name__, args, tuple(sorted(kwargs.items())))
+        value = read_cache(self.driver).get(key, lambda: method(self, *args, **kwargs))
+        return _fresh(value)
+    return wrapper
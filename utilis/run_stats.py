@@ -0,0 +1,51 @@
+"""
+Run-wide counters shown in the terminal summary.
+
+Helpers (driver pool, pre-warmer, probes, ...) call `add()` while tests run.
+Under pytest-xdist every worker ships its counters to the controller through
+`workeroutput` (see conftest.py) where they are summed with `merge()`, so the
+summary always describes the whole run.
+
+`note()` records a line of text instead of a number. Notes are de-duplicated
+on merge, so every worker may report the same line (e.g. a collection-time
+decision all workers take identically) and the summary shows it once.
+"""
+from collections import defaultdict
+
+_sections = defaultdict(dict)
+_notes = defaultdict(dict)
+
+
+def add(section: str, key: str, amount=1):
+    """Increase counter `key` of `section` by `amount` (int or float)."""
+    bucket = _sections[section]
+    bucket[key] = bucket.get(key, 0) + amount
+
+
+def note(section: str, line: str):
+    """Add a line of text to `section` (kept once, in first-seen order)."""
+    _notes[section][line] = None
+
+
+def counters() -> dict:
+    return {section: dict(values) for section, values in _sections.items()}
+
+
+def notes() -> dict:
+    return {section: list(lines) for section, lines in _notes.items()}
+
+
+def snapshot() -> dict:
+    """Return a plain-dict copy that can be sent over the xdist channel."""
+    return {"counters": counters(), "notes": notes()}
+
+
+def merge(data: dict):
+    """Sum counters and collect notes received from another process."""
+    data = data or {}
+    for section, values in data.get("counters", {}).items():
+        for key, amount in values.items():
+            add(section, key, amount)
+    for section, lines in data.get("notes", {}).items():
+        for line in lines:
+            note(section, line)
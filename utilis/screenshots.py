@@ -0,0 +1,138 @@
+"""
+Screenshot pipeline: capture in memory, keep by policy, write in the background.
+
+`BasePage.take_screenshot()` (test teardowns), `BasePage.find_element()` and
+`utilis.browser.wait_for_element()` (wait errors) call `capture()`. What
+happens next depends on --screenshots (SCREENSHOTS):
+
+    on-failure  (default) keep screenshots of failed tests only
+    always      keep every screenshot
+    never       take none
+
+`capture()` grabs PNG bytes with get_screenshot_as_png() and parks them with
+the running test. The report hook in conftest.py calls `publish()` once the
+outcome of a phase is known. For a failed test (or with `always`) the
+screenshots are attached to the pytest-html report (and to Allure when it
+is active). They are then handed to a small thread pool that puts them in
+the artifact store (utilis/artifact_store.py: content-addressed, optionally
+re-encoded), so the test never waits for encoding or the disk. For a passing
+test the bytes are dropped. Once a test is known to have passed, teardown
+screenshots are not even taken.
+
+`drain()` waits for pending writes; conftest.py calls it at the end of the run.
+"""
+import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from utilis import artifact_store, run_stats
+from utilis.logger import get_logger
+
+try:
+    import allure
+except Exception:
+    allure = None
+
+logger = get_logger(__name__)
+
+SECTION = "screenshots"
+POLICIES = ("on-failure", "always", "never")
+WRITERS = 2
+
+_policy = "on-failure"
+_executor = None
+_lock = threading.Lock()
+# State of the running test: node id, outcome so far (None = not known yet) and parked captures
+_test = {"nodeid": None, "failed": None, "pending": []}
+
+
+def configure(policy: str):
+    global _policy
+    if policy not in POLICIES:
+        raise ValueError(f"Unsupported screenshots policy: {policy}. Supported: {', '.join(POLICIES)}")
+    _policy = policy
+
+
+def begin_test(nodeid: str | None = None):
+    """Forget the previous test's state (called before setup)."""
+    _test["nodeid"] = nodeid
+    _test["failed"] = None
+    _test["pending"] = []
+
+
+def capture(driver, name: str) -> bool:
+    """Grab a screenshot of `driver` for the running test; True if one was taken."""
+    if _policy == "never" or (_policy == "on-failure" and _test["failed"] is False):
+        run_stats.add(SECTION, "skipped")
+        return False
+    try:
+        png = driver.get_screenshot_as_png()
+    except Exception as e:
+        logger.error("Failed to capture screenshot: %s", e)
+        return False
+    _test["pending"].append((name, png))
+    run_stats.add(SECTION, "captured")
+    return True
+
+
+def _writer() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=WRITERS, thread_name_prefix="screenshot-writer")
+        return _executor
+
+
+def _store(png: bytes, test: str | None, name: str):
+    try:
+        path = artifact_store.put(png, test=test, name=name)
+        logger.info(" Screenshot saved: %s", path)
+    except Exception as e:
+        logger.error("Failed to save screenshot: %s", e)
+
+
+def publish(report, failed: bool, final: bool) -> int:
+    """
+    Decide about the parked screenshots after a test phase.
+    `failed`: this phase failed; `final`: the test outcome is settled (end
+    of call, or any failure). Returns the number of screenshots kept.
+    """
+    if failed:
+        _test["failed"] = True
+    elif final and _test["failed"] is None:
+        _test["failed"] = False
+    pending, _test["pending"] = _test["pending"], []
+    if not pending:
+        return 0
+    if _policy != "always" and not _test["failed"]:
+        run_stats.add(SECTION, "dropped (test passed)", len(pending))
+        return 0
+    for name, png in pending:
+        _attach(report, name, png)
+        _writer().submit(_store, png, _test["nodeid"], name)
+        run_stats.add(SECTION, "kept")
+    return len(pending)
+
+
+def _attach(report, name: str, png: bytes):
+    try:
+        import pytest_html
+        extras = getattr(report, "extras", [])
+        report.extras = extras + [pytest_html.extras.png(base64.b64encode(png).decode("ascii"), name)]
+    except Exception:
+        pass
+    if allure:
+        try:
+            # Allure attaches to the test that is current, so this stays on the test thread
+            allure.attach(png, name=name, attachment_type=allure.attachment_type.PNG)
+        except Exception:
+            logger.debug("Could not attach screenshot to Allure.")
+
+
+def drain():
+    """Wait until every queued screenshot is on disk."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
@@ -0,0 +1,183 @@
+"""
+Timeline of a run in Chrome Trace Event format (chrome://tracing, ui.perfetto.dev).
+
+With --timeline (TIMELINE=1; pytest already owns --trace) spans are recorded for:
+
+    test       the whole test (setup, call, teardown) and its call phase
+    fixture    every fixture setup (driver launch, login, ...)
+    page       every page-object method (classes decorated with @traced)
+    wait       every EventWait.until, named like the wait telemetry
+    command    every WebDriver command (a listener on the driver)
+
+Spans nest by time on their thread; each carries the test id and the xdist
+worker in its args, and every worker is a process of its own in the viewer.
+
+    reports/traces/<run>/tests/<test id>.json    one test
+    reports/traces/<run>/<worker>.json           one worker
+    reports/traces/<run>/trace.json              the whole run (all workers)
+
+Off (the default), the decorated page methods cost one flag check.
+"""
+import functools
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from utilis import run_stats
+from utilis.command_hooks import CommandListener, add_listener
+
+SECTION = "tracing"
+
+_settings = {"enabled": False, "dir": Path("reports/traces"), "run": "adhoc", "worker": "main"}
+_EPOCH = time.time() - time.perf_counter()
+_run_events = []
+_test = {"nodeid": None, "events": []}
+
+
+def configure(enabled: bool, trace_dir=None, run: str | None = None, worker: str = "main"):
+    _settings.update(enabled=enabled, worker=worker, run=run or "adhoc")
+    if trace_dir is not None:
+        _settings["dir"] = Path(trace_dir)
+
+
+def enabled() -> bool:
+    return _settings["enabled"]
+
+
+def _now() -> float:
+    """Microseconds since the epoch; comparable across the workers of a run."""
+    return (time.perf_counter() + _EPOCH) * 1_000_000
+
+
+def _emit(name: str, cat: str, start: float, end: float, args: dict):
+    args["test"] = _test["nodeid"]
+    args["worker"] = _settings["worker"]
+    _test["events"].append({
+        "name": name, "cat": cat, "ph": "X",
+        "ts": round(start, 1), "dur": round(end - start, 1),
+        "pid": os.getpid(), "tid": threading.get_ident(),
+        "args": args,
+    })
+
+
+@contextmanager
+def span(name: str, cat: str, **args):
+    """Record the enclosed block as one span (nothing when tracing is off)."""
+    if not _settings["enabled"]:
+        yield
+        return
+    start = _now()
+    try:
+        yield
+    except BaseException as e:
+        args["error"] = type(e).__name__
+        raise
+    finally:
+        _emit(name, cat, start, _now(), args)
+
+
+def traced(cls):
+    """Class decorator: a "page" span around every method the class defines."""
+    for attr, method in list(vars(cls).items()):
+        if attr.startswith("__") or not callable(method) or isinstance(method, (staticmethod, classmethod, type)):
+            continue
+        setattr(cls, attr, _trace_method(method, f"{cls.__name__}.{attr}"))
+    return cls
+
+
+def _trace_method(method, name: str):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if not _settings["enabled"]:
+            return method(*args, **kwargs)
+        with span(name, "page"):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+class _CommandSpans(CommandListener):
+    def after(self, command, params, elapsed, error):
+        if _settings["enabled"]:
+            end = _now()
+            args = {"error": type(error).__name__} if error is not None else {}
+            _emit(command, "command", end - elapsed * 1_000_000, end, args)
+
+
+_COMMAND_SPANS = _CommandSpans()
+
+
+def install(driver):
+    """Record the WebDriver commands of `driver` (no-op when already installed)."""
+    add_listener(driver, "tracing", _COMMAND_SPANS)
+
+
+# ---------- files ----------
+def _safe(text: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", text).strip("_")
+
+
+def _run_dir() -> Path:
+    return _settings["dir"] / _settings["run"]
+
+
+def _metadata(events: list) -> list:
+    pid = os.getpid()
+    threads = {event["tid"] for event in events}
+    main = threading.main_thread().ident
+    return [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": _settings["worker"]}}] + [
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+         "args": {"name": "main" if tid == main else f"thread {tid}"}}
+        for tid in sorted(threads)
+    ]
+
+
+def _write(path: Path, events: list):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms",
+                   "otherData": {"run": _settings["run"]}}, fh)
+    os.replace(tmp, path)
+
+
+def begin_test(nodeid: str):
+    _test["nodeid"] = nodeid
+
+
+def end_test():
+    """Write the spans of the finished test and keep them for the run file."""
+    events, _test["events"] = _test["events"], []
+    if _settings["enabled"] and events:
+        _write(_run_dir() / "tests" / f"{_safe(_test['nodeid'])}.json", _metadata(events) + events)
+        _run_events.extend(events)
+    _test["nodeid"] = None
+
+
+def write_worker():
+    """Write every span of this process (spans outside tests included)."""
+    _run_events.extend(_test["events"])
+    _test["events"] = []
+    if _settings["enabled"] and _run_events:
+        _write(_run_dir() / f"{_safe(_settings['worker'])}.json", _metadata(_run_events) + _run_events)
+
+
+def write_run() -> Path | None:
+    """Merge the worker files of this run into trace.json (controller / plain run)."""
+    if not _settings["enabled"]:
+        return None
+    events = []
+    for path in sorted(_run_dir().glob("*.json")):
+        if path.name == "trace.json":
+            continue
+        with open(path, encoding="utf-8") as fh:
+            events.extend(json.load(fh)["traceEvents"])
+    if not events:
+        return None
+    target = _run_dir() / "trace.json"
+    _write(target, events)
+    run_stats.note(SECTION, f"Chrome trace: {target}")
+    return target
@@ -0,0 +1,396 @@
+"""
+Visual baselines: compare screenshots of a page with a stored reference.
+
+The page objects expose `check_visual()` (inventory grid, product details,
+cart, checkout complete), which calls `check()` with the regions to ignore
+(e.g. the cart badge). What happens depends on --visual (VISUAL):
+
+    off     (default) nothing is captured
+    check   compare right away; the result dict is returned to the caller
+            (the tests assert result["ok"])
+    batch   park the capture; the whole run is compared at the end, in a
+            multiprocessing pool (one pool for all xdist workers); any
+            mismatch fails the session
+    update  (re)write the baselines
+
+    visual_baselines/<browser>/<name>.png    reference screenshot
+    visual_baselines/<browser>/<name>.npy    its fingerprint (see below)
+    reports/visual/                          actual + diff images of mismatches only
+
+A comparison is done in two passes, both vectorized with NumPy:
+
+  1. fingerprint: each channel of the screenshot averaged over 8x8 blocks. If
+     no block (outside the ignored regions) moved by half a level in any
+     channel, the images match; the baseline PNG is not even decoded.
+  2. pixel diff: a pixel has changed when any channel differs by more than
+     PIXEL_TOLERANCE. More than MAX_CHANGED_RATIO changed pixels outside the
+     ignored regions is a mismatch; a diff image (faded baseline, changed
+     pixels red, ignored regions blue) is written next to the actual capture.
+
+A missing baseline is written from the first capture ("new"). PNGs are
+decoded with Pillow when it is installed, else with zlib + NumPy.
+"""
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import struct
+import zlib
+from pathlib import Path
+
+from utilis import run_stats
+from utilis.probe import LOCATE_JS
+from utilis.logger import get_logger
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+try:
+    from PIL import Image
+except Exception:
+    Image = None
+
+logger = get_logger(__name__)
+
+SECTION = "visual"
+MODES = ("off", "check", "batch", "update")
+BLOCK = 8
+FAST_TOLERANCE = 0.5
+PIXEL_TOLERANCE = 16
+MAX_CHANGED_RATIO = 0.0001
+MASK_PADDING = 2
+
+_settings = {"mode": "off", "baselines": Path("visual_baselines"), "out": Path("reports/visual"), "processes": 0}
+_jobs = []
+_parked_seq = itertools.count()
+
+# Viewport rectangles (device pixels) of every element matched by the locators;
+# strategies resolved by utilis.probe.LOCATE_JS. arguments: [[using, value], ...]
+_RECTS_JS = LOCATE_JS + """
+const [locators] = arguments;
+const ratio = window.devicePixelRatio || 1;
+const rects = [];
+for (const [using, value] of locators) {
+  for (const node of locateAll(using, value)) {
+    const box = node.getBoundingClientRect();
+    if (box.width && box.height) {
+      rects.push([box.left * ratio, box.top * ratio, box.width * ratio, box.height * ratio]);
+    }
+  }
+}
+return rects;
+"""
+
+
+def configure(mode: str, baselines=None, out=None, processes: int = 0):
+    if mode not in MODES:
+        raise ValueError(f"Unsupported visual mode: {mode}. Supported: {', '.join(MODES)}")
+    if mode != "off" and np is None:
+        logger.warning("NumPy is not installed; visual checks are off.")
+        mode = "off"
+    _settings.update(mode=mode, processes=processes)
+    if baselines is not None:
+        _settings["baselines"] = Path(baselines)
+    if out is not None:
+        _settings["out"] = Path(out)
+
+
+def mode() -> str:
+    return _settings["mode"]
+
+
+# ---------- PNG ----------
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _chunk(kind: bytes, body: bytes) -> bytes:
+    return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body) & 0xFFFFFFFF)
+
+
+def encode_png(pixels) -> bytes:
+    """RGB uint8 array (H, W, 3) -> PNG bytes."""
+    height, width = pixels.shape[:2]
+    rows = np.hstack([np.zeros((height, 1), np.uint8), pixels.reshape(height, width * 3)])
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (_PNG_SIGNATURE + _chunk(b"IHDR", header)
+            + _chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)) + _chunk(b"IEND", b""))
+
+
+def _unfilter_wavefront(raw, kinds, bpp: int):
+    """
+    Undo all five filters at once. A byte depends on its left, upper and
+    upper-left neighbours (pixels, not bytes: the channels are independent),
+    so every anti-diagonal y + x == k only needs the diagonals before it: the
+    image is sheared so that each one is a column, and unfiltered a column at a time.
+    """
+    height, width = raw.shape[:2]
+    ys = np.arange(height)[:, None]
+    cols = ys + np.arange(width)[None, :]
+    sheared = np.zeros((height, height + width, bpp), np.int16)
+    sheared[ys, cols] = raw
+    # One row and two columns of zeros: the neighbours outside the image
+    out = np.zeros((height + 1, height + width + 2, bpp), np.int16)
+    kinds = kinds[:, None]
+    sub, up, average, paeth = (kinds == 1), (kinds == 2), (kinds == 3), (kinds == 4)
+    for k in range(height + width - 1):
+        lo, hi = max(0, k - width + 1), min(height, k + 1)
+        a, b, c = out[lo + 1:hi + 1, k + 1], out[lo:hi, k + 1], out[lo:hi, k]
+        p = a + b - c
+        pa, pb, pc = np.abs(p - a), np.abs(p - b), np.abs(p - c)
+        predicted = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+        predicted = np.where(paeth[lo:hi], predicted, np.where(average[lo:hi], (a + b) >> 1,
+                             np.where(up[lo:hi], b, np.where(sub[lo:hi], a, 0))))
+        out[lo + 1:hi + 1, k + 2] = (sheared[lo:hi, k] + predicted) & 0xFF
+    return out[1 + ys, 2 + cols].astype(np.uint8)
+
+
+def decode_png(data: bytes):
+    """PNG bytes -> RGB uint8 array (H, W, 3). 8-bit RGB/RGBA, not interlaced, without Pillow."""
+    if Image is not None:
+        with Image.open(io.BytesIO(data)) as image:
+            return np.asarray(image.convert("RGB"))
+    if data[:8] != _PNG_SIGNATURE:
+        raise ValueError("not a PNG")
+    pos, idat, header = 8, [], None
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if kind == b"IHDR":
+            header = struct.unpack(">IIBBBBB", body)
+        elif kind == b"IDAT":
+            idat.append(body)
+        elif kind == b"IEND":
+            break
+    width, height, depth, color, _, _, interlace = header
+    if depth != 8 or color not in (2, 6) or interlace:
+        raise ValueError(f"unsupported PNG (depth {depth}, color type {color}, interlace {interlace}); install Pillow")
+    bpp = 3 if color == 2 else 4
+    stride = width * bpp
+    raw = np.frombuffer(zlib.decompress(b"".join(idat)), np.uint8).reshape(height, stride + 1)
+    kinds = raw[:, 0]
+    if (kinds > 2).any():
+        # Average / Paeth depend on the left byte *after* unfiltering
+        return _unfilter_wavefront(raw[:, 1:].reshape(height, width, bpp), kinds, bpp)[:, :, :3]
+    pixels = np.empty((height, stride), np.uint8)
+    up = np.zeros(stride, np.uint8)
+    for y in range(height):
+        kind, line = kinds[y], raw[y, 1:]
+        if kind == 0:
+            pixels[y] = line
+        elif kind == 1:
+            # Sub: running sum along the row per channel; uint8 wraps like the filter does
+            pixels[y] = np.cumsum(line.reshape(width, bpp), axis=0, dtype=np.uint8).reshape(stride)
+        else:
+            pixels[y] = line + up
+        up = pixels[y]
+    return pixels.reshape(height, width, bpp)[:, :, :3]
+
+
+# ---------- comparison ----------
+def _blocks(array):
+    """Pad `array` (H, W, ...) to whole blocks and view it as (H/B, B, W/B, B, ...)."""
+    height, width = array.shape[:2]
+    padding = ((0, -height % BLOCK), (0, -width % BLOCK)) + ((0, 0),) * (array.ndim - 2)
+    padded = np.pad(array, padding)
+    return padded.reshape(padded.shape[0] // BLOCK, BLOCK, padded.shape[1] // BLOCK, BLOCK, *array.shape[2:])
+
+
+def fingerprint(pixels):
+    """R, G and B each averaged over BLOCK x BLOCK blocks (float32, about H/8 x W/8 x 3)."""
+    # Per channel, not luma: red -> grey of the same brightness must still move a block
+    return _blocks(pixels.astype(np.float32)).mean(axis=(1, 3))
+
+
+def mask_for(shape, rects):
+    """Boolean (H, W) mask of the ignored rectangles (x, y, w, h), padded by MASK_PADDING."""
+    mask = np.zeros(shape[:2], bool)
+    for x, y, w, h in rects or ():
+        x0, y0 = max(int(x) - MASK_PADDING, 0), max(int(y) - MASK_PADDING, 0)
+        x1, y1 = int(x + w + 0.999) + MASK_PADDING, int(y + h + 0.999) + MASK_PADDING
+        mask[y0:y1, x0:x1] = True
+    return mask
+
+
+def _baseline_fingerprint(baseline: Path):
+    """Fingerprint of the baseline, from its .npy sidecar when it is up to date."""
+    sidecar = baseline.with_suffix(".npy")
+    if sidecar.exists() and sidecar.stat().st_mtime >= baseline.stat().st_mtime:
+        return np.load(sidecar)
+    return None
+
+
+def write_baseline(baseline: Path, png: bytes, pixels=None):
+    baseline.parent.mkdir(parents=True, exist_ok=True)
+    baseline.write_bytes(png)
+    np.save(baseline.with_suffix(".npy"), fingerprint(decode_png(png) if pixels is None else pixels))
+
+
+def _diff_image(base, changed, mask):
+    image = (base // 3 + 170).astype(np.uint8)
+    image[mask] = (120, 160, 255)
+    image[changed] = (255, 0, 0)
+    return image
+
+
+def compare(png: bytes, baseline: Path, rects=(), out: Path | None = None, key: str = "capture") -> dict:
+    """Compare a capture with `baseline`; images are written to `out` on mismatch only."""
+    result = {"key": key, "baseline": str(baseline), "status": "match", "pass": "fingerprint",
+              "changed": 0, "ratio": 0.0, "diff": None, "actual": None}
+    pixels = decode_png(png)
+    if not baseline.exists():
+        write_baseline(baseline, png, pixels)
+        result.update(status="new", ok=True)
+        return result
+    mask = mask_for(pixels.shape, rects)
+    actual_print = fingerprint(pixels)
+    base_print = _baseline_fingerprint(baseline)
+    if base_print is not None and base_print.shape == actual_print.shape:
+        moved = np.abs(actual_print - base_print).max(axis=2)
+        moved[_blocks(mask).any(axis=(1, 3))] = 0
+        if moved.max(initial=0) < FAST_TOLERANCE:
+            result["ok"] = True
+            return result
+
+    result["pass"] = "pixels"
+    base = decode_png(baseline.read_bytes())
+    if base.shape != pixels.shape:
+        result.update(status="mismatch", reason=f"size {pixels.shape[1]}x{pixels.shape[0]}, "
+                                                f"baseline {base.shape[1]}x{base.shape[0]}")
+        changed = None
+    else:
+        delta = np.abs(pixels.astype(np.int16) - base.astype(np.int16)).max(axis=2)
+        changed = (delta > PIXEL_TOLERANCE) & ~mask
+        compared = max(int(mask.size - mask.sum()), 1)
+        result["changed"] = int(changed.sum())
+        result["ratio"] = result["changed"] / compared
+        if result["ratio"] > MAX_CHANGED_RATIO:
+            result["status"] = "mismatch"
+    result["ok"] = result["status"] == "match"
+    if not result["ok"] and out is not None:
+        out.mkdir(parents=True, exist_ok=True)
+        actual_path = out / f"{key}.actual.png"
+        actual_path.write_bytes(png)
+        result["actual"] = str(actual_path)
+        if changed is not None:
+            diff_path = out / f"{key}.diff.png"
+            diff_path.write_bytes(encode_png(_diff_image(base, changed, mask)))
+            result["diff"] = str(diff_path)
+    return result
+
+
+def _compare_job(job: dict) -> dict:
+    """Pool entry point: one parked capture (see `check()` in batch mode)."""
+    parked = Path(job["parked"])
+    try:
+        result = compare(parked.read_bytes(), Path(job["baseline"]), job["rects"], Path(job["out"]), job["key"])
+    except Exception as e:
+        result = {"key": job["key"], "baseline": job["baseline"], "status": "error", "reason": repr(e), "ok": False}
+    parked.unlink(missing_ok=True)
+    result["test"] = job["test"]
+    return result
+
+
+# ---------- capture ----------
+def _current_test() -> str:
+    return os.environ.get("PYTEST_CURRENT_TEST", "adhoc").rsplit(" ", 1)[0]
+
+
+def _safe(text: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", text).strip("_")
+
+
+def _record(result: dict):
+    run_stats.add(SECTION, result["status"])
+    if result["status"] in ("mismatch", "error"):
+        detail = result.get("reason") or f"{result['ratio']:.3%} changed, diff: {result['diff']}"
+        run_stats.note(SECTION, f"{result['key']}: {result['status']} ({detail})")
+
+
+def check(driver, name: str, ignore=(), rects=()) -> dict | None:
+    """
+    Screenshot the viewport and compare it with the `name` baseline.
+    `ignore`: locators whose elements are masked out; `rects`: extra (x, y, w, h)
+    regions. Returns the comparison; None when off and in batch mode, where
+    run_batch() decides at the end of the run (and the session fails on a mismatch).
+    """
+    if _settings["mode"] == "off":
+        return None
+    rects = list(rects)
+    if ignore:
+        rects += driver.execute_script(_RECTS_JS, [list(locator) for locator in ignore]) or []
+    png = driver.get_screenshot_as_png()
+    browser = str(driver.capabilities.get("browserName", "browser")).lower()
+    baseline = _settings["baselines"] / browser / f"{name}.png"
+    test = _current_test()
+    key = f"{_safe(test)}--{name}"
+    out = _settings["out"] / browser
+
+    if _settings["mode"] == "update":
+        write_baseline(baseline, png)
+        run_stats.add(SECTION, "updated")
+        return {"key": key, "baseline": str(baseline), "status": "updated", "ok": True}
+    if _settings["mode"] == "batch":
+        parked = out / "parked" / f"{key}.{os.getpid()}.{next(_parked_seq)}.png"
+        parked.parent.mkdir(parents=True, exist_ok=True)
+        parked.write_bytes(png)
+        _jobs.append({"key": key, "test": test, "baseline": str(baseline), "rects": rects,
+                      "out": str(out), "parked": str(parked)})
+        return None
+
+    result = compare(png, baseline, rects, out, key)
+    result["test"] = test
+    _record(result)
+    if not result["ok"]:
+        logger.warning("Visual mismatch for %s: %s", name, result.get('reason') or result['diff'])
+    return result
+
+
+# ---------- batch ----------
+def pending() -> list:
+    return list(_jobs)
+
+
+def merge(jobs: list):
+    _jobs.extend(jobs or [])
+
+
+def compare_batch(jobs: list, processes: int = 0) -> list:
+    """Compare parked captures, in a pool of `processes` (0: one per CPU) when there are several."""
+    processes = min(processes or os.cpu_count() or 1, len(jobs))
+    if processes <= 1:
+        return [_compare_job(job) for job in jobs]
+    # spawn: the caller has live threads (screenshot writers, driver connections) a fork would copy
+    with multiprocessing.get_context("spawn").Pool(processes) as pool:
+        return pool.map(_compare_job, jobs, chunksize=1)
+
+
+def run_batch(report_path=None) -> list:
+    """Compare everything parked in this run (controller / plain run); writes `report_path` as JSON."""
+    jobs, _jobs[:] = list(_jobs), []
+    if not jobs:
+        return []
+    # Two captures of one new baseline would race to write it
+    seen, new, known = set(), [], []
+    for job in jobs:
+        fresh = job["baseline"] not in seen and not Path(job["baseline"]).exists()
+        (new if fresh else known).append(job)
+        seen.add(job["baseline"])
+    results = compare_batch(new, 1) + compare_batch(known, _settings["processes"])
+    for result in results:
+        _record(result)
+    for folder in {Path(job["parked"]).parent for job in jobs}:
+        try:
+            folder.rmdir()
+        except OSError:
+            pass
+    if report_path is not None:
+        report_path = Path(report_path)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as fh:
+            json.dump(sorted(results, key=lambda r: r["key"]), fh, indent=1)
+    return results
@@ -0,0 +1,184 @@
+"""
+Wait telemetry and adaptive timeouts.
+
+Every EventWait records how long it took, keyed by the wait (its condition,
+e.g. "visible(('id', 'inventory_container'))", or the qualified name of a
+lambda), the browser and the persona (the @pytest.mark.user of the test).
+Samples live in a small store directory (default .wait_telemetry/):
+
+    history.json               merged samples of previous runs
+    shard-<worker>-<pid>.json  samples of one process in the current run
+
+Each process (xdist worker or plain run) writes its own shard when the
+session ends, so workers never write the same file. The controller (or
+the plain run) then merges the shards into history.json.
+
+With --adaptive-timeouts a wait with at least MIN_SAMPLES samples uses
+
+    clamp(p95 of its samples x SAFETY, FLOOR, the coded timeout)
+
+instead of the timeout coded in the page object, so a broken locator
+fails after a few seconds instead of 15. The "slow waits" summary section
+lists the waits that are slow or come close to their coded limit.
+"""
+import json
+import math
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+
+from utilis import run_stats
+
+SECTION = "slow waits"
+PERCENTILE = 95
+SAFETY = 3.0
+MIN_SAMPLES = 5
+FLOOR = 2.0
+KEEP = 200
+# Report thresholds: p95 above SLOW seconds, or a sample above NEAR_LIMIT of the limit
+SLOW = 1.0
+NEAR_LIMIT = 0.5
+REPORT_TOP = 10
+
+_store = None
+_adaptive = False
+_context = {"browser": "-", "persona": "-"}
+_history = {}
+_current = defaultdict(lambda: {"samples": [], "limit": 0.0, "timeouts": 0})
+
+
+def configure(directory, adaptive: bool):
+    """Load history.json plus shards left over by an interrupted run."""
+    global _store, _adaptive, _history
+    _store = Path(directory)
+    _adaptive = adaptive
+    _history = _merge([_read(path) for path in _files()])
+
+
+def set_context(browser: str | None = None, persona: str | None = None):
+    if browser is not None:
+        _context["browser"] = browser
+    if persona is not None:
+        _context["persona"] = persona
+
+
+def name_of(condition) -> str:
+    """Stable name of a wait condition (EventCondition repr or callable qualname)."""
+    if hasattr(condition, "kind") and hasattr(condition, "locator"):
+        return repr(condition)
+    return getattr(condition, "__qualname__", type(condition).__name__)
+
+
+def key_of(name: str) -> str:
+    return f"{name} | {_context['browser']} | {_context['persona']}"
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = max(0, math.ceil(pct / 100.0 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def timeout_for(name: str, default: float) -> float:
+    """The timeout to use for wait `name` (its coded `default` unless adaptive)."""
+    if not _adaptive:
+        return default
+    key = key_of(name)
+    samples = _history.get(key, {}).get("samples", []) + (_current[key]["samples"] if key in _current else [])
+    if len(samples) < MIN_SAMPLES:
+        return default
+    adaptive = max(FLOOR, percentile(samples, PERCENTILE) * SAFETY)
+    return min(default, adaptive)
+
+
+def record(name: str, seconds: float, limit: float, timed_out: bool = False):
+    entry = _current[key_of(name)]
+    entry["limit"] = max(entry["limit"], float(limit))
+    if timed_out:
+        # A timeout says nothing about how long the wait really needs
+        entry["timeouts"] += 1
+    else:
+        entry["samples"].append(round(seconds, 4))
+
+
+def _files():
+    if _store is None or not _store.is_dir():
+        return []
+    return [_store / "history.json"] + sorted(_store.glob("shard-*.json"))
+
+
+def _read(path: Path) -> dict:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write(path: Path, data: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _merge(parts) -> dict:
+    merged = {}
+    for part in parts:
+        for key, entry in part.items():
+            target = merged.setdefault(key, {"samples": [], "limit": 0.0, "timeouts": 0})
+            target["samples"] = (target["samples"] + list(entry.get("samples", [])))[-KEEP:]
+            target["limit"] = max(target["limit"], float(entry.get("limit", 0.0)))
+            target["timeouts"] += int(entry.get("timeouts", 0))
+    return merged
+
+
+def flush(worker: str = "main"):
+    """Write this process's samples to its own shard."""
+    if _store is None or not _current:
+        return
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", worker)
+    _write(_store / f"shard-{safe}-{os.getpid()}.json", dict(_current))
+
+
+def compact() -> dict:
+    """Merge history.json and all shards into history.json; returns the merged store."""
+    if _store is None or not _store.is_dir():
+        return {}
+    shards = sorted(_store.glob("shard-*.json"))
+    merged = _merge([_read(_store / "history.json")] + [_read(path) for path in shards])
+    _write(_store / "history.json", merged)
+    for path in shards:
+        path.unlink(missing_ok=True)
+    return merged
+
+
+def report(store: dict, top: int = REPORT_TOP):
+    """Add the slowest / closest-to-limit waits to the run summary."""
+    rows = []
+    for key, entry in store.items():
+        samples, limit = entry.get("samples", []), entry.get("limit") or 0.0
+        if not samples:
+            if entry.get("timeouts"):
+                rows.append((float("inf"), f"{key}: timed out {entry['timeouts']}x, no successful sample"))
+            continue
+        p95, worst = percentile(samples, PERCENTILE), max(samples)
+        near = limit and worst >= NEAR_LIMIT * limit
+        if p95 < SLOW and not near and not entry.get("timeouts"):
+            continue
+        flags = []
+        if p95 >= SLOW:
+            flags.append("slow")
+        if near:
+            flags.append(f"max at {worst / limit:.0%} of limit")
+        if entry.get("timeouts"):
+            flags.append(f"timed out {entry['timeouts']}x")
+        rows.append((p95, f"{key}: p95={p95:.2f}s max={worst:.2f}s limit={limit:g}s "
+                          f"n={len(samples)} ({', '.join(flags)})"))
+    for _, line in sorted(rows, key=lambda row: -row[0])[:top]:
+        run_stats.note(SECTION, line)
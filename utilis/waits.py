@@ -0,0 +1,263 @@
+"""
+Event-driven waits.
+
+`WebDriverWait` re-checks its condition over HTTP every 0.5s, so each wait
+costs one round trip per poll and finishes up to half a second after the
+condition became true. `EventWait` instead sends the condition into the
+page once with execute_async_script. The page re-checks it on every DOM
+mutation (MutationObserver), URL change (popstate, hashchange,
+history.pushState/replaceState) and CSS transition/animation end, plus
+a cheap in-page timer for layout-only changes. The script returns as soon
+as the condition holds.
+
+Drop-in for the page objects:
+
+    wait = EventWait(driver, 10)
+    wait.until(waits.visibility_of_element_located(("id", "inventory_container")))
+    wait.until(waits.url_contains("inventory.html"))
+    wait.until(lambda d: ...)          # any other callable: normal polling
+
+Event conditions mirror selenium's expected_conditions (same arguments,
+same return values): presence_of_element_located,
+presence_of_all_elements_located, visibility_of_element_located,
+element_to_be_clickable, url_contains, url_matches, plus
+text_to_change(locator, before), which returns the new text.
+
+Each event condition also carries the matching expected_conditions
+callable. EventWait falls back to polling with it when the page cannot run
+the script, or when waits are switched to polling with --waits=poll
+(WAITS=poll). A navigation during a wait aborts the page script; the wait
+then re-checks once and continues in the new document.
+"""
+import pkgutil
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utilis import run_stats, tracing, wait_stats
+from utilis.probe import LOCATE_JS
+from utilis.read_cache import READ_TAG
+
+SECTION = "waits"
+MODES = ("event", "poll")
+# Longest single execute_async_script; well below the default 30s script timeout
+SLICE = 5.0
+# Give up on the event path after this many page-script failures in a row
+MAX_SCRIPT_ERRORS = 3
+
+_WAIT_TEMPLATE = READ_TAG + LOCATE_JS + """
+const done = arguments[arguments.length - 1];
+const [kind, using, value, expected, budget] = arguments;
+const isDisplayed = (%s);
+
+function textOf(el) { return (el.innerText || el.textContent || '').trim(); }
+
+function evaluate() {
+  const found = using === null ? [] : locateAll(using, value);
+  const first = found[0];
+  switch (kind) {
+    case 'presence': return first;
+    case 'presence_all': return found.length ? found : undefined;
+    case 'visible': return first && isDisplayed(first) ? first : undefined;
+    case 'clickable': return first && isDisplayed(first) && !first.disabled ? first : undefined;
+    case 'url_contains': return window.location.href.indexOf(value) >= 0 ? true : undefined;
+    case 'url_matches': return new RegExp(value).test(window.location.href) ? true : undefined;
+    case 'text_change': return first && textOf(first) !== expected ? textOf(first) : undefined;
+  }
+  throw new Error('Unknown wait condition: ' + kind);
+}
+
+let finished = false;
+const observer = new MutationObserver(check);
+const events = ['popstate', 'hashchange', 'pom:locationchange', 'transitionend', 'animationend'];
+const timers = [];
+
+function finish(result) {
+  if (finished) { return; }
+  finished = true;
+  observer.disconnect();
+  events.forEach(name => window.removeEventListener(name, check, true));
+  timers.forEach(id => clearTimeout(id));
+  done(result);
+}
+
+function check() {
+  if (finished) { return; }
+  let value;
+  try { value = evaluate(); } catch (e) { finish({error: String(e)}); return; }
+  if (value !== undefined && value !== null) { finish({met: true, value: value}); }
+}
+
+if (!window.__pomHistoryHook) {
+  window.__pomHistoryHook = true;
+  ['pushState', 'replaceState'].forEach(function (name) {
+    const original = history[name];
+    history[name] = function () {
+      const result = original.apply(this, arguments);
+      window.dispatchEvent(new Event('pom:locationchange'));
+      return result;
+    };
+  });
+}
+
+check();
+if (!finished) {
+  observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+  events.forEach(name => window.addEventListener(name, check, true));
+  // Layout-only changes (size, position) produce no mutation record
+  (function tick() { if (!finished) { check(); timers.push(setTimeout(tick, 100)); } })();
+  timers.push(setTimeout(function () { finish({met: false}); }, budget));
+}
+"""
+
+_wait_script = None
+_mode = "event"
+
+
+def configure(mode: str):
+    global _mode
+    if mode not in MODES:
+        raise ValueError(f"Unsupported waits: {mode}. Supported: {', '.join(MODES)}")
+    _mode = mode
+
+
+def _wait_js() -> str:
+    global _wait_script
+    if _wait_script is None:
+        atom = pkgutil.get_data("selenium.webdriver.remote", "isDisplayed.js").decode("utf8")
+        _wait_script = _WAIT_TEMPLATE % atom
+    return _wait_script
+
+
+class EventCondition:
+    """A condition the page can watch for itself, with a polling equivalent."""
+
+    def __init__(self, kind: str, locator=None, value=None, expected=None, fallback=None):
+        self.kind = kind
+        self.locator = locator
+        self.value = value
+        self.expected = expected
+        self.fallback = fallback
+
+    def script_args(self, budget_ms: int) -> tuple:
+        using, value = self.locator if self.locator else (None, self.value)
+        return self.kind, using, value, self.expected, budget_ms
+
+    def __call__(self, driver):
+        return self.fallback(driver)
+
+    def __repr__(self):
+        return f"{self.kind}({self.locator or self.value!r})"
+
+
+def presence_of_element_located(locator) -> EventCondition:
+    return EventCondition("presence", locator, fallback=EC.presence_of_element_located(locator))
+
+
+def presence_of_all_elements_located(locator) -> EventCondition:
+    return EventCondition("presence_all", locator, fallback=EC.presence_of_all_elements_located(locator))
+
+
+def visibility_of_element_located(locator) -> EventCondition:
+    return EventCondition("visible", locator, fallback=EC.visibility_of_element_located(locator))
+
+
+def element_to_be_clickable(locator) -> EventCondition:
+    return EventCondition("clickable", locator, fallback=EC.element_to_be_clickable(locator))
+
+
+def url_contains(fragment: str) -> EventCondition:
+    return EventCondition("url_contains", value=fragment, fallback=EC.url_contains(fragment))
+
+
+def url_matches(pattern: str) -> EventCondition:
+    return EventCondition("url_matches", value=pattern, fallback=EC.url_matches(pattern))
+
+
+def text_to_change(locator, before: str) -> EventCondition:
+    """Met when the (stripped) text of the first match differs from `before`; returns the new text."""
+    def changed(driver):
+        try:
+            text = driver.find_element(*locator).text.strip()
+        except WebDriverException:
+            return False
+        return text if text != before else False
+    return EventCondition("text_change", locator, expected=before, fallback=changed)
+
+
+class EventWait:
+    """WebDriverWait-compatible wait that runs EventConditions inside the page."""
+
+    def __init__(self, driver, timeout: float, poll_frequency: float = 0.5, ignored_exceptions=None):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.ignored_exceptions = ignored_exceptions
+
+    def _poll(self, condition, timeout: float, message: str):
+        run_stats.add(SECTION, "polling waits")
+        return WebDriverWait(
+            self.driver, max(0.0, timeout), self.poll_frequency, self.ignored_exceptions
+        ).until(condition, message)
+
+    def until(self, condition, message: str = ""):
+        """
+        Wait for `condition`; the timeout may be shortened by the wait
+        telemetry (utilis/wait_stats.py) when adaptive timeouts are on.
+        """
+        name = wait_stats.name_of(condition)
+        timeout = wait_stats.timeout_for(name, self.timeout)
+        if timeout < self.timeout and not message:
+            message = (f"Timed out after {timeout:.1f}s (adaptive; coded {self.timeout}s) "
+                       f"waiting for {name}. Rerun without --adaptive-timeouts if this wait got slower.")
+        start = time.monotonic()
+        try:
+            with tracing.span(name, "wait", timeout=timeout):
+                value = self._until(condition, timeout, message)
+        except TimeoutException:
+            wait_stats.record(name, time.monotonic() - start, self.timeout, timed_out=True)
+            raise
+        wait_stats.record(name, time.monotonic() - start, self.timeout)
+        return value
+
+    def _until(self, condition, timeout: float, message: str):
+        if not isinstance(condition, EventCondition) or _mode != "event":
+            return self._poll(condition, timeout, message)
+
+        start = time.monotonic()
+        deadline = start + timeout
+        errors = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            budget_ms = int(max(0.05, min(remaining, SLICE)) * 1000)
+            try:
+                result = self.driver.execute_async_script(_wait_js(), *condition.script_args(budget_ms))
+                errors = 0
+            except TimeoutException:
+                # Script timeout shorter than our slice: just go round again
+                result = None
+            except WebDriverException:
+                # Usually a navigation unloaded the page mid-wait: re-check once
+                # the normal way, then watch the new document
+                errors += 1
+                if errors >= MAX_SCRIPT_ERRORS:
+                    run_stats.add(SECTION, "event waits fell back to polling")
+                    return self._poll(condition.fallback, deadline - time.monotonic(), message)
+                try:
+                    value = condition.fallback(self.driver)
+                except WebDriverException:
+                    value = None
+                result = {"met": True, "value": value} if value else None
+
+            if result and result.get("error"):
+                run_stats.add(SECTION, "event waits fell back to polling")
+                return self._poll(condition.fallback, deadline - time.monotonic(), message)
+            if result and result.get("met"):
+                run_stats.add(SECTION, "event waits")
+                run_stats.add(SECTION, "event wait time (s)", time.monotonic() - start)
+                return result["value"]
+            if time.monotonic() >= deadline:
+                run_stats.add(SECTION, "event waits timed out")
+                raise TimeoutException(message or f"Timed out after {timeout}s waiting for {condition!r}")
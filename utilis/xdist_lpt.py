@@ -0,0 +1,161 @@
+"""
+Duration-aware scheduling for pytest-xdist.
+
+Every run records how long each test took (setup + call + teardown) into a
+small JSON history file. With `--lpt` the xdist controller uses that history
+to hand out work longest-processing-time first: the most expensive work
+units go out first, so the short ones fill the gaps at the end instead of a
+long checkout test starting last and stretching the run.
+
+Tests of one class stay in one work unit (one worker) so the class keeps its
+setup; module-level test functions are scheduled one by one. Tests without
+history are assumed to cost the median of the known ones.
+
+The terminal summary shows the makespan the history predicted next to the
+one the run actually had.
+"""
+import heapq
+import json
+import os
+import statistics
+
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+
+from utilis import run_stats
+
+SECTION = "lpt schedule"
+# Weight of the newest run in the stored duration (exponential moving average)
+SMOOTHING = 0.5
+# Cost assumed for every test when there is no history at all
+DEFAULT_COST = 5.0
+
+
+def load_history(path) -> dict:
+    """{nodeid: seconds} from the history file; {} if missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    durations = data.get("durations", {}) if isinstance(data, dict) else {}
+    return {nodeid: float(seconds) for nodeid, seconds in durations.items()}
+
+
+def save_history(path, durations: dict):
+    """Write atomically so an interrupted run never leaves a torn file."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump({"version": 1, "durations": dict(sorted(durations.items()))}, fh, indent=1)
+    os.replace(tmp, path)
+
+
+def predict_makespan(costs, workers: int) -> float:
+    """Finish time of the busiest worker when `costs` are dealt out LPT-style."""
+    loads = [0.0] * max(1, workers)
+    for cost in sorted(costs, reverse=True):
+        heapq.heapreplace(loads, loads[0] + cost)
+    return max(loads)
+
+
+def split_scope(nodeid: str) -> str:
+    """
+    Work unit of a test: its class, or the test itself for module-level tests.
+
+        tests/test_cart.py::TestCart::test_remove  -> tests/test_cart.py::TestCart
+        tests/test_util.py::test_parse[a]          -> tests/test_util.py::test_parse[a]
+    """
+    parts = nodeid.split("::")
+    if len(parts) > 2:
+        return "::".join(parts[:-1])
+    return nodeid
+
+
+class LptScheduling(LoadScopeScheduling):
+    """LoadScopeScheduling that always hands out the most expensive unit next."""
+
+    def __init__(self, config, log=None, history=None):
+        super().__init__(config, log)
+        self.history = history or {}
+        known = sorted(self.history.values())
+        self.fallback = statistics.median(known) if known else DEFAULT_COST
+        self.predicted = None
+
+    def _split_scope(self, nodeid: str) -> str:
+        return split_scope(nodeid)
+
+    def cost(self, nodeids) -> float:
+        return sum(self.history.get(nodeid, self.fallback) for nodeid in nodeids)
+
+    def _assign_work_unit(self, node):
+        if self.predicted is None:
+            # First call comes from schedule() right after the workqueue is
+            # built: reorder it once, most expensive unit first
+            units = sorted(self.workqueue.items(), key=lambda unit: -self.cost(unit[1]))
+            self.workqueue.clear()
+            self.workqueue.update(units)
+            workers = min(len(self.nodes), len(units))
+            self.predicted = predict_makespan([self.cost(ids) for _, ids in units], workers)
+            unknown = sum(1 for _, ids in units for nodeid in ids if nodeid not in self.history)
+            run_stats.add(SECTION, "work units", len(units))
+            run_stats.add(SECTION, "tests without history", unknown)
+            run_stats.add(SECTION, "predicted makespan (s)", self.predicted)
+        super()._assign_work_unit(node)
+
+
+class DurationRecorder:
+    """
+    pytest plugin: records durations on the controller (or the only process)
+    and provides the LPT scheduler when `enabled`.
+    """
+
+    def __init__(self, path, enabled: bool):
+        self.path = path
+        self.enabled = enabled
+        self.history = load_history(path)
+        self.current = {}
+        self.skipped = set()
+        self.first_start = None
+        self.last_stop = None
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        if self.enabled:
+            return LptScheduling(config, log, history=self.history)
+        return None
+
+    def pytest_runtest_logreport(self, report):
+        if report.skipped and report.when != "teardown":
+            # A skipped test's timing says nothing about what it costs to run
+            self.skipped.add(report.nodeid)
+            self.current.pop(report.nodeid, None)
+        if report.nodeid in self.skipped:
+            return
+        self.current[report.nodeid] = self.current.get(report.nodeid, 0.0) + report.duration
+        start, stop = getattr(report, "start", None), getattr(report, "stop", None)
+        if start is not None and stop is not None:
+            self.first_start = start if self.first_start is None else min(self.first_start, start)
+            self.last_stop = stop if self.last_stop is None else max(self.last_stop, stop)
+
+    def pytest_sessionfinish(self, session):
+        if not self.current:
+            return
+        merged = dict(self.history)
+        for nodeid, seconds in self.current.items():
+            previous = merged.get(nodeid)
+            merged[nodeid] = seconds if previous is None else (
+                SMOOTHING * seconds + (1 - SMOOTHING) * previous)
+        save_history(self.path, merged)
+        if self.enabled and self.first_start is not None:
+            run_stats.add(SECTION, "actual makespan (s)", self.last_stop - self.first_start)
+
+
+def register(config, path, enabled: bool):
+    """Install the recorder on the xdist controller or a plain run; not on workers."""
+    if hasattr(config, "workerinput"):
+        return None
+    recorder = DurationRecorder(path, enabled)
+    config.pluginmanager.register(recorder, "duration_recorder")
+    return recorder
+